@@ -108,6 +108,11 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--log-no-color", action="store_true", help="Disable color logs"
     )
+    parser.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help="Write the setup timeline to CONFIG/home-assistant.startup_trace.json",
+    )
     parser.add_argument(
         "--runner",
         action="store_true",
@@ -307,6 +312,7 @@ def main() -> int:
         safe_mode=args.safe_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        startup_trace=args.startup_trace,
     )
 
     exit_code = runner.run(runtime_conf)
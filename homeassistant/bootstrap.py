@@ -25,6 +25,8 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
+    async_get_setup_critical_path,
+    async_save_setup_trace,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
@@ -43,6 +45,7 @@ ERROR_LOG_FILENAME = "home-assistant.log"
 DATA_LOGGING = "logging"
 
 LOG_SLOW_STARTUP_INTERVAL = 60
+LOG_SLOW_IMPORTS = 5
 
 STAGE_1_TIMEOUT = 120
 STAGE_2_TIMEOUT = 300
@@ -163,6 +166,12 @@ async def async_setup_hass(
             {"safe_mode": {}, "http": http_conf}, hass,
         )
 
+    if runtime_config.startup_trace:
+        try:
+            await async_save_setup_trace(hass)
+        except HomeAssistantError:
+            _LOGGER.warning("Unable to write the startup trace")
+
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
@@ -382,19 +391,40 @@ def _get_domains(hass: core.HomeAssistant, config: Dict[str, Any]) -> Set[str]:
 
 
 async def _async_log_pending_setups(
-    domains: Set[str], setup_started: Dict[str, datetime]
+    hass: core.HomeAssistant, domains: Set[str], setup_started: Dict[str, datetime]
 ) -> None:
     """Periodic log of setups that are pending for longer than LOG_SLOW_STARTUP_INTERVAL."""
     while True:
         await asyncio.sleep(LOG_SLOW_STARTUP_INTERVAL)
         remaining = [domain for domain in domains if domain in setup_started]
 
-        if remaining:
+        if not remaining:
+            continue
+
+        _LOGGER.warning(
+            "Waiting on integrations to complete setup: %s", ", ".join(remaining),
+        )
+
+        slow_imports = [
+            f"{module} ({duration:.1f}s)"
+            for module, duration in loader.get_import_times(hass).items()
+            if _module_domain(module) in remaining
+        ][:LOG_SLOW_IMPORTS]
+
+        if slow_imports:
             _LOGGER.warning(
-                "Waiting on integrations to complete setup: %s", ", ".join(remaining),
+                "Slowest imports of pending integrations: %s", ", ".join(slow_imports)
             )
 
 
+def _module_domain(module: str) -> str:
+    """Return the domain an integration module belongs to."""
+    for package in (loader.PACKAGE_BUILTIN, loader.PACKAGE_CUSTOM_COMPONENTS):
+        if module.startswith(f"{package}."):
+            return module[len(package) + 1 :].split(".")[0]
+    return module
+
+
 async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: Set[str],
@@ -406,7 +436,9 @@ async def async_setup_multi_components(
         domain: hass.async_create_task(async_setup_component(hass, domain, config))
         for domain in domains
     }
-    log_task = asyncio.create_task(_async_log_pending_setups(domains, setup_started))
+    log_task = asyncio.create_task(
+        _async_log_pending_setups(hass, domains, setup_started)
+    )
     await asyncio.wait(futures.values())
     log_task.cancel()
     errors = [domain for domain in domains if futures[domain].exception()]
@@ -546,3 +578,13 @@ async def _async_set_up_integrations(
             await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
+
+    critical_path = async_get_setup_critical_path(hass)
+    if critical_path:
+        _LOGGER.info(
+            "Startup critical path: %s",
+            " -> ".join(
+                f"{step['integration']} (done after {step['end']:.2f}s)"
+                for step in critical_path
+            ),
+        )
@@ -1,5 +1,6 @@
 """Config helpers for Alexa."""
 from abc import ABC, abstractmethod
+from collections import Counter
 
 from homeassistant.core import callback
 
@@ -14,6 +15,8 @@ class AbstractConfig(ABC):
     def __init__(self, hass):
         """Initialize abstract config."""
         self.hass = hass
+        # Counters of the ChangeReport queue since proactive mode was enabled
+        self.report_state_stats = Counter()
 
     @property
     def supports_auth(self):
@@ -7,6 +7,8 @@ import aiohttp
 import async_timeout
 
 from homeassistant.const import MATCH_ALL, STATE_ON
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
 import homeassistant.util.dt as dt_util
 
 from .const import API_CHANGE, Cause
@@ -16,6 +18,17 @@ from .messages import AlexaResponse
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
 
+# Minimum seconds between two ChangeReports for the same endpoint
+MIN_REPORT_INTERVAL = 1
+# Maximum number of ChangeReports that are sent at the same time
+MAX_CONCURRENT_REPORTS = 5
+
+STAT_SENT = "reports_sent"
+STAT_COALESCED = "changes_coalesced"
+STAT_SUPPRESSED = "changes_suppressed"
+STAT_DELAYED = "reports_delayed"
+STAT_QUEUE_SIZE = "queue_size"
+
 
 async def async_enable_proactive_mode(hass, smart_home_config):
     """Enable the proactive mode.
@@ -25,11 +38,15 @@ async def async_enable_proactive_mode(hass, smart_home_config):
     # Validate we can get access token.
     await smart_home_config.async_get_access_token()
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
+    queue = ChangeReportQueue(hass, smart_home_config)
+
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
         if not hass.is_running:
             return
 
         if not new_state:
+            queue.async_remove(changed_entity)
             return
 
         if new_state.domain not in ENTITY_ADAPTERS:
@@ -45,29 +62,220 @@ async def async_enable_proactive_mode(hass, smart_home_config):
 
         for interface in alexa_changed_entity.interfaces():
             if interface.properties_proactively_reported():
-                await async_send_changereport_message(
-                    hass, smart_home_config, alexa_changed_entity
-                )
+                queue.async_add(alexa_changed_entity)
                 return
             if (
                 interface.name() == "Alexa.DoorbellEventSource"
                 and new_state.state == STATE_ON
             ):
-                await async_send_doorbell_event_message(
-                    hass, smart_home_config, alexa_changed_entity
+                hass.async_create_task(
+                    async_send_doorbell_event_message(
+                        hass, smart_home_config, alexa_changed_entity
+                    )
                 )
                 return
 
-    return hass.helpers.event.async_track_state_change(
+    unsub_listener = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
 
+    @callback
+    def unsub():
+        """Stop listening for state changes and drop pending reports."""
+        unsub_listener()
+        queue.async_stop()
+
+    return unsub
+
+
+def _property_values(properties):
+    """Return the values of serialized properties keyed by property."""
+    return {
+        (prop["namespace"], prop["name"], prop.get("instance")): prop["value"]
+        for prop in properties
+    }
+
+
+class ChangeReportQueue:
+    """Queue ChangeReports so state changes don't wait on Alexa.
+
+    Reports for an entity that changes again before its report went out are
+    merged, reports that don't change any property are dropped and every
+    endpoint is reported at most once per MIN_REPORT_INTERVAL.
+    """
+
+    def __init__(self, hass, config):
+        """Initialize the queue."""
+        self.hass = hass
+        self.config = config
+        self.stats = config.report_state_stats
+        self.stats.clear()
+        self._pending = {}
+        self._last_values = {}
+        self._last_report = {}
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REPORTS)
+        self._flush_task = None
+        self._unsub_flush = None
+
+    @callback
+    def async_add(self, alexa_entity):
+        """Queue a ChangeReport for an entity."""
+        entity_id = alexa_entity.entity_id
+        properties = list(alexa_entity.serialize_properties())
+
+        if _property_values(properties) == self._last_values.get(entity_id):
+            # Back to what was reported last, an earlier queued change is moot
+            self._pending.pop(entity_id, None)
+            self.stats[STAT_SUPPRESSED] += 1
+            self.stats[STAT_QUEUE_SIZE] = len(self._pending)
+            return
+
+        if entity_id in self._pending:
+            self.stats[STAT_COALESCED] += 1
+
+        self._pending[entity_id] = (alexa_entity, properties)
+        self.stats[STAT_QUEUE_SIZE] = len(self._pending)
+        self._async_schedule_flush()
+
+    @callback
+    def async_remove(self, entity_id):
+        """Forget an entity that has been removed."""
+        self._pending.pop(entity_id, None)
+        self._last_values.pop(entity_id, None)
+        self._last_report.pop(entity_id, None)
+        self.stats[STAT_QUEUE_SIZE] = len(self._pending)
+
+    @callback
+    def async_stop(self):
+        """Stop sending reports."""
+        self._pending.clear()
+        self.stats[STAT_QUEUE_SIZE] = 0
+
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+    def _wait_time(self, entity_id, now):
+        """Return seconds until the entity can be reported again."""
+        last_report = self._last_report.get(entity_id)
+        if last_report is None:
+            return 0
+        return last_report + MIN_REPORT_INTERVAL - now
+
+    @callback
+    def _async_schedule_flush(self, now=None):
+        """Send the queued reports now or when the first one is allowed."""
+        if self._flush_task is not None or not self._pending:
+            # A running flush schedules the next one when it is done
+            return
+
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        now = (now or dt_util.utcnow()).timestamp()
+        delay = min(self._wait_time(entity_id, now) for entity_id in self._pending)
+
+        if delay > 0:
+            self._unsub_flush = async_call_later(
+                self.hass, delay, self._async_flush_later
+            )
+            return
+
+        self._flush_task = self.hass.async_create_task(self._async_flush(now))
+
+    @callback
+    def _async_flush_later(self, now):
+        """Flush the queue after waiting for the rate limit."""
+        self._unsub_flush = None
+        self._async_schedule_flush(now)
+
+    async def _async_flush(self, now):
+        """Send all reports that are not rate limited at the given timestamp."""
+        batch = []
+
+        for entity_id in list(self._pending):
+            if self._wait_time(entity_id, now) > 0:
+                self.stats[STAT_DELAYED] += 1
+                continue
+
+            batch.append(self._pending.pop(entity_id))
+
+        self.stats[STAT_QUEUE_SIZE] = len(self._pending)
+
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._async_send(alexa_entity, properties, now)
+                    for alexa_entity, properties in batch
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            self._flush_task = None
+            self._async_schedule_flush()
+
+        for (alexa_entity, _), result in zip(batch, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Error sending ChangeReport for %s",
+                    alexa_entity.entity_id,
+                    exc_info=result,
+                )
+
+    async def _async_send(self, alexa_entity, properties, now):
+        """Send a ChangeReport with the properties that changed.
+
+        The values are only remembered as reported once Alexa accepted them.
+        """
+        entity_id = alexa_entity.entity_id
+        previous = self._last_values.get(entity_id)
+
+        if previous is None:
+            changed, unchanged = properties, []
+        else:
+            changed, unchanged = [], []
+            for prop in properties:
+                key = (prop["namespace"], prop["name"], prop.get("instance"))
+                if key in previous and previous[key] == prop["value"]:
+                    unchanged.append(prop)
+                else:
+                    changed.append(prop)
+
+        async with self._semaphore:
+            self.stats[STAT_SENT] += 1
+            accepted = await async_send_changereport_message(
+                self.hass,
+                self.config,
+                alexa_entity,
+                alexa_properties=changed,
+                context_properties=unchanged,
+            )
+
+        if accepted:
+            self._last_values[entity_id] = _property_values(properties)
+            self._last_report[entity_id] = now
+
 
 async def async_send_changereport_message(
-    hass, config, alexa_entity, *, invalidate_access_token=True
+    hass,
+    config,
+    alexa_entity,
+    alexa_properties=None,
+    context_properties=None,
+    *,
+    invalidate_access_token=True,
 ):
     """Send a ChangeReport message for an Alexa entity.
 
+    Without alexa_properties all properties of the entity are reported as
+    changed. Properties that did not change can be passed as
+    context_properties. Return if Alexa accepted the report.
+
     https://developer.amazon.com/docs/smarthome/state-reporting-for-a-smart-home-skill.html#report-state-with-changereport-events
     """
     token = await config.async_get_access_token()
@@ -76,18 +284,22 @@ async def async_send_changereport_message(
 
     endpoint = alexa_entity.alexa_id()
 
-    # this sends all the properties of the Alexa Entity, whether they have
-    # changed or not. this should be improved, and properties that have not
-    # changed should be moved to the 'context' object
-    properties = list(alexa_entity.serialize_properties())
+    if alexa_properties is None:
+        alexa_properties = list(alexa_entity.serialize_properties())
 
     payload = {
-        API_CHANGE: {"cause": {"type": Cause.APP_INTERACTION}, "properties": properties}
+        API_CHANGE: {
+            "cause": {"type": Cause.APP_INTERACTION},
+            "properties": alexa_properties,
+        }
     }
 
     message = AlexaResponse(name="ChangeReport", namespace="Alexa", payload=payload)
     message.set_endpoint_full(token, endpoint)
 
+    for prop in context_properties or ():
+        message.add_context_property(prop)
+
     message_serialized = message.serialize()
     session = hass.helpers.aiohttp_client.async_get_clientsession()
 
@@ -102,7 +314,7 @@ async def async_send_changereport_message(
 
     except (asyncio.TimeoutError, aiohttp.ClientError):
         _LOGGER.error("Timeout sending report to Alexa")
-        return
+        return False
 
     response_text = await response.text()
 
@@ -110,7 +322,7 @@ async def async_send_changereport_message(
     _LOGGER.debug("Received (%s): %s", response.status, response_text)
 
     if response.status == 202:
-        return
+        return True
 
     response_json = json.loads(response_text)
 
@@ -120,7 +332,12 @@ async def async_send_changereport_message(
     ):
         config.async_invalidate_access_token()
         return await async_send_changereport_message(
-            hass, config, alexa_entity, invalidate_access_token=False
+            hass,
+            config,
+            alexa_entity,
+            alexa_properties,
+            context_properties,
+            invalidate_access_token=False,
         )
 
     _LOGGER.error(
@@ -128,6 +345,7 @@ async def async_send_changereport_message(
         response_json["payload"]["code"],
         response_json["payload"]["description"],
     )
+    return False
 
 
 async def async_send_add_or_update_message(hass, config, entity_ids):
@@ -50,8 +50,13 @@ ATTR_UUID = "uuid"
 ATTR_VERSION = "version"
 
 DOMAIN = "api"
+DATA_STREAM_HUB = "api_stream_hub"
 STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
+# Number of events buffered per stream before the overflow policy applies
+STREAM_QUEUE_SIZE = 1024
+STREAM_OVERFLOW_DROP = "drop"
+STREAM_OVERFLOW_CLOSE = "close"
 
 
 def setup(hass, config):
@@ -87,6 +92,125 @@ class APIStatusView(HomeAssistantView):
         return self.json_message("API running.")
 
 
+def _stream_message(payload):
+    """Return a server-sent event message."""
+    return f"data: {payload}\n\n".encode("UTF-8")
+
+
+class StreamClient:
+    """A client of the event stream with its filters and queue."""
+
+    def __init__(self, event_types=None, entity_ids=None, domains=None, overflow=None):
+        """Initialize the client."""
+        self.event_types = event_types
+        self.entity_ids = entity_ids
+        self.domains = domains
+        self.close_on_overflow = overflow == STREAM_OVERFLOW_CLOSE
+        self.queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        self.dropped = 0
+        self.closed = False
+
+    def matches(self, event):
+        """Return if the client is interested in an event."""
+        if self.event_types and event.event_type not in self.event_types:
+            return False
+
+        if self.entity_ids is None and self.domains is None:
+            return True
+
+        entity_id = event.data.get("entity_id")
+        if not isinstance(entity_id, str):
+            return False
+
+        if self.entity_ids is not None and entity_id in self.entity_ids:
+            return True
+
+        return (
+            self.domains is not None
+            and ha.split_entity_id(entity_id)[0] in self.domains
+        )
+
+    @ha.callback
+    def async_put(self, message):
+        """Queue a message, applying the overflow policy if the queue is full."""
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            if self.close_on_overflow:
+                _LOGGER.warning("Event stream %s is too slow, closing it", id(self))
+                self.closed = True
+                return
+
+            if not self.dropped:
+                _LOGGER.warning(
+                    "Event stream %s is too slow, dropping events", id(self)
+                )
+            self.dropped += 1
+
+    @ha.callback
+    def async_close(self):
+        """Close the stream once the queued messages are written."""
+        try:
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            self.closed = True
+
+
+class StreamHub:
+    """Forward events of the bus to the clients of the event stream.
+
+    A single listener serves all clients so each event is encoded only once,
+    no matter how many clients are subscribed to it.
+    """
+
+    def __init__(self, hass):
+        """Initialize the hub."""
+        self.hass = hass
+        self.clients = []
+        self._unsub = None
+
+    @ha.callback
+    def async_add_client(self, client):
+        """Add a client, return a callback to remove it."""
+        self.clients.append(client)
+
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(MATCH_ALL, self._async_forward)
+
+        @ha.callback
+        def remove_client():
+            """Remove the client."""
+            self.clients.remove(client)
+
+            if not self.clients:
+                self._unsub()
+                self._unsub = None
+
+        return remove_client
+
+    @ha.callback
+    def _async_forward(self, event):
+        """Forward an event to the interested clients."""
+        if event.event_type == EVENT_TIME_CHANGED:
+            return
+
+        if event.event_type == EVENT_HOMEASSISTANT_STOP:
+            for client in self.clients:
+                client.async_close()
+            return
+
+        message = None
+
+        for client in self.clients:
+            if not client.matches(event):
+                continue
+
+            if message is None:
+                message = _stream_message(json.dumps(event, cls=JSONEncoder))
+
+            client.async_put(message)
+
+
 class APIEventStream(HomeAssistantView):
     """View to handle EventStream requests."""
 
@@ -98,62 +222,64 @@ class APIEventStream(HomeAssistantView):
         if not request["hass_user"].is_admin:
             raise Unauthorized()
         hass = request.app["hass"]
-        stop_obj = object()
-        to_write = asyncio.Queue()
-
-        restrict = request.query.get("restrict")
-        if restrict:
-            restrict = restrict.split(",") + [EVENT_HOMEASSISTANT_STOP]
-
-        async def forward_events(event):
-            """Forward events to the open request."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
-
-            if restrict and event.event_type not in restrict:
-                return
 
-            _LOGGER.debug("STREAM %s FORWARDING %s", id(stop_obj), event)
-
-            if event.event_type == EVENT_HOMEASSISTANT_STOP:
-                data = stop_obj
-            else:
-                data = json.dumps(event, cls=JSONEncoder)
+        overflow = request.query.get("overflow", STREAM_OVERFLOW_DROP)
+        if overflow not in (STREAM_OVERFLOW_DROP, STREAM_OVERFLOW_CLOSE):
+            return self.json_message("Invalid overflow policy.", HTTP_BAD_REQUEST)
+
+        filters = {}
+        for key in ("restrict", "entity_id", "domain"):
+            value = request.query.get(key)
+            if value:
+                filters[key] = set(value.split(","))
+
+        client = StreamClient(
+            filters.get("restrict"),
+            filters.get("entity_id"),
+            filters.get("domain"),
+            overflow,
+        )
 
-            await to_write.put(data)
+        hub = hass.data.get(DATA_STREAM_HUB)
+        if hub is None:
+            hub = hass.data[DATA_STREAM_HUB] = StreamHub(hass)
 
         response = web.StreamResponse()
         response.content_type = "text/event-stream"
         await response.prepare(request)
 
-        unsub_stream = hass.bus.async_listen(MATCH_ALL, forward_events)
+        remove_client = hub.async_add_client(client)
+        ping = _stream_message(STREAM_PING_PAYLOAD)
 
         try:
-            _LOGGER.debug("STREAM %s ATTACHED", id(stop_obj))
+            _LOGGER.debug("STREAM %s ATTACHED", id(client))
 
             # Fire off one message so browsers fire open event right away
-            await to_write.put(STREAM_PING_PAYLOAD)
+            client.async_put(ping)
 
             while True:
                 try:
                     with async_timeout.timeout(STREAM_PING_INTERVAL):
-                        payload = await to_write.get()
+                        message = await client.queue.get()
+                except asyncio.TimeoutError:
+                    message = ping
 
-                    if payload is stop_obj:
-                        break
+                if message is None or client.closed:
+                    break
 
-                    msg = f"data: {payload}\n\n"
-                    _LOGGER.debug("STREAM %s WRITING %s", id(stop_obj), msg.strip())
-                    await response.write(msg.encode("UTF-8"))
-                except asyncio.TimeoutError:
-                    await to_write.put(STREAM_PING_PAYLOAD)
+                _LOGGER.debug("STREAM %s WRITING %s", id(client), message)
+                await response.write(message)
 
         except asyncio.CancelledError:
-            _LOGGER.debug("STREAM %s ABORT", id(stop_obj))
+            _LOGGER.debug("STREAM %s ABORT", id(client))
 
         finally:
-            _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(stop_obj))
-            unsub_stream()
+            _LOGGER.debug(
+                "STREAM %s RESPONSE CLOSED, %d events dropped",
+                id(client),
+                client.dropped,
+            )
+            remove_client()
 
         return response
 
@@ -1,4 +1,5 @@
 """Allow to set up simple automation rules via the config file."""
+import asyncio
 import logging
 from typing import Any, Awaitable, Callable, List, Optional, Set, cast
 
@@ -213,8 +214,8 @@ async def async_setup(hass, config):
     )
 
     async def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        conf = await component.async_prepare_reload()
+        """Replace the automations that changed in config."""
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
         await _async_process_config(hass, conf, component)
@@ -238,9 +239,11 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         cond_func,
         action_script,
         initial_state,
+        config_hash=None,
     ):
         """Initialize an automation entity."""
         self._id = automation_id
+        self.config_hash = config_hash
         self._name = name
         self._trigger_config = trigger_config
         self._async_detach_triggers = None
@@ -490,9 +493,17 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
 async def _async_process_config(hass, config, component):
     """Process config and add automations.
 
+    Automations that are running with the same config are kept, so their
+    triggers and actions are not interrupted on reload. Other automations
+    are removed.
+
     This method is a coroutine.
     """
     entities = []
+    # Running automations by config hash
+    running = {}
+    for entity in component.entities:
+        running.setdefault(entity.config_hash, []).append(entity)
 
     for config_key in extract_domain_configs(config, DOMAIN):
         conf = config[config_key]
@@ -500,6 +511,11 @@ async def _async_process_config(hass, config, component):
         for list_no, config_block in enumerate(conf):
             automation_id = config_block.get(CONF_ID)
             name = config_block.get(CONF_ALIAS) or f"{config_key} {list_no}"
+            config_hash = _config_hash(automation_id, name, config_block)
+
+            if running.get(config_hash):
+                running[config_hash].pop()
+                continue
 
             initial_state = config_block.get(CONF_INITIAL_STATE)
 
@@ -529,14 +545,26 @@ async def _async_process_config(hass, config, component):
                 cond_func,
                 action_script,
                 initial_state,
+                config_hash,
             )
 
             entities.append(entity)
 
+    removed = [entity for unused in running.values() for entity in unused]
+    if removed:
+        await asyncio.gather(
+            *(component.async_remove_entity(entity.entity_id) for entity in removed)
+        )
+
     if entities:
         await component.async_add_entities(entities)
 
 
+def _config_hash(automation_id, name, config_block):
+    """Return a hash of the config of an automation."""
+    return hash((automation_id, name, repr(config_block)))
+
+
 async def _async_process_if(hass, config, p_config):
     """Process if checks."""
     if_configs = p_config[CONF_CONDITION]
@@ -23,6 +23,7 @@ from homeassistant.components.media_player.const import (
 )
 from homeassistant.components.stream import request_stream
 from homeassistant.components.stream.const import (
+    ATTR_STREAMS,
     CONF_DURATION,
     CONF_LOOKBACK,
     CONF_STREAM_SOURCE,
@@ -78,6 +79,7 @@ SUPPORT_ON_OFF = 1
 SUPPORT_STREAM = 2
 
 DEFAULT_CONTENT_TYPE = "image/jpeg"
+STREAM_IMAGE_CONTENT_TYPE = "image/jpeg"
 ENTITY_IMAGE_URL = "/api/camera_proxy/{0}?token={1}"
 
 TOKEN_CHANGE_INTERVAL = timedelta(minutes=5)
@@ -137,13 +139,15 @@ async def async_request_stream(hass, entity_id, fmt):
             f"{camera.entity_id} does not support play stream service"
         )
 
-    return request_stream(
+    url = request_stream(
         hass,
         source,
         fmt=fmt,
         keepalive=camera_prefs.preload_stream,
         options=camera.stream_options,
     )
+    _async_set_stream(hass, camera, source)
+    return url
 
 
 @bind_hass
@@ -151,6 +155,10 @@ async def async_get_image(hass, entity_id, timeout=10):
     """Fetch an image from a camera entity."""
     camera = _get_camera_from_entity_id(hass, entity_id)
 
+    image = _stream_image(camera)
+    if image:
+        return Image(STREAM_IMAGE_CONTENT_TYPE, image)
+
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
             image = await camera.async_camera_image()
@@ -238,6 +246,21 @@ def _get_camera_from_entity_id(hass, entity_id):
     return camera
 
 
+@callback
+def _async_set_stream(hass, camera, source):
+    """Remember the stream requested for a camera."""
+    streams = hass.data.get(DOMAIN_STREAM, {}).get(ATTR_STREAMS, {})
+    camera.stream = streams.get(source)
+
+
+def _stream_image(camera):
+    """Return the latest keyframe of the active stream of a camera, if any."""
+    if camera.stream is None:
+        return None
+
+    return camera.stream.get_image()
+
+
 async def async_setup(hass, config):
     """Set up the camera component."""
     component = hass.data[DOMAIN] = EntityComponent(
@@ -272,6 +295,7 @@ async def async_setup(hass, config):
                 continue
 
             request_stream(hass, source, keepalive=True, options=camera.stream_options)
+            _async_set_stream(hass, camera, source)
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, preload_stream)
 
@@ -328,6 +352,8 @@ class Camera(Entity):
         """Initialize a camera."""
         self.is_streaming = False
         self.stream_options = {}
+        # The active stream of the camera, images are taken from it if possible
+        self.stream = None
         self.content_type = DEFAULT_CONTENT_TYPE
         self.access_tokens: collections.deque = collections.deque([], 2)
         self.async_update_token()
@@ -511,6 +537,10 @@ class CameraImageView(CameraView):
 
     async def handle(self, request: web.Request, camera: Camera) -> web.Response:
         """Serve camera image."""
+        image = _stream_image(camera)
+        if image:
+            return web.Response(body=image, content_type=STREAM_IMAGE_CONTENT_TYPE)
+
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(10):
                 image = await camera.async_camera_image()
@@ -601,6 +631,7 @@ async def ws_camera_stream(hass, connection, msg):
             keepalive=camera_prefs.preload_stream,
             options=camera.stream_options,
         )
+        _async_set_stream(hass, camera, source)
         connection.send_result(msg["id"], {"url": url})
     except HomeAssistantError as ex:
         _LOGGER.error("Error requesting stream: %s", ex)
@@ -691,6 +722,7 @@ async def async_handle_play_stream_service(camera, service_call):
         keepalive=camera_prefs.preload_stream,
         options=camera.stream_options,
     )
+    _async_set_stream(hass, camera, source)
     data = {
         ATTR_ENTITY_ID: entity_ids,
         ATTR_MEDIA_CONTENT_ID: f"{get_url(hass)}{url}",
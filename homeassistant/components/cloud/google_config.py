@@ -9,6 +9,7 @@ from homeassistant.components.google_assistant.helpers import AbstractConfig
 from homeassistant.const import (
     CLOUD_NEVER_EXPOSED_ENTITIES,
     EVENT_HOMEASSISTANT_STARTED,
+    HTTP_INTERNAL_SERVER_ERROR,
     HTTP_OK,
 )
 from homeassistant.core import CoreState, callback
@@ -127,6 +128,8 @@ class CloudGoogleConfig(AbstractConfig):
             await self._cloud.google_report_state.async_send_message(message)
         except ErrorResponse as err:
             _LOGGER.warning("Error reporting state - %s: %s", err.code, err.message)
+            return HTTP_INTERNAL_SERVER_ERROR
+        return HTTP_OK
 
     async def _async_request_sync_devices(self, agent_user_id: str):
         """Trigger a sync with Google."""
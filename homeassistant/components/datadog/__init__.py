@@ -75,21 +75,18 @@ def setup(hass, config):
         if state is None or state.state == STATE_UNKNOWN:
             return
 
-        states = dict(state.attributes)
+        numeric = state_helper.numeric_state(hass, state)
         metric = f"{prefix}.{state.domain}"
         tags = [f"entity:{state.entity_id}"]
 
-        for key, value in states.items():
-            if isinstance(value, (float, int)):
-                attribute = f"{metric}.{key.replace(' ', '_')}"
-                value = int(value) if isinstance(value, bool) else value
-                statsd.gauge(attribute, value, sample_rate=sample_rate, tags=tags)
+        for key, value in numeric.attributes.items():
+            attribute = f"{metric}.{key.replace(' ', '_')}"
+            statsd.gauge(attribute, value, sample_rate=sample_rate, tags=tags)
 
-                _LOGGER.debug("Sent metric %s: %s (tags: %s)", attribute, value, tags)
+            _LOGGER.debug("Sent metric %s: %s (tags: %s)", attribute, value, tags)
 
-        try:
-            value = state_helper.state_as_number(state)
-        except ValueError:
+        value = numeric.value
+        if value is None:
             _LOGGER.debug("Error sending %s: %s (tags: %s)", metric, state.state, tags)
             return
 
@@ -28,8 +28,10 @@ from .const import (
     CONF_CONSIDER_HOME,
     CONF_NEW_DEVICE_DEFAULTS,
     CONF_SCAN_INTERVAL,
+    CONF_STORE_KNOWN_DEVICES,
     CONF_TRACK_NEW,
     DEFAULT_CONSIDER_HOME,
+    DEFAULT_STORE_KNOWN_DEVICES,
     DEFAULT_TRACK_NEW,
     DOMAIN,
     PLATFORM_TYPE_LEGACY,
@@ -61,6 +63,9 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
             cv.time_period, cv.positive_timedelta
         ),
         vol.Optional(CONF_NEW_DEVICE_DEFAULTS, default={}): NEW_DEVICE_DEFAULTS_SCHEMA,
+        vol.Optional(
+            CONF_STORE_KNOWN_DEVICES, default=DEFAULT_STORE_KNOWN_DEVICES
+        ): cv.boolean,
     }
 )
 PLATFORM_SCHEMA_BASE = cv.PLATFORM_SCHEMA_BASE.extend(PLATFORM_SCHEMA.schema)
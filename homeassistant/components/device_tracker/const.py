@@ -25,6 +25,9 @@ DEFAULT_CONSIDER_HOME = timedelta(seconds=180)
 
 CONF_NEW_DEVICE_DEFAULTS = "new_device_defaults"
 
+CONF_STORE_KNOWN_DEVICES = "store_known_devices"
+DEFAULT_STORE_KNOWN_DEVICES = False
+
 ATTR_ATTRIBUTES = "attributes"
 ATTR_BATTERY = "battery"
 ATTR_DEV_ID = "dev_id"
@@ -2,7 +2,7 @@
 import asyncio
 from datetime import timedelta
 import hashlib
-from typing import Any, List, Sequence
+from typing import Any, Dict, List, Optional, Sequence
 
 import voluptuous as vol
 
@@ -28,6 +28,7 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_registry import async_get_registry
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import GPSType, HomeAssistantType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.yaml import dump
@@ -39,8 +40,10 @@ from .const import (
     ATTR_SOURCE_TYPE,
     CONF_CONSIDER_HOME,
     CONF_NEW_DEVICE_DEFAULTS,
+    CONF_STORE_KNOWN_DEVICES,
     CONF_TRACK_NEW,
     DEFAULT_CONSIDER_HOME,
+    DEFAULT_STORE_KNOWN_DEVICES,
     DEFAULT_TRACK_NEW,
     DOMAIN,
     LOGGER,
@@ -50,6 +53,13 @@ from .const import (
 YAML_DEVICES = "known_devices.yaml"
 EVENT_NEW_DEVICE = "device_tracker_new_device"
 
+# Seconds to collect new devices before adding them to known_devices.yaml
+CONFIG_WRITE_DELAY = 1
+
+STORAGE_KEY = f"{DOMAIN}.known_devices"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
 
 async def get_tracker(hass, config):
     """Create a tracker."""
@@ -64,8 +74,16 @@ async def get_tracker(hass, config):
     if track_new is None:
         track_new = defaults.get(CONF_TRACK_NEW, DEFAULT_TRACK_NEW)
 
+    store = None
+    if conf.get(CONF_STORE_KNOWN_DEVICES, DEFAULT_STORE_KNOWN_DEVICES):
+        store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+
     devices = await async_load_config(yaml_path, hass, consider_home)
-    tracker = DeviceTracker(hass, consider_home, track_new, defaults, devices)
+    tracker = DeviceTracker(hass, consider_home, track_new, defaults, devices, store)
+
+    if store is not None:
+        await tracker.async_load_storage()
+
     return tracker
 
 
@@ -79,8 +97,13 @@ class DeviceTracker:
         track_new: bool,
         defaults: dict,
         devices: Sequence,
+        store: Optional[Store] = None,
     ) -> None:
-        """Initialize a device tracker."""
+        """Initialize a device tracker.
+
+        New devices are added to known_devices.yaml, or kept in the given store
+        if there is one.
+        """
         self.hass = hass
         self.devices = {dev.dev_id: dev for dev in devices}
         self.mac_to_dev = {dev.mac: dev for dev in devices if dev.mac}
@@ -92,6 +115,11 @@ class DeviceTracker:
         )
         self.defaults = defaults
         self._is_updating = asyncio.Lock()
+        self._registry = None
+        # New devices waiting to be added to known_devices.yaml
+        self._pending_config: Dict[str, Device] = {}
+        self._store = store
+        self._stored: Dict[str, dict] = {}
 
         for dev in devices:
             if self.devices[dev.dev_id] is not dev:
@@ -151,7 +179,6 @@ class DeviceTracker:
 
         This method is a coroutine.
         """
-        registry = await async_get_registry(self.hass)
         if mac is None and dev_id is None:
             raise HomeAssistantError("Neither mac or device id passed in")
         if mac is not None:
@@ -178,9 +205,12 @@ class DeviceTracker:
                 device.async_write_ha_state()
             return
 
+        if self._registry is None:
+            self._registry = await async_get_registry(self.hass)
+
         # Guard from calling see on entity registry entities.
         entity_id = f"{DOMAIN}.{dev_id}"
-        if registry.async_is_registered(entity_id):
+        if self._registry.async_is_registered(entity_id):
             LOGGER.error(
                 "The see service is not supported for this entity %s", entity_id
             )
@@ -223,7 +253,7 @@ class DeviceTracker:
             },
         )
 
-        # update known_devices.yaml
+        # update known_devices.yaml or the store
         self.hass.async_create_task(
             self.async_update_config(
                 self.hass.config.path(YAML_DEVICES), dev_id, device
@@ -231,14 +261,72 @@ class DeviceTracker:
         )
 
     async def async_update_config(self, path, dev_id, device):
-        """Add device to YAML configuration file.
+        """Add device to YAML configuration file or to the store.
+
+        New devices are collected for a moment, so all devices found by a scan
+        are added to the file in a single write.
 
         This method is a coroutine.
         """
+        if self._store is not None:
+            self._stored[dev_id] = {"dev_id": dev_id, **_device_config(device)}
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+            return
+
+        self._pending_config[dev_id] = device
+
+        # Written together with the device that started collecting
+        if len(self._pending_config) > 1:
+            return
+
+        await asyncio.sleep(CONFIG_WRITE_DELAY)
+
         async with self._is_updating:
+            devices, self._pending_config = self._pending_config, {}
             await self.hass.async_add_executor_job(
-                update_config, self.hass.config.path(YAML_DEVICES), dev_id, device
+                update_config_devices,
+                self.hass.config.path(YAML_DEVICES),
+                list(devices.values()),
+            )
+
+    async def async_load_storage(self):
+        """Load the devices kept in the store.
+
+        Devices configured in known_devices.yaml take precedence.
+
+        This method is a coroutine.
+        """
+        data = await self._store.async_load()
+
+        if data is None:
+            return
+
+        for config in data["devices"]:
+            dev_id = config["dev_id"]
+            mac = config[ATTR_MAC]
+
+            if dev_id in self.devices or (mac and mac in self.mac_to_dev):
+                continue
+
+            self._stored[dev_id] = config
+            device = Device(
+                self.hass,
+                self.consider_home,
+                config["track"],
+                dev_id,
+                mac,
+                config[ATTR_NAME],
+                picture=config["picture"],
+                icon=config[ATTR_ICON],
             )
+            self.devices[dev_id] = device
+            if mac:
+                self.mac_to_dev[mac] = device
+
+    @callback
+    def _data_to_save(self):
+        """Return the data of the stored devices."""
+        return {"devices": list(self._stored.values())}
 
     @callback
     def async_update_stale(self, now: dt_util.dt.datetime):
@@ -543,20 +631,31 @@ async def async_load_config(
     return result
 
 
+def _device_config(device: Device) -> dict:
+    """Return the configuration of a device."""
+    return {
+        ATTR_NAME: device.name,
+        ATTR_MAC: device.mac,
+        ATTR_ICON: device.icon,
+        "picture": device.config_picture,
+        "track": device.track,
+    }
+
+
 def update_config(path: str, dev_id: str, device: Device):
     """Add device to YAML configuration file."""
+    update_config_devices(path, [device])
+
+
+def update_config_devices(path: str, devices: Sequence[Device]):
+    """Add devices to YAML configuration file in a single write."""
     with open(path, "a") as out:
-        device = {
-            device.dev_id: {
-                ATTR_NAME: device.name,
-                ATTR_MAC: device.mac,
-                ATTR_ICON: device.icon,
-                "picture": device.config_picture,
-                "track": device.track,
-            }
-        }
-        out.write("\n")
-        out.write(dump(device))
+        out.write(
+            "".join(
+                "\n" + dump({device.dev_id: _device_config(device)})
+                for device in devices
+            )
+        )
 
 
 def get_gravatar_for_email(email: str):
@@ -18,6 +18,7 @@ from .hue_api import (
     HueGroupView,
     HueOneLightChangeView,
     HueOneLightStateView,
+    HueStateCache,
     HueUnauthorizedUser,
     HueUsernameView,
 )
@@ -172,6 +173,7 @@ class Config:
         self.type = conf.get(CONF_TYPE)
         self.numbers = None
         self.cached_states = {}
+        self.state_cache = HueStateCache(self)
         self._exposed_cache = {}
 
         if self.type == TYPE_ALEXA:
@@ -2,9 +2,12 @@
 import asyncio
 import hashlib
 from ipaddress import ip_address
+import json
 import logging
 import time
 
+from aiohttp import web
+
 from homeassistant import core
 from homeassistant.components import (
     climate,
@@ -55,6 +58,8 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_SUPPORTED_FEATURES,
     ATTR_TEMPERATURE,
+    CONTENT_TYPE_JSON,
+    EVENT_STATE_CHANGED,
     HTTP_BAD_REQUEST,
     HTTP_NOT_FOUND,
     HTTP_UNAUTHORIZED,
@@ -68,6 +73,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
 )
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util.network import is_local
 
 _LOGGER = logging.getLogger(__name__)
@@ -212,7 +218,9 @@ class HueAllLightsStateView(HomeAssistantView):
         if not is_local(ip_address(request.remote)):
             return self.json_message("Only local IPs allowed", HTTP_UNAUTHORIZED)
 
-        return self.json(create_list_of_entities(self.config, request))
+        return json_body_response(
+            self.config.state_cache.async_lights_body(request.app["hass"])
+        )
 
 
 class HueFullStateView(HomeAssistantView):
@@ -234,12 +242,9 @@ class HueFullStateView(HomeAssistantView):
         if username != HUE_API_USERNAME:
             return self.json(UNAUTHORIZED_USER)
 
-        json_response = {
-            "lights": create_list_of_entities(self.config, request),
-            "config": create_config_model(self.config, request),
-        }
-
-        return self.json(json_response)
+        return json_body_response(
+            self.config.state_cache.async_full_state_body(request.app["hass"])
+        )
 
 
 class HueConfigView(HomeAssistantView):
@@ -302,7 +307,7 @@ class HueOneLightStateView(HomeAssistantView):
             _LOGGER.error("Entity not exposed: %s", entity_id)
             return self.json_message("Entity not exposed", HTTP_UNAUTHORIZED)
 
-        json_response = entity_to_json(self.config, entity)
+        json_response = self.config.state_cache.async_entity_json(hass, entity)
 
         return self.json(json_response)
 
@@ -573,6 +578,8 @@ class HueOneLightChangeView(HomeAssistantView):
         else:
             config.cached_states[entity_id] = [parsed, time.time()]
 
+        config.state_cache.async_invalidate(entity_id)
+
         return self.json(json_response)
 
 
@@ -803,16 +810,125 @@ def create_config_model(config, request):
     }
 
 
-def create_list_of_entities(config, request):
-    """Create a list of all entities."""
-    hass = request.app["hass"]
-    json_response = {}
+def json_body_response(body):
+    """Return a response for an already serialized JSON body."""
+    response = web.Response(body=body, content_type=CONTENT_TYPE_JSON)
+    response.enable_compression()
+    return response
+
+
+def _json_bytes(data):
+    """Serialize data the same way HomeAssistantView.json does."""
+    return json.dumps(data, sort_keys=True, cls=JSONEncoder, allow_nan=False).encode(
+        "UTF-8"
+    )
 
-    for entity in config.filter_exposed_entities(hass.states.async_all()):
-        number = config.entity_id_to_number(entity.entity_id)
-        json_response[number] = entity_to_json(config, entity)
 
-    return json_response
+class HueStateCache:
+    """Keep the Hue JSON of exposed entities until their state changes.
+
+    Echo devices poll the list of lights every few seconds. The rendered JSON
+    of every entity and the serialized responses are kept until a state
+    changed event for an exposed entity comes in.
+    """
+
+    def __init__(self, config):
+        """Initialize the cache."""
+        self.config = config
+        self._entities = {}
+        self._lights = None
+        self._bodies = {}
+        self._unsub = None
+
+    @core.callback
+    def async_invalidate(self, entity_id):
+        """Forget everything that includes an entity."""
+        self._entities.pop(entity_id, None)
+        self._lights = None
+        self._bodies.clear()
+
+    @core.callback
+    def _async_state_changed(self, event):
+        """Invalidate the cache when an exposed entity changes."""
+        for key in ("old_state", "new_state"):
+            state = event.data.get(key)
+            if state is not None and self.config.is_entity_exposed(state):
+                self.async_invalidate(event.data[ATTR_ENTITY_ID])
+                return
+
+    def _is_cacheable(self, entity_id):
+        """Return if the JSON of an entity only changes with its state.
+
+        Optimistic states of a recent request expire after a while.
+        """
+        cached_state_entry = self.config.cached_states.get(entity_id)
+        return cached_state_entry is None or cached_state_entry[1] is None
+
+    @core.callback
+    def _async_listen(self, hass):
+        """Start listening for state changes before anything is cached."""
+        if self._unsub is None:
+            self._unsub = hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed
+            )
+
+    @core.callback
+    def async_entity_json(self, hass, entity):
+        """Return the Hue JSON of an entity."""
+        self._async_listen(hass)
+        cached = self._entities.get(entity.entity_id)
+        if cached is not None and cached[0] is entity:
+            return cached[1]
+
+        data = entity_to_json(self.config, entity)
+        if self._is_cacheable(entity.entity_id):
+            self._entities[entity.entity_id] = (entity, data)
+        return data
+
+    @core.callback
+    def async_lights(self, hass):
+        """Return the Hue JSON of all exposed entities by number."""
+        if self._lights is not None:
+            return self._lights
+
+        self._async_listen(hass)
+        config = self.config
+        lights = {}
+        cacheable = True
+
+        for entity in config.filter_exposed_entities(hass.states.async_all()):
+            number = config.entity_id_to_number(entity.entity_id)
+            lights[number] = self.async_entity_json(hass, entity)
+            cacheable = cacheable and self._is_cacheable(entity.entity_id)
+
+        if cacheable:
+            self._lights = lights
+        return lights
+
+    @core.callback
+    def async_lights_body(self, hass):
+        """Return the serialized list of all exposed entities."""
+        body = self._bodies.get("lights")
+        if body is None:
+            body = _json_bytes(self.async_lights(hass))
+            if self._lights is not None:
+                self._bodies["lights"] = body
+        return body
+
+    @core.callback
+    def async_full_state_body(self, hass):
+        """Return the serialized full state of the bridge."""
+        body = self._bodies.get("full_state")
+        if body is None:
+            body = _json_bytes(
+                {
+                    "lights": self.async_lights(hass),
+                    "config": create_config_model(self.config, None),
+                }
+            )
+            if self._lights is not None:
+                self._bodies["full_state"] = body
+        return body
 
 
 def hue_brightness_to_hass(value):
@@ -1,6 +1,7 @@
 """Helper classes for Google Assistant integration."""
 from abc import ABC, abstractmethod
 from asyncio import gather
+from collections import Counter
 from collections.abc import Mapping
 import logging
 import pprint
@@ -14,6 +15,7 @@ from homeassistant.const import (
     ATTR_SUPPORTED_FEATURES,
     CLOUD_NEVER_EXPOSED_ENTITIES,
     CONF_NAME,
+    HTTP_OK,
     STATE_UNAVAILABLE,
 )
 from homeassistant.core import Context, HomeAssistant, State, callback
@@ -50,6 +52,8 @@ class AbstractConfig(ABC):
         self._store = None
         self._google_sync_unsub = {}
         self._local_sdk_active = False
+        # Counters of the report state pipeline since it was last enabled
+        self.report_state_stats = Counter()
 
     async def async_initialize(self):
         """Perform async initialization of config."""
@@ -112,17 +116,22 @@ class AbstractConfig(ABC):
         # pylint: disable=no-self-use
         return True
 
-    async def async_report_state(self, message, agent_user_id: str):
-        """Send a state report to Google."""
+    async def async_report_state(self, message, agent_user_id: str) -> int:
+        """Send a state report to Google.
+
+        Return value is the HTTP status code of the report request.
+        """
         raise NotImplementedError
 
-    async def async_report_state_all(self, message):
+    async def async_report_state_all(self, message) -> int:
         """Send a state report to Google for all previously synced users."""
-        jobs = [
-            self.async_report_state(message, agent_user_id)
-            for agent_user_id in self._store.agent_user_ids
-        ]
-        await gather(*jobs)
+        res = await gather(
+            *[
+                self.async_report_state(message, agent_user_id)
+                for agent_user_id in self._store.agent_user_ids
+            ]
+        )
+        return max(res, default=HTTP_OK)
 
     @callback
     def async_enable_report_state(self):
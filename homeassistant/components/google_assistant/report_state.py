@@ -1,7 +1,7 @@
 """Google Report State implementation."""
 import logging
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import HTTP_BAD_REQUEST, MATCH_ALL
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 
@@ -12,6 +12,13 @@ from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Seconds to collect state changes before they are sent in a single report
+REPORT_STATE_WINDOW = 1
+
+STAT_SENT = "reports_sent"
+STAT_ENTITIES = "entities_reported"
+STAT_COALESCED = "changes_coalesced"
+STAT_SUPPRESSED = "changes_suppressed"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,12 +26,54 @@ _LOGGER = logging.getLogger(__name__)
 @callback
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
     """Enable state reporting."""
+    # Last state that Google accepted, that is being sent and that is queued
+    # to be sent per entity
+    reported = {}
+    sending = {}
+    pending = {}
+    unsub_pending = None
+    stats = google_config.report_state_stats
+    stats.clear()
+
+    async def async_send_report(states):
+        """Report states to Google and remember them once Google accepted them."""
+        stats[STAT_SENT] += 1
+        stats[STAT_ENTITIES] += len(states)
+        sending.update(states)
+
+        try:
+            status = await google_config.async_report_state_all(
+                {"devices": {"states": states}}
+            )
+        finally:
+            for entity_id, entity_data in states.items():
+                if sending.get(entity_id) is entity_data:
+                    del sending[entity_id]
+
+        if status < HTTP_BAD_REQUEST:
+            reported.update(states)
+
+    async def async_report_pending(_now):
+        """Send the collected state changes in a single report."""
+        nonlocal pending, unsub_pending
+        states, pending = pending, {}
+        unsub_pending = None
+
+        if not states:
+            return
+
+        _LOGGER.debug("Reporting state for %s", ", ".join(states))
+        await async_send_report(states)
+
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
+        nonlocal unsub_pending
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
         if not hass.is_running:
             return
 
         if not new_state:
+            reported.pop(changed_entity, None)
             return
 
         if not google_config.should_expose(new_state):
@@ -41,18 +90,36 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
             return
 
-        if old_state:
-            old_entity = GoogleEntity(hass, google_config, old_state)
+        last_data = pending.get(changed_entity)
+        if last_data is None:
+            last_data = sending.get(changed_entity)
+        if last_data is None:
+            last_data = reported.get(changed_entity)
 
-            # Only report to Google if data that Google cares about has changed
-            if entity_data == old_entity.query_serialize():
-                return
+        # Nothing has been reported yet for this entity, compare with the old
+        # state instead.
+        if last_data is None and old_state:
+            try:
+                last_data = GoogleEntity(
+                    hass, google_config, old_state
+                ).query_serialize()
+            except SmartHomeError:
+                pass
 
-        _LOGGER.debug("Reporting state for %s: %s", changed_entity, entity_data)
+        # Only report to Google if data that Google cares about has changed
+        if entity_data == last_data:
+            stats[STAT_SUPPRESSED] += 1
+            return
+
+        if changed_entity in pending:
+            stats[STAT_COALESCED] += 1
 
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        pending[changed_entity] = entity_data
+
+        if unsub_pending is None:
+            unsub_pending = async_call_later(
+                hass, REPORT_STATE_WINDOW, async_report_pending
+            )
 
     async def inital_report(_now):
         """Report initially all states."""
@@ -70,10 +137,20 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
         if not entities:
             return
 
-        await google_config.async_report_state_all({"devices": {"states": entities}})
-
-    async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
+        await async_send_report(entities)
 
-    return hass.helpers.event.async_track_state_change(
+    unsub_initial = async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
+    unsub_listener = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
+
+    @callback
+    def unsub():
+        """Stop reporting state and drop pending changes."""
+        unsub_initial()
+        unsub_listener()
+
+        if unsub_pending is not None:
+            unsub_pending()
+
+    return unsub
@@ -110,16 +110,14 @@ class GraphiteFeeder(threading.Thread):
     def _report_attributes(self, entity_id, new_state):
         """Report the attributes."""
         now = time.time()
-        things = dict(new_state.attributes)
-        try:
-            things["state"] = state.state_as_number(new_state)
-        except ValueError:
-            pass
+        numeric = state.numeric_state(self._hass, new_state)
+        things = dict(numeric.attributes)
+        if numeric.value is not None:
+            things["state"] = numeric.value
         lines = [
             "%s.%s.%s %f %i"
             % (self._prefix, entity_id, key.replace(" ", "_"), value, now)
             for key, value in things.items()
-            if isinstance(value, (float, int))
         ]
         if not lines:
             return
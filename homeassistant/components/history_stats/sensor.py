@@ -1,4 +1,5 @@
 """Component to make instant statistics about your history."""
+from collections import deque
 import datetime
 import logging
 import math
@@ -118,6 +119,19 @@ class HistoryStatsSensor(Entity):
         self.value = None
         self.count = None
 
+        # State changes since the start of the period as (timestamp, matches)
+        # tuples. They are loaded from the recorder once and then kept up to
+        # date from state changed events, which are queued in
+        # _pending_changes by the event loop and consumed by update.
+        # _history_end is the time up to which the changes are known, it is
+        # infinite once the state changed events continue the loaded changes.
+        self._history_start = None
+        self._history_end = None
+        self._history_start_state = False
+        self._history = []
+        self._pending_changes = deque()
+        self._tracking_since = None
+
         @callback
         def start_refresh(*args):
             """Register state tracking."""
@@ -127,8 +141,25 @@ class HistoryStatsSensor(Entity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(event):
+                """Record a state change of the tracked entity."""
+                old_state = event.data.get("old_state")
+                new_state = event.data.get("new_state")
+                if new_state is not None and (
+                    old_state is None or old_state.state != new_state.state
+                ):
+                    self._pending_changes.append(
+                        (
+                            new_state.last_changed.timestamp(),
+                            new_state.state == self._entity_state,
+                        )
+                    )
+                force_refresh()
+
+            self._tracking_since = dt_util.utcnow().timestamp()
             force_refresh()
-            async_track_state_change_event(self.hass, [self._entity_id], force_refresh)
+            async_track_state_change_event(self.hass, [self._entity_id], state_changed)
 
         # Delay first refresh to keep startup fast
         hass.bus.listen_once(EVENT_HOMEASSISTANT_START, start_refresh)
@@ -209,25 +240,29 @@ class HistoryStatsSensor(Entity):
             # Don't compute anything as the value cannot have changed
             return
 
-        # Get history between start and end
-        history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
-        )
+        # Only go to the database if we don't know the states of the period
+        if (
+            self._history_start is None
+            or start_timestamp < self._history_start
+            or end_timestamp > self._history_end
+        ):
+            if not self._load_history(start, end):
+                return
+        elif start_timestamp > self._history_start:
+            self._prune_history(start_timestamp)
 
-        if self._entity_id not in history_list.keys():
-            return
+        self._apply_pending_changes()
 
-        # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state == self._entity_state
+        last_state = self._history_start_state
         last_time = start_timestamp
+        end_time = dt_util.as_timestamp(end)
         elapsed = 0
         count = 0
 
         # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state == self._entity_state
-            current_time = item.last_changed.timestamp()
+        for current_time, current_state in self._history:
+            if current_time >= end_time:
+                break
 
             if last_state:
                 elapsed += current_time - last_time
@@ -248,6 +283,59 @@ class HistoryStatsSensor(Entity):
         # Save counter
         self.count = count
 
+    def _load_history(self, start, end):
+        """Load the state changes between start and end from the recorder."""
+        history_list = history.state_changes_during_period(
+            self.hass, start, end, str(self._entity_id)
+        )
+
+        if self._entity_id not in history_list.keys():
+            return False
+
+        # Get the first state
+        last_state = history.get_state(self.hass, start, self._entity_id)
+        self._history_start_state = (
+            last_state is not None and last_state == self._entity_state
+        )
+        self._history_start = math.floor(dt_util.as_timestamp(start))
+        self._history_end = min(
+            math.floor(dt_util.as_timestamp(end)), dt_util.utcnow().timestamp()
+        )
+        if (
+            self._tracking_since is not None
+            and self._tracking_since <= self._history_end
+        ):
+            self._history_end = math.inf
+        self._history = [
+            (item.last_changed.timestamp(), item.state == self._entity_state)
+            for item in history_list.get(self._entity_id)
+        ]
+        return True
+
+    def _prune_history(self, start_timestamp):
+        """Drop the state changes that happened before the new period start.
+
+        The last dropped change is the state at the start of the period.
+        """
+        self._apply_pending_changes()
+        index = 0
+        while index < len(self._history) and self._history[index][0] <= start_timestamp:
+            index += 1
+        if index:
+            self._history_start_state = self._history[index - 1][1]
+            self._history = self._history[index:]
+        self._history_start = start_timestamp
+
+    def _apply_pending_changes(self):
+        """Add the state changes received since the last update."""
+        last_time = self._history[-1][0] if self._history else self._history_start
+        while self._pending_changes:
+            item = self._pending_changes.popleft()
+            # Skip changes that were already included in the recorder results
+            if item[0] > last_time:
+                self._history.append(item)
+                last_time = item[0]
+
     def update_period(self):
         """Parse the templates and store a datetime tuple in _period."""
         start = None
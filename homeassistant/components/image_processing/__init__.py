@@ -1,11 +1,21 @@
 """Provides functionality to interact with image processing services."""
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 import logging
+import os
+import time
 
 import voluptuous as vol
 
-from homeassistant.const import ATTR_ENTITY_ID, ATTR_NAME, CONF_ENTITY_ID, CONF_NAME
+from homeassistant.components import websocket_api
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_NAME,
+    CONF_ENTITY_ID,
+    CONF_NAME,
+    EVENT_HOMEASSISTANT_STOP,
+)
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
@@ -21,6 +31,13 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "image_processing"
 SCAN_INTERVAL = timedelta(seconds=10)
 
+DATA_SCANNER = "image_processing_scanner"
+
+# Processors of a camera scanning within this many seconds share its image
+FRAME_SHARE_WINDOW = 1
+# Threads that run the process_image methods of the processors
+MAX_PROCESS_WORKERS = min(4, os.cpu_count() or 1)
+
 DEVICE_CLASSES = [
     "alpr",  # Automatic license plate recognition
     "face",  # Face
@@ -66,6 +83,15 @@ PLATFORM_SCHEMA_BASE = cv.PLATFORM_SCHEMA_BASE.extend(PLATFORM_SCHEMA.schema)
 async def async_setup(hass, config):
     """Set up the image processing."""
     component = EntityComponent(_LOGGER, DOMAIN, hass, SCAN_INTERVAL)
+    scanner = hass.data[DATA_SCANNER] = ImageScanner(hass)
+
+    @callback
+    def async_shutdown(event):
+        """Stop the image processing threads."""
+        scanner.executor.shutdown(wait=False)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_shutdown)
+    websocket_api.async_register_command(hass, websocket_stats)
 
     await component.async_setup(config)
 
@@ -88,6 +114,92 @@ async def async_setup(hass, config):
     return True
 
 
+@websocket_api.websocket_command({vol.Required("type"): "image_processing/stats"})
+@callback
+def websocket_stats(hass, connection, msg):
+    """Return the processing statistics of the image processing entities."""
+    connection.send_result(msg["id"], hass.data[DATA_SCANNER].stats)
+
+
+class ImageScanner:
+    """Fetch camera images and schedule them to image processing entities.
+
+    The image of a camera is fetched once for all entities processing it at
+    the same time. Entities that are still busy only keep the latest image.
+    """
+
+    def __init__(self, hass):
+        """Initialize the scanner."""
+        self.hass = hass
+        self.executor = ThreadPoolExecutor(
+            max_workers=MAX_PROCESS_WORKERS, thread_name_prefix="ImageProcessing"
+        )
+        # Processing statistics by entity id
+        self.stats = {}
+        # Latest image by camera entity id, as a (monotonic time, image) tuple
+        self._images = {}
+        self._fetches = {}
+        self._locks = {}
+        self._latest = {}
+
+    async def async_get_image(self, camera_entity, timeout):
+        """Return an image of a camera, shared by processors scanning together."""
+        image = self._images.get(camera_entity)
+        if image is not None and time.monotonic() - image[0] < FRAME_SHARE_WINDOW:
+            return image[1]
+
+        fetch = self._fetches.get(camera_entity)
+        if fetch is None:
+            fetch = self._fetches[camera_entity] = self.hass.async_create_task(
+                self._async_fetch_image(camera_entity, timeout)
+            )
+
+        # A cancelled processor should not cancel the fetch of the others
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch_image(self, camera_entity, timeout):
+        """Fetch an image of a camera."""
+        try:
+            image = await self.hass.components.camera.async_get_image(
+                camera_entity, timeout=timeout
+            )
+        finally:
+            del self._fetches[camera_entity]
+
+        self._images[camera_entity] = (time.monotonic(), image)
+        return image
+
+    async def async_process(self, entity, image):
+        """Process an image, unless a newer image arrives while it waits."""
+        entity_id = entity.entity_id
+        stats = self.stats.setdefault(
+            entity_id, {"processed": 0, "dropped": 0, "latency": None}
+        )
+        latest = self._latest[entity_id] = self._latest.get(entity_id, 0) + 1
+        lock = self._locks.setdefault(entity_id, asyncio.Lock())
+
+        async with lock:
+            if self._latest.get(entity_id) != latest:
+                stats["dropped"] += 1
+                return
+
+            start = time.monotonic()
+            await entity.async_process_image(image)
+            stats["processed"] += 1
+            stats["latency"] = time.monotonic() - start
+
+    @callback
+    def async_remove_entity(self, entity_id):
+        """Forget the statistics and queue of a removed entity."""
+        self.stats.pop(entity_id, None)
+        self._latest.pop(entity_id, None)
+        self._locks.pop(entity_id, None)
+
+    async def async_run_job(self, target, *args):
+        """Run a blocking process_image method in the processing threads."""
+        return await self.hass.loop.run_in_executor(self.executor, target, *args)
+
+
 class ImageProcessingEntity(Entity):
     """Base entity class for image processing."""
 
@@ -109,27 +221,30 @@ class ImageProcessingEntity(Entity):
 
     async def async_process_image(self, image):
         """Process image."""
-        return await self.hass.async_add_job(self.process_image, image)
+        return await self.hass.data[DATA_SCANNER].async_run_job(
+            self.process_image, image
+        )
+
+    async def async_will_remove_from_hass(self):
+        """Drop the processing statistics of the entity."""
+        self.hass.data[DATA_SCANNER].async_remove_entity(self.entity_id)
 
     async def async_update(self):
         """Update image and process it.
 
         This method is a coroutine.
         """
-        camera = self.hass.components.camera
-        image = None
+        scanner = self.hass.data[DATA_SCANNER]
 
         try:
-            image = await camera.async_get_image(
-                self.camera_entity, timeout=self.timeout
-            )
+            image = await scanner.async_get_image(self.camera_entity, self.timeout)
 
         except HomeAssistantError as err:
             _LOGGER.error("Error on receive image from entity: %s", err)
             return
 
         # process image data
-        await self.async_process_image(image.content)
+        await scanner.async_process(self, image.content)
 
 
 class ImageProcessingFaceEntity(ImageProcessingEntity):
@@ -1,13 +1,19 @@
 """Support for sending data to an Influx database."""
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import gzip
+import itertools
 import logging
 import math
+import os
 import queue
 import threading
 import time
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from influxdb import InfluxDBClient, exceptions
+from influxdb.line_protocol import make_lines
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
 from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
 from influxdb_client.rest import ApiException
@@ -26,6 +32,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import event as event_helper, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
@@ -33,6 +40,9 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util.json import load_json
 
 from .const import (
     API_VERSION_2,
@@ -42,6 +52,7 @@ from .const import (
     CLIENT_ERROR_V1,
     CLIENT_ERROR_V2,
     CODE_INVALID_INPUTS,
+    CODE_NO_CONTENT,
     COMPONENT_CONFIG_SCHEMA_CONNECTION,
     CONF_API_VERSION,
     CONF_BUCKET,
@@ -50,14 +61,17 @@ from .const import (
     CONF_COMPONENT_CONFIG_GLOB,
     CONF_DB_NAME,
     CONF_DEFAULT_MEASUREMENT,
+    CONF_GZIP,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
+    CONF_MAX_CONCURRENT_WRITES,
     CONF_ORG,
     CONF_OVERRIDE_MEASUREMENT,
     CONF_PASSWORD,
     CONF_PATH,
     CONF_PORT,
     CONF_RETRY_COUNT,
+    CONF_SPILL_SIZE,
     CONF_SSL,
     CONF_TAGS,
     CONF_TAGS_ATTRIBUTES,
@@ -81,10 +95,19 @@ from .const import (
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
+    REPLAYED_MESSAGE,
     RESUMED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPILL_DIRECTORY,
+    SPILL_FULL_MESSAGE,
+    SPILLED_MESSAGE,
+    STAT_BATCHES_WRITTEN,
+    STAT_EVENTS_DROPPED,
+    STAT_EVENTS_REPLAYED,
+    STAT_EVENTS_SPILLED,
+    STAT_EVENTS_WRITTEN,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
@@ -152,6 +175,12 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        vol.Optional(CONF_MAX_CONCURRENT_WRITES, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_GZIP, default=False): cv.boolean,
+        # Size of the on-disk buffer for unwritten events in MiB, 0 disables it
+        vol.Optional(CONF_SPILL_SIZE, default=0): cv.positive_int,
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_OVERRIDE_MEASUREMENT): cv.string,
         vol.Optional(CONF_TAGS, default={}): vol.Schema({cv.string: cv.string}),
@@ -182,7 +211,7 @@ INFLUX_SCHEMA = vol.All(
 CONFIG_SCHEMA = vol.Schema({DOMAIN: INFLUX_SCHEMA}, extra=vol.ALLOW_EXTRA,)
 
 
-def _generate_event_to_json(conf: Dict) -> Callable[[Dict], str]:
+def _generate_event_to_json(hass, conf: Dict) -> Callable[[Dict], str]:
     """Build event to json converter and add to config."""
     entity_filter = convert_include_exclude_filter(conf)
     tags = conf.get(CONF_TAGS)
@@ -206,17 +235,9 @@ def _generate_event_to_json(conf: Dict) -> Callable[[Dict], str]:
         ):
             return
 
-        try:
-            _include_state = _include_value = False
-
-            _state_as_value = float(state.state)
-            _include_value = True
-        except ValueError:
-            try:
-                _state_as_value = float(state_helper.state_as_number(state))
-                _include_state = _include_value = True
-            except ValueError:
-                _include_state = True
+        numeric = state_helper.numeric_state(hass, state)
+        _include_state = not numeric.is_number
+        _include_value = numeric.value is not None
 
         include_uom = True
         entity_config = component_config.get(state.entity_id)
@@ -225,7 +246,7 @@ def _generate_event_to_json(conf: Dict) -> Callable[[Dict], str]:
             if override_measurement:
                 measurement = override_measurement
             else:
-                measurement = state.attributes.get(CONF_UNIT_OF_MEASUREMENT)
+                measurement = numeric.unit
                 if measurement in (None, ""):
                     if default_measurement:
                         measurement = default_measurement
@@ -246,7 +267,7 @@ def _generate_event_to_json(conf: Dict) -> Callable[[Dict], str]:
         if _include_state:
             json[INFLUX_CONF_FIELDS][INFLUX_CONF_STATE] = state.state
         if _include_value:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = _state_as_value
+            json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = float(numeric.value)
 
         ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
         ignore_attributes.update(global_ignore_attributes)
@@ -256,6 +277,7 @@ def _generate_event_to_json(conf: Dict) -> Callable[[Dict], str]:
             elif (
                 key != CONF_UNIT_OF_MEASUREMENT or include_uom
             ) and key not in ignore_attributes:
+                numeric_value = numeric.attributes.get(key)
                 # If the key is already in fields
                 if key in json[INFLUX_CONF_FIELDS]:
                     key = f"{key}_"
@@ -264,7 +286,9 @@ def _generate_event_to_json(conf: Dict) -> Callable[[Dict], str]:
                 # But if we can not do it we store the value
                 # as string add "_str" postfix to the field key
                 try:
-                    json[INFLUX_CONF_FIELDS][key] = float(value)
+                    if numeric_value is None:
+                        numeric_value = float(value)
+                    json[INFLUX_CONF_FIELDS][key] = numeric_value
                 except (ValueError, TypeError):
                     new_key = f"{key}_str"
                     new_value = str(value)
@@ -311,6 +335,9 @@ def get_influx_connection(conf, test_write=False, test_read=False):
         kwargs[INFLUX_CONF_ORG] = conf[CONF_ORG]
         bucket = conf.get(CONF_BUCKET)
 
+        if conf.get(CONF_GZIP):
+            kwargs["enable_gzip"] = True
+
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
         initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
@@ -387,10 +414,27 @@ def get_influx_connection(conf, test_write=False, test_read=False):
 
     influx = InfluxDBClient(**kwargs)
 
+    def _write_points_gzip(json):
+        """Write gzip compressed line protocol to V1 influx."""
+        influx.request(
+            url="write",
+            method="POST",
+            params={"db": conf[CONF_DB_NAME]},
+            data=gzip.compress(make_lines({"points": json}).encode("utf-8")),
+            expected_response_code=CODE_NO_CONTENT,
+            headers={
+                "Content-Type": "application/octet-stream",
+                "Content-Encoding": "gzip",
+                "Accept": "text/plain",
+            },
+        )
+
+    write_points = _write_points_gzip if conf.get(CONF_GZIP) else influx.write_points
+
     def write_v1(json):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json)
+            write_points(json)
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -441,9 +485,17 @@ def setup(hass, config):
         event_helper.call_later(hass, RETRY_INTERVAL, lambda _: setup(hass, config))
         return True
 
-    event_to_json = _generate_event_to_json(conf)
+    event_to_json = _generate_event_to_json(hass, conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spill = None
+    if conf[CONF_SPILL_SIZE]:
+        spill = SpillBuffer(
+            hass.config.path(STORAGE_DIR, SPILL_DIRECTORY),
+            conf[CONF_SPILL_SIZE] * 1024 * 1024,
+        )
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_json, max_tries, conf[CONF_MAX_CONCURRENT_WRITES], spill,
+    )
     instance.start()
 
     def shutdown(event):
@@ -453,14 +505,115 @@ def setup(hass, config):
         influx.close()
 
     hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, shutdown)
+    hass.add_job(
+        hass.components.system_health.async_register_info, DOMAIN, system_health_info,
+    )
 
     return True
 
 
+async def system_health_info(hass):
+    """Get info for the info page."""
+    return hass.data[DOMAIN].get_info()
+
+
+class SpillBuffer:
+    """Bounded on-disk buffer of batches that could not be written.
+
+    Every batch is stored in its own file, named so that sorting the names
+    returns the batches in the order they were added. Batches left behind
+    when Home Assistant stops are replayed after the next start.
+    """
+
+    def __init__(self, path: str, max_size: int):
+        """Initialize the buffer and pick up batches from a previous run."""
+        self.path = path
+        self.max_size = max_size
+        self.size = 0
+        self._lock = threading.Lock()
+        self._batches = deque()
+        self._claimed = set()
+        self._sequence = itertools.count()
+        self._encoder = JSONEncoder(separators=(",", ":"))
+
+        os.makedirs(path, exist_ok=True)
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".json"):
+                self._batches.append(name)
+                self.size += os.path.getsize(os.path.join(path, name))
+
+    def __len__(self) -> int:
+        """Return the number of buffered batches."""
+        return len(self._batches)
+
+    def add(self, json: List[Dict]) -> bool:
+        """Store a batch, return False if the buffer is full."""
+        data = self._encoder.encode(json).encode("utf-8")
+
+        with self._lock:
+            if self.size + len(data) > self.max_size:
+                return False
+
+            name = f"{time.time_ns():020d}-{next(self._sequence):06d}.json"
+            path = os.path.join(self.path, name)
+            try:
+                with open(f"{path}.tmp", "wb") as fdesc:
+                    fdesc.write(data)
+                os.replace(f"{path}.tmp", path)
+            except OSError as err:
+                _LOGGER.error("Could not buffer events in %s: %s", path, err)
+                return False
+
+            self._batches.append(name)
+            self.size += len(data)
+
+        return True
+
+    def take(self) -> Optional[Tuple[str, List[Dict]]]:
+        """Claim the oldest batch that is not being replayed already."""
+        with self._lock:
+            for name in self._batches:
+                if name not in self._claimed:
+                    self._claimed.add(name)
+                    break
+            else:
+                return None
+
+        try:
+            return name, load_json(os.path.join(self.path, name), [])
+        except HomeAssistantError as err:
+            _LOGGER.error("Dropping unreadable buffered events: %s", err)
+            self.release(name, True)
+            return None
+
+    def release(self, name: str, done: bool) -> None:
+        """Release a claimed batch, removing it when it has been handled."""
+        with self._lock:
+            self._claimed.discard(name)
+            if not done:
+                return
+
+            self._batches.remove(name)
+            path = os.path.join(self.path, name)
+            try:
+                self.size -= os.path.getsize(path)
+                os.remove(path)
+            except OSError as err:
+                _LOGGER.error("Could not remove buffered events %s: %s", path, err)
+
+
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(
+        self,
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        max_concurrent_writes=1,
+        spill=None,
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
@@ -469,6 +622,20 @@ class InfluxThread(threading.Thread):
         self.max_tries = max_tries
         self.write_errors = 0
         self.shutdown = False
+        self.spill = spill
+        self.stats = Counter()
+        # Seconds between queueing and writing the oldest event of the last batch
+        self.lag = 0.0
+        self._stats_lock = threading.Lock()
+        self._executor = None
+        self._in_flight = None
+
+        if max_concurrent_writes > 1:
+            self._executor = ThreadPoolExecutor(
+                max_concurrent_writes, thread_name_prefix=f"{DOMAIN}_writer"
+            )
+            self._in_flight = threading.Semaphore(max_concurrent_writes)
+
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     def _event_listener(self, event):
@@ -476,22 +643,43 @@ class InfluxThread(threading.Thread):
         item = (time.monotonic(), event)
         self.queue.put(item)
 
+    def _count(self, stat, value):
+        """Increase one of the statistics, writes can happen concurrently."""
+        with self._stats_lock:
+            self.stats[stat] += value
+
+    def get_info(self):
+        """Return the statistics of the writer."""
+        info = dict(self.stats)
+        info["queue_size"] = self.queue.qsize()
+        info["lag_seconds"] = round(self.lag, 3)
+        if self.spill is not None:
+            info["spilled_batches"] = len(self.spill)
+            info["spill_size"] = self.spill.size
+        return info
+
     @staticmethod
     def batch_timeout():
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
     def get_events_json(self):
-        """Return a batch of events formatted for writing."""
+        """Return a batch of events formatted for writing.
+
+        Events which are too old to catch up on are moved to the spill buffer
+        when there is one and dropped otherwise.
+        """
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
         json = []
+        oldest = None
 
         dropped = 0
+        old_json = []
 
         try:
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while len(json) + len(old_json) < BATCH_BUFFER_SIZE and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -506,19 +694,42 @@ class InfluxThread(threading.Thread):
                         event_json = self.event_to_json(event)
                         if event_json:
                             json.append(event_json)
+                            if oldest is None:
+                                oldest = timestamp
+                    elif self.spill is not None:
+                        event_json = self.event_to_json(event)
+                        if event_json:
+                            old_json.append(event_json)
                     else:
                         dropped += 1
 
         except queue.Empty:
             pass
 
+        if old_json:
+            self.spill_json(old_json)
+
         if dropped:
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
+            self._count(STAT_EVENTS_DROPPED, dropped)
+
+        return count, json, oldest
 
-        return count, json
+    def spill_json(self, json):
+        """Store events in the spill buffer to write them later."""
+        if self.spill.add(json):
+            if not self.stats[STAT_EVENTS_SPILLED]:
+                _LOGGER.warning(SPILLED_MESSAGE)
+            self._count(STAT_EVENTS_SPILLED, len(json))
+        else:
+            _LOGGER.error(SPILL_FULL_MESSAGE, len(json))
+            self._count(STAT_EVENTS_DROPPED, len(json))
 
     def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+        """Write preprocessed events to influxdb, with retry.
+
+        Returns True when the events have been written.
+        """
         for retry in range(self.max_tries + 1):
             try:
                 self.influx.write(json)
@@ -528,26 +739,74 @@ class InfluxThread(threading.Thread):
                     self.write_errors = 0
 
                 _LOGGER.debug(WROTE_MESSAGE, len(json))
-                break
+                self._count(STAT_BATCHES_WRITTEN, 1)
+                self._count(STAT_EVENTS_WRITTEN, len(json))
+                return True
             except ValueError as err:
                 _LOGGER.error(err)
-                break
+                self._count(STAT_EVENTS_DROPPED, len(json))
+                return False
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
+                elif self.spill is not None:
+                    self.spill_json(json)
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
                     self.write_errors += len(json)
+                    self._count(STAT_EVENTS_DROPPED, len(json))
+
+        return False
+
+    def replay_spilled(self):
+        """Write the oldest batch of the spill buffer."""
+        batch = self.spill.take()
+        if batch is None:
+            return
+
+        name, json = batch
+        try:
+            self.influx.write(json)
+        except ValueError as err:
+            _LOGGER.error(err)
+            self._count(STAT_EVENTS_DROPPED, len(json))
+        except ConnectionError:
+            self.spill.release(name, False)
+            return
+
+        self.spill.release(name, True)
+        _LOGGER.debug(REPLAYED_MESSAGE, len(json))
+        self._count(STAT_EVENTS_REPLAYED, len(json))
+
+    def write_batch(self, count, json, oldest):
+        """Write a batch and mark its events as processed."""
+        try:
+            if json and self.write_to_influxdb(json):
+                self.lag = time.monotonic() - oldest
+                # Buffered events are replayed at the pace of new writes
+                if self.spill is not None:
+                    self.replay_spilled()
+        finally:
+            for _ in range(count):
+                self.queue.task_done()
+
+            if self._in_flight is not None:
+                self._in_flight.release()
 
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
-            count, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
-            for _ in range(count):
-                self.queue.task_done()
+            batch = self.get_events_json()
+
+            if self._executor is None:
+                self.write_batch(*batch)
+            else:
+                self._in_flight.acquire()
+                self._executor.submit(self.write_batch, *batch)
+
+        if self._executor is not None:
+            self._executor.shutdown()
 
     def block_till_done(self):
         """Block till all events processed."""
@@ -29,6 +29,9 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
+CONF_MAX_CONCURRENT_WRITES = "max_concurrent_writes"
+CONF_GZIP = "gzip"
+CONF_SPILL_SIZE = "spill_size"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -74,11 +77,13 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+SPILL_DIRECTORY = "influxdb_spill"
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
 TEST_QUERY_V2 = "buckets()"
 CODE_INVALID_INPUTS = 400
+CODE_NO_CONTENT = 204
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=60)
 
@@ -116,6 +121,15 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+SPILLED_MESSAGE = "InfluxDB is not reachable, buffering events on disk."
+SPILL_FULL_MESSAGE = "InfluxDB spill buffer is full, dropped %d events."
+REPLAYED_MESSAGE = "Replayed %d buffered events."
+
+STAT_EVENTS_WRITTEN = "events_written"
+STAT_BATCHES_WRITTEN = "batches_written"
+STAT_EVENTS_DROPPED = "events_dropped"
+STAT_EVENTS_SPILLED = "events_spilled"
+STAT_EVENTS_REPLAYED = "events_replayed"
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
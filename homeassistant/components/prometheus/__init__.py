@@ -1,6 +1,7 @@
 """Support for Prometheus metrics export."""
 import logging
 import string
+import time
 
 from aiohttp import web
 import prometheus_client
@@ -19,9 +20,7 @@ from homeassistant.components.humidifier.const import (
     ATTR_MODE,
 )
 from homeassistant.const import (
-    ATTR_DEVICE_CLASS,
     ATTR_TEMPERATURE,
-    ATTR_UNIT_OF_MEASUREMENT,
     CONTENT_TYPE_TEXT_PLAIN,
     EVENT_STATE_CHANGED,
     STATE_ON,
@@ -37,6 +36,9 @@ from homeassistant.util.temperature import fahrenheit_to_celsius
 
 _LOGGER = logging.getLogger(__name__)
 
+# Metrics about the exporter itself, registered once per process
+_SELF_METRICS = {}
+
 API_ENDPOINT = "/api/prometheus"
 
 DOMAIN = "prometheus"
@@ -77,8 +79,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass, config):
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -92,6 +92,7 @@ def setup(hass, config):
     )
 
     metrics = PrometheusMetrics(
+        hass,
         prometheus_client,
         entity_filter,
         namespace,
@@ -101,6 +102,7 @@ def setup(hass, config):
         default_metric,
     )
 
+    hass.http.register_view(PrometheusView(prometheus_client, metrics))
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
     return True
 
@@ -110,6 +112,7 @@ class PrometheusMetrics:
 
     def __init__(
         self,
+        hass,
         prometheus_cli,
         entity_filter,
         namespace,
@@ -119,6 +122,7 @@ class PrometheusMetrics:
         default_metric,
     ):
         """Initialize Prometheus Metrics."""
+        self._hass = hass
         self.prometheus_cli = prometheus_cli
         self._component_config = component_config
         self._override_metric = override_metric
@@ -137,12 +141,28 @@ class PrometheusMetrics:
         else:
             self.metrics_prefix = ""
         self._metrics = {}
+        self._metric_labels = {}
+        # Label sets and labeled children per entity_id, so state changes of
+        # known entities only need dictionary lookups.
+        self._entity_labels = {}
+        self._children = {}
+        self._series_count = 0
         self._climate_units = climate_units
 
+        self._scrape_duration = self._self_metric(
+            "prometheus_scrape_duration_seconds",
+            "Time spent rendering the previous scrape",
+        )
+        self._series = self._self_metric(
+            "prometheus_series",
+            "Number of series exported for Home Assistant entities",
+        )
+
     def handle_event(self, event):
         """Listen for new messages on the bus, and add them to Prometheus."""
         state = event.data.get("new_state")
         if state is None:
+            self._remove_series(event.data["entity_id"])
             return
 
         entity_id = state.entity_id
@@ -157,27 +177,32 @@ class PrometheusMetrics:
         if hasattr(self, handler) and state.state != STATE_UNAVAILABLE:
             getattr(self, handler)(state)
 
-        labels = self._labels(state)
         state_change = self._metric(
             "state_change", self.prometheus_cli.Counter, "The number of state changes"
         )
-        state_change.labels(**labels).inc()
+        self._labeled(state_change, state).inc()
 
         entity_available = self._metric(
             "entity_available",
             self.prometheus_cli.Gauge,
             "Entity is available (not in the unavailable state)",
         )
-        entity_available.labels(**labels).set(float(state.state != STATE_UNAVAILABLE))
+        self._labeled(entity_available, state).set(
+            float(state.state != STATE_UNAVAILABLE)
+        )
 
         last_updated_time_seconds = self._metric(
             "last_updated_time_seconds",
             self.prometheus_cli.Gauge,
             "The last_updated timestamp",
         )
-        last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
+        self._labeled(last_updated_time_seconds, state).set(
+            state.last_updated.timestamp()
+        )
 
     def _handle_attributes(self, state):
+        numeric_attributes = state_helper.numeric_state(self._hass, state).attributes
+
         for key, value in state.attributes.items():
             metric = self._metric(
                 f"{state.domain}_attr_{key.lower()}",
@@ -186,8 +211,10 @@ class PrometheusMetrics:
             )
 
             try:
-                value = float(value)
-                metric.labels(**self._labels(state)).set(value)
+                value = numeric_attributes.get(key)
+                if value is None:
+                    value = float(state.attributes[key])
+                self._labeled(metric, state).set(value)
             except (ValueError, TypeError):
                 pass
 
@@ -203,8 +230,22 @@ class PrometheusMetrics:
                 f"{self.metrics_prefix}{metric}"
             )
             self._metrics[metric] = factory(full_metric_name, documentation, labels)
+            self._metric_labels[self._metrics[metric]] = labels
             return self._metrics[metric]
 
+    def _self_metric(self, metric, documentation):
+        """Return a gauge about the exporter, created once per registry."""
+        full_metric_name = self._sanitize_metric_name(f"{self.metrics_prefix}{metric}")
+        key = (self.prometheus_cli, full_metric_name)
+
+        try:
+            return _SELF_METRICS[key]
+        except KeyError:
+            gauge = _SELF_METRICS[key] = self.prometheus_cli.Gauge(
+                full_metric_name, documentation
+            )
+            return gauge
+
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
         return "".join(
@@ -219,23 +260,66 @@ class PrometheusMetrics:
             ]
         )
 
-    @staticmethod
-    def state_as_number(state):
+    def state_as_number(self, state):
         """Return a state casted to a float."""
-        try:
-            value = state_helper.state_as_number(state)
-        except ValueError:
+        value = state_helper.numeric_state(self._hass, state).value
+        if value is None:
             _LOGGER.debug("Could not convert %s to float", state)
             value = 0
         return value
 
-    @staticmethod
-    def _labels(state):
-        return {
-            "entity": state.entity_id,
-            "domain": state.domain,
-            "friendly_name": state.attributes.get("friendly_name"),
-        }
+    def _labels(self, state):
+        friendly_name = state.attributes.get("friendly_name")
+        labels = self._entity_labels.get(state.entity_id)
+
+        if labels is None or labels["friendly_name"] != friendly_name:
+            # The series with the old labels would never be updated again
+            self._remove_series(state.entity_id)
+            labels = self._entity_labels[state.entity_id] = {
+                "entity": state.entity_id,
+                "domain": state.domain,
+                "friendly_name": friendly_name,
+            }
+
+        return labels
+
+    def _labeled(self, metric, state, **extra_labels):
+        """Return the child of a metric for the labels of a state."""
+        labels = self._labels(state)
+        children = self._children.setdefault(state.entity_id, {})
+        key = (metric, *extra_labels.items())
+
+        try:
+            return children[key]
+        except KeyError:
+            child = children[key] = metric.labels(**labels, **extra_labels)
+            self._series_count += 1
+            return child
+
+    def _remove_series(self, entity_id):
+        """Remove the series of an entity that was removed or relabeled."""
+        labels = self._entity_labels.pop(entity_id, None)
+        children = self._children.pop(entity_id, {})
+        self._series_count -= len(children)
+
+        for metric, *extra_labels in children:
+            values = {**labels, **dict(extra_labels)}
+            try:
+                metric.remove(*(values[name] for name in self._metric_labels[metric]))
+            except KeyError:
+                pass
+
+    def generate_latest(self):
+        """Render the exposition text and update the self-metrics.
+
+        Runs in the executor; the reported duration is the one of the
+        previous scrape.
+        """
+        self._series.set(self._series_count)
+        start = time.perf_counter()
+        body = self.prometheus_cli.generate_latest()
+        self._scrape_duration.set(time.perf_counter() - start)
+        return body
 
     def _battery(self, state):
         if "battery_level" in state.attributes:
@@ -246,7 +330,7 @@ class PrometheusMetrics:
             )
             try:
                 value = float(state.attributes["battery_level"])
-                metric.labels(**self._labels(state)).set(value)
+                self._labeled(metric, state).set(value)
             except ValueError:
                 pass
 
@@ -257,7 +341,7 @@ class PrometheusMetrics:
             "State of the binary sensor (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._labeled(metric, state).set(value)
 
     def _handle_input_boolean(self, state):
         metric = self._metric(
@@ -266,7 +350,7 @@ class PrometheusMetrics:
             "State of the input boolean (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._labeled(metric, state).set(value)
 
     def _handle_device_tracker(self, state):
         metric = self._metric(
@@ -275,14 +359,14 @@ class PrometheusMetrics:
             "State of the device tracker (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._labeled(metric, state).set(value)
 
     def _handle_person(self, state):
         metric = self._metric(
             "person_state", self.prometheus_cli.Gauge, "State of the person (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._labeled(metric, state).set(value)
 
     def _handle_light(self, state):
         metric = self._metric(
@@ -295,7 +379,7 @@ class PrometheusMetrics:
             else:
                 value = self.state_as_number(state)
             value = value * 100
-            metric.labels(**self._labels(state)).set(value)
+            self._labeled(metric, state).set(value)
         except ValueError:
             pass
 
@@ -304,7 +388,7 @@ class PrometheusMetrics:
             "lock_state", self.prometheus_cli.Gauge, "State of the lock (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._labeled(metric, state).set(value)
 
     def _handle_climate(self, state):
         temp = state.attributes.get(ATTR_TEMPERATURE)
@@ -316,7 +400,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Temperature in degrees Celsius",
             )
-            metric.labels(**self._labels(state)).set(temp)
+            self._labeled(metric, state).set(temp)
 
         current_temp = state.attributes.get(ATTR_CURRENT_TEMPERATURE)
         if current_temp:
@@ -327,7 +411,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Current Temperature in degrees Celsius",
             )
-            metric.labels(**self._labels(state)).set(current_temp)
+            self._labeled(metric, state).set(current_temp)
 
         current_action = state.attributes.get(ATTR_HVAC_ACTION)
         if current_action:
@@ -335,7 +419,7 @@ class PrometheusMetrics:
                 "climate_action", self.prometheus_cli.Gauge, "HVAC action", ["action"],
             )
             for action in CURRENT_HVAC_ACTIONS:
-                metric.labels(**dict(self._labels(state), action=action)).set(
+                self._labeled(metric, state, action=action).set(
                     float(action == current_action)
                 )
 
@@ -347,7 +431,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Target Relative Humidity",
             )
-            metric.labels(**self._labels(state)).set(humidifier_target_humidity_percent)
+            self._labeled(metric, state).set(humidifier_target_humidity_percent)
 
         metric = self._metric(
             "humidifier_state",
@@ -356,7 +440,7 @@ class PrometheusMetrics:
         )
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            self._labeled(metric, state).set(value)
         except ValueError:
             pass
 
@@ -370,12 +454,10 @@ class PrometheusMetrics:
                 ["mode"],
             )
             for mode in available_modes:
-                metric.labels(**dict(self._labels(state), mode=mode)).set(
-                    float(mode == current_mode)
-                )
+                self._labeled(metric, state, mode=mode).set(float(mode == current_mode))
 
     def _handle_sensor(self, state):
-        unit = self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
+        unit = self._unit_string(state_helper.numeric_state(self._hass, state).unit)
 
         for metric_handler in self._sensor_metric_handlers:
             metric = metric_handler(state, unit)
@@ -391,7 +473,7 @@ class PrometheusMetrics:
                 value = self.state_as_number(state)
                 if unit == TEMP_FAHRENHEIT:
                     value = fahrenheit_to_celsius(value)
-                _metric.labels(**self._labels(state)).set(value)
+                self._labeled(_metric, state).set(value)
             except ValueError:
                 pass
 
@@ -401,10 +483,9 @@ class PrometheusMetrics:
         """Get default metric."""
         return self._default_metric
 
-    @staticmethod
-    def _sensor_attribute_metric(state, unit):
+    def _sensor_attribute_metric(self, state, unit):
         """Get metric based on device class attribute."""
-        metric = state.attributes.get(ATTR_DEVICE_CLASS)
+        metric = state_helper.numeric_state(self._hass, state).device_class
         if metric is not None:
             return f"{metric}_{unit}"
         return None
@@ -449,7 +530,7 @@ class PrometheusMetrics:
 
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            self._labeled(metric, state).set(value)
         except ValueError:
             pass
 
@@ -465,7 +546,7 @@ class PrometheusMetrics:
             "Count of times an automation has been triggered",
         )
 
-        metric.labels(**self._labels(state)).inc()
+        self._labeled(metric, state).inc()
 
 
 class PrometheusView(HomeAssistantView):
@@ -474,15 +555,17 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, prometheus_cli, metrics):
         """Initialize Prometheus view."""
         self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
+        hass = request.app["hass"]
 
         return web.Response(
-            body=self.prometheus_cli.generate_latest(),
+            body=await hass.async_add_executor_job(self.metrics.generate_latest),
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
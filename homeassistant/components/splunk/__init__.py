@@ -90,9 +90,8 @@ def setup(hass, config):
         if state is None or not entity_filter(state.entity_id):
             return
 
-        try:
-            _state = state_helper.state_as_number(state)
-        except ValueError:
+        _state = state_helper.numeric_state(hass, state).value
+        if _state is None:
             _state = state.state
 
         json_body = [
@@ -1,7 +1,8 @@
 """Support for statistics for sensor values."""
+from bisect import bisect_left, insort
 from collections import deque
 import logging
-import statistics
+import math
 
 import voluptuous as vol
 
@@ -79,6 +80,88 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     return True
 
 
+class WindowStatistics:
+    """Aggregates of a window of values, updated as values enter and leave.
+
+    The mean and the sum of squared differences are kept with Welford's
+    algorithm and a sorted copy of the values provides the median, minimum
+    and maximum.
+
+    Adding or removing a value finds its position in O(log n), but shifting
+    the list makes it O(n). For the window sizes this sensor is configured
+    with that single memmove is cheaper than maintaining monotonic deques
+    and a separate order-statistic tree.
+    """
+
+    def __init__(self):
+        """Initialize an empty window."""
+        self.sorted = []
+        self.mean = 0.0
+        self.total = 0.0
+        self._sum_squares = 0.0
+        self._removed = 0
+
+    def __len__(self):
+        """Return the number of values in the window."""
+        return len(self.sorted)
+
+    def add(self, value):
+        """Add a value to the window."""
+        insort(self.sorted, value)
+        delta = value - self.mean
+        self.mean += delta / len(self.sorted)
+        self._sum_squares += delta * (value - self.mean)
+        self.total += value
+
+    def remove(self, value):
+        """Remove a value from the window."""
+        del self.sorted[bisect_left(self.sorted, value)]
+        count = len(self.sorted)
+
+        if not count:
+            self.reset(())
+            return
+
+        delta = value - self.mean
+        self.mean -= delta / count
+        self._sum_squares -= delta * (value - self.mean)
+        self.total -= value
+
+        # Rounding errors add up when values leave the window, recalculate
+        # once the window has been replaced completely.
+        self._removed += 1
+        if self._removed >= count:
+            self.reset(self.sorted)
+
+    def reset(self, values):
+        """Replace the content of the window."""
+        self.sorted = sorted(values)
+        self._removed = 0
+        count = len(self.sorted)
+
+        if not count:
+            self.mean = self.total = self._sum_squares = 0.0
+            return
+
+        self.total = math.fsum(self.sorted)
+        self.mean = self.total / count
+        self._sum_squares = math.fsum((value - self.mean) ** 2 for value in self.sorted)
+
+    @property
+    def median(self):
+        """Return the median of the values."""
+        count = len(self.sorted)
+        middle = count // 2
+        if count % 2:
+            return self.sorted[middle]
+        return (self.sorted[middle - 1] + self.sorted[middle]) / 2
+
+    @property
+    def variance(self):
+        """Return the sample variance of the values."""
+        return max(self._sum_squares, 0.0) / (len(self.sorted) - 1)
+
+
 class StatisticsSensor(Entity):
     """Representation of a Statistics sensor."""
 
@@ -93,6 +176,7 @@ class StatisticsSensor(Entity):
         self._unit_of_measurement = None
         self.states = deque(maxlen=self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
+        self._window = WindowStatistics()
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -136,7 +220,7 @@ class StatisticsSensor(Entity):
             EVENT_HOMEASSISTANT_START, async_stats_sensor_startup
         )
 
-    def _add_state_to_queue(self, new_state):
+    def _add_state_to_queue(self, new_state, update_window=True):
         """Add the state to the queue."""
         if new_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
             return
@@ -145,7 +229,14 @@ class StatisticsSensor(Entity):
             if self.is_binary:
                 self.states.append(new_state.state)
             else:
-                self.states.append(float(new_state.state))
+                value = float(new_state.state)
+
+                if update_window:
+                    if len(self.states) == self._sampling_size:
+                        self._window.remove(self.states[0])
+                    self._window.add(value)
+
+                self.states.append(value)
 
             self.ages.append(new_state.last_updated)
         except ValueError:
@@ -212,7 +303,16 @@ class StatisticsSensor(Entity):
             self._max_age,
         )
 
-        while self.ages and (now - self.ages[0]) > self._max_age:
+        expired = 0
+        for age in self.ages:
+            if (now - age) <= self._max_age:
+                break
+            expired += 1
+
+        # Starting over is cheaper when most of the window has expired
+        reset_window = not self.is_binary and expired > len(self.ages) - expired
+
+        for _ in range(expired):
             _LOGGER.debug(
                 "%s: purging record with datetime %s(%s)",
                 self.entity_id,
@@ -220,7 +320,13 @@ class StatisticsSensor(Entity):
                 (now - self.ages[0]),
             )
             self.ages.popleft()
-            self.states.popleft()
+            value = self.states.popleft()
+
+            if not self.is_binary and not reset_window:
+                self._window.remove(value)
+
+        if reset_window:
+            self._window.reset(self.states)
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
@@ -240,24 +346,27 @@ class StatisticsSensor(Entity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            window = self._window
+
+            if window:  # require only one data point
+                self.mean = round(window.mean, self._precision)
+                self.median = round(window.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if len(window) > 1:  # require at least two data points
+                variance = window.variance
+                self.stdev = round(math.sqrt(variance), self._precision)
+                self.variance = round(variance, self._precision)
+            else:
+                _LOGGER.debug("%s: less than two data points", self.entity_id)
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(window.total, self._precision)
+                self.min = round(window.sorted[0], self._precision)
+                self.max = round(window.sorted[-1], self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -339,7 +448,11 @@ class StatisticsSensor(Entity):
             states = execute(query, to_native=True, validate_entity_ids=False)
 
         for state in reversed(states):
-            self._add_state_to_queue(state)
+            self._add_state_to_queue(state, update_window=False)
+
+        # Load the window at once instead of value by value
+        if not self.is_binary:
+            self._window.reset(self.states)
 
         self.async_schedule_update_ha_state(True)
 
@@ -59,17 +59,17 @@ def setup(hass, config):
         if state is None:
             return
 
+        numeric = state_helper.numeric_state(hass, state)
+
         try:
             if value_mapping and state.state in value_mapping:
                 _state = float(value_mapping[state.state])
             else:
-                _state = state_helper.state_as_number(state)
+                _state = numeric.value
         except ValueError:
             # Set the state to none and continue for any numeric attributes.
             _state = None
 
-        states = dict(state.attributes)
-
         _LOGGER.debug("Sending %s", state.entity_id)
 
         if show_attribute_flag is True:
@@ -77,10 +77,9 @@ def setup(hass, config):
                 statsd_client.gauge("%s.state" % state.entity_id, _state, sample_rate)
 
             # Send attribute values
-            for key, value in states.items():
-                if isinstance(value, (float, int)):
-                    stat = "{}.{}".format(state.entity_id, key.replace(" ", "_"))
-                    statsd_client.gauge(stat, value, sample_rate)
+            for key, value in numeric.attributes.items():
+                stat = "{}.{}".format(state.entity_id, key.replace(" ", "_"))
+                statsd_client.gauge(stat, value, sample_rate)
 
         else:
             if isinstance(_state, (float, int)):
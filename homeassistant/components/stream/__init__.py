@@ -2,6 +2,7 @@
 import logging
 import secrets
 import threading
+import time
 from types import MappingProxyType
 
 import voluptuous as vol
@@ -14,20 +15,37 @@ from homeassistant.loader import bind_hass
 
 from .const import (
     ATTR_ENDPOINTS,
+    ATTR_IMAGE_INTERVAL,
     ATTR_STREAMS,
     CONF_DURATION,
+    CONF_IMAGE_INTERVAL,
     CONF_LOOKBACK,
     CONF_STREAM_SOURCE,
+    DEFAULT_IMAGE_INTERVAL,
     DOMAIN,
+    IMAGE_MAX_AGE,
+    IMAGE_REQUEST_TIMEOUT,
     MAX_SEGMENTS,
     SERVICE_RECORD,
 )
 from .core import PROVIDERS
 from .hls import async_setup_hls
+from .ll_hls import async_setup_ll_hls
 
 _LOGGER = logging.getLogger(__name__)
 
-CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(
+                    CONF_IMAGE_INTERVAL, default=DEFAULT_IMAGE_INTERVAL
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 STREAM_SERVICE_SCHEMA = vol.Schema({vol.Required(CONF_STREAM_SOURCE): cv.string})
 
@@ -90,10 +108,14 @@ async def async_setup(hass, config):
     hass.data[DOMAIN] = {}
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = {}
+    hass.data[DOMAIN][ATTR_IMAGE_INTERVAL] = (config.get(DOMAIN) or {}).get(
+        CONF_IMAGE_INTERVAL, DEFAULT_IMAGE_INTERVAL
+    )
 
     # Setup HLS
     hls_endpoint = async_setup_hls(hass)
     hass.data[DOMAIN][ATTR_ENDPOINTS]["hls"] = hls_endpoint
+    hass.data[DOMAIN][ATTR_ENDPOINTS]["ll_hls"] = async_setup_ll_hls(hass)
 
     # Setup Recorder
     async_setup_recorder(hass)
@@ -132,6 +154,16 @@ class Stream:
         self._thread = None
         self._thread_quit = None
         self._outputs = {}
+        # Seconds between keyframes decoded into images, 0 disables images
+        self.image_interval = hass.data.get(DOMAIN, {}).get(
+            ATTR_IMAGE_INTERVAL, DEFAULT_IMAGE_INTERVAL
+        )
+        # Latest image as a (monotonic time, jpeg) tuple
+        self._image = None
+        self._image_requested = None
+        # Sequence number of the last segment. It continues when the worker
+        # restarts, so segment URLs are never reused for an access token.
+        self.sequence = 0
 
         if self.options is None:
             self.options = {}
@@ -164,6 +196,34 @@ class Stream:
         if all([p.idle for p in self._outputs.values()]):
             self.access_token = None
 
+    def wants_image(self):
+        """Return if the worker should decode the next keyframe into an image.
+
+        Keyframes are only decoded while images are being requested.
+        """
+        if not self.image_interval or self._image_requested is None:
+            return False
+
+        now = time.monotonic()
+        if now - self._image_requested > IMAGE_REQUEST_TIMEOUT:
+            return False
+
+        return self._image is None or now - self._image[0] >= self.image_interval
+
+    def set_image(self, image):
+        """Store the latest image decoded by the worker."""
+        self._image = (time.monotonic(), image)
+
+    def get_image(self):
+        """Return the latest JPEG image of the stream, if recent enough."""
+        now = time.monotonic()
+        self._image_requested = now
+
+        if self._image is None or now - self._image[0] > IMAGE_MAX_AGE:
+            return None
+
+        return self._image[1]
+
     def start(self):
         """Start a stream."""
         # Keep import here so that we can import stream integration without installing reqs
@@ -194,6 +254,7 @@ class Stream:
             self._thread_quit.set()
             self._thread.join()
             self._thread = None
+            self._image = None
             _LOGGER.info("Stopped stream: %s", self.source)
 
 
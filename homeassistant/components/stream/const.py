@@ -4,18 +4,28 @@ DOMAIN = "stream"
 CONF_STREAM_SOURCE = "stream_source"
 CONF_LOOKBACK = "lookback"
 CONF_DURATION = "duration"
+CONF_IMAGE_INTERVAL = "image_interval"
 
 ATTR_ENDPOINTS = "endpoints"
 ATTR_STREAMS = "streams"
 ATTR_KEEPALIVE = "keepalive"
+ATTR_IMAGE_INTERVAL = "image_interval"
 
 SERVICE_RECORD = "record"
 
-OUTPUT_FORMATS = ["hls"]
+OUTPUT_FORMATS = ["hls", "ll_hls"]
 
-FORMAT_CONTENT_TYPE = {"hls": "application/vnd.apple.mpegurl"}
+FORMAT_CONTENT_TYPE = {
+    "hls": "application/vnd.apple.mpegurl",
+    "ll_hls": "application/vnd.apple.mpegurl",
+}
 
 MAX_SEGMENTS = 3  # Max number of segments to keep around
 MIN_SEGMENT_DURATION = 1.5  # Each segment is at least this many seconds
+PART_TARGET_DURATION = 0.5  # Low latency HLS parts are about this many seconds
+
+DEFAULT_IMAGE_INTERVAL = 1  # Min seconds between keyframes decoded into images
+IMAGE_MAX_AGE = 10  # Images older than this are not served from the stream
+IMAGE_REQUEST_TIMEOUT = 60  # Stop decoding images when not requested for this long
 
 PACKETS_TO_WAIT_FOR_AUDIO = 20  # Some streams have an audio stream with no audio
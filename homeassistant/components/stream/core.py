@@ -2,7 +2,7 @@
 import asyncio
 from collections import deque
 import io
-from typing import Any, Callable, List
+from typing import Any, Callable, Dict, List, Optional
 
 from aiohttp import web
 import attr
@@ -25,15 +25,39 @@ class StreamBuffer:
     output = attr.ib()  # type=av.OutputContainer
     vstream = attr.ib()  # type=av.VideoStream
     astream = attr.ib(default=None)  # type=Optional[av.AudioStream]
+    # Parts found in the segment so far, for outputs that use them
+    parts: List["Part"] = attr.ib(factory=list)
+    part_offset: int = attr.ib(default=0)
+    part_start: float = attr.ib(default=0)
+
+
+@attr.s
+class Part:
+    """Represent a part of a segment that is being muxed."""
+
+    sequence: int = attr.ib()
+    index: int = attr.ib()
+    duration: float = attr.ib()
+    independent: bool = attr.ib()
+    data: bytes = attr.ib()
 
 
 @attr.s
 class Segment:
-    """Represent a segment."""
+    """Represent a segment.
+
+    For fragmented mp4 segments, init and m4s hold the init section and the
+    media fragment of the segment, with an ETag for each.
+    """
 
     sequence: int = attr.ib()
     segment: io.BytesIO = attr.ib()
     duration: float = attr.ib()
+    init: Optional[bytes] = attr.ib(default=None)
+    init_etag: Optional[str] = attr.ib(default=None)
+    m4s: Optional[bytes] = attr.ib(default=None)
+    m4s_etag: Optional[str] = attr.ib(default=None)
+    parts: List[Part] = attr.ib(factory=list)
 
 
 class StreamOutput:
@@ -47,6 +71,8 @@ class StreamOutput:
         self._cursor = None
         self._event = asyncio.Event()
         self._segments = deque(maxlen=MAX_SEGMENTS)
+        self._sequences: Dict[int, Segment] = {}
+        self._parts: List[Part] = []
         self._unsub = None
 
     @property
@@ -74,6 +100,16 @@ class StreamOutput:
         """Return Callable which takes a sequence number and returns container options."""
         return None
 
+    @property
+    def part_duration(self) -> Optional[float]:
+        """Return the target duration of parts, None if parts are not used."""
+        return None
+
+    @property
+    def parts(self) -> List[Part]:
+        """Return the parts of the segment that is being muxed."""
+        return self._parts
+
     @property
     def segments(self) -> List[int]:
         """Return current sequence from segments."""
@@ -99,9 +135,14 @@ class StreamOutput:
         if not sequence:
             return self._segments
 
-        for segment in self._segments:
-            if segment.sequence == sequence:
-                return segment
+        return self._sequences.get(sequence)
+
+    def get_part(self, sequence: int, index: int) -> Optional[Part]:
+        """Retrieve a part of a finished segment or of the one being muxed."""
+        segment = self._sequences.get(sequence)
+        parts = self._parts if segment is None else segment.parts
+        if index < len(parts) and parts[index].sequence == sequence:
+            return parts[index]
         return None
 
     async def recv(self) -> Segment:
@@ -134,7 +175,18 @@ class StreamOutput:
             self.cleanup()
             return
 
+        if len(self._segments) == self._segments.maxlen:
+            del self._sequences[self._segments[0].sequence]
         self._segments.append(segment)
+        self._sequences[segment.sequence] = segment
+        self._parts = []
+        self._event.set()
+        self._event.clear()
+
+    @callback
+    def put_part(self, part: Part) -> None:
+        """Store a part of the segment that is being muxed."""
+        self._parts.append(part)
         self._event.set()
         self._event.clear()
 
@@ -151,6 +203,8 @@ class StreamOutput:
     def cleanup(self):
         """Handle cleanup."""
         self._segments = deque(maxlen=MAX_SEGMENTS)
+        self._sequences = {}
+        self._parts = []
         self._stream.remove_provider(self)
 
 
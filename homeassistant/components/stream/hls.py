@@ -1,13 +1,18 @@
 """Provide functionality to stream HLS."""
 from typing import Callable
 
-from aiohttp import web
+from aiohttp import hdrs, web
 
 from homeassistant.core import callback
 
 from .const import FORMAT_CONTENT_TYPE
 from .core import PROVIDERS, StreamOutput, StreamView
-from .fmp4utils import get_init, get_m4s
+
+# The init section can change when the stream restarts, clients revalidate it
+INIT_CACHE_CONTROL = "no-cache"
+# Media fragments never change once listed in the playlist, sequence numbers
+# are not reused while the access token is valid
+SEGMENT_CACHE_CONTROL = "max-age=60, immutable"
 
 
 @callback
@@ -25,16 +30,17 @@ class HlsPlaylistView(StreamView):
     url = r"/api/hls/{token:[a-f0-9]+}/playlist.m3u8"
     name = "api:stream:hls:playlist"
     cors_allowed = True
+    provider = "hls"
 
     async def handle(self, request, stream, sequence):
         """Return m3u8 playlist."""
         renderer = M3U8Renderer(stream)
-        track = stream.add_provider("hls")
+        track = stream.add_provider(self.provider)
         stream.start()
         # Wait for a segment to be ready
         if not track.segments:
             await track.recv()
-        headers = {"Content-Type": FORMAT_CONTENT_TYPE["hls"]}
+        headers = {"Content-Type": FORMAT_CONTENT_TYPE[self.provider]}
         return web.Response(
             body=renderer.render(track).encode("utf-8"), headers=headers
         )
@@ -46,15 +52,18 @@ class HlsInitView(StreamView):
     url = r"/api/hls/{token:[a-f0-9]+}/init.mp4"
     name = "api:stream:hls:init"
     cors_allowed = True
+    provider = "hls"
 
     async def handle(self, request, stream, sequence):
         """Return init.mp4."""
-        track = stream.add_provider("hls")
+        track = stream.add_provider(self.provider)
         segments = track.get_segment()
         if not segments:
             return web.HTTPNotFound()
-        headers = {"Content-Type": "video/mp4"}
-        return web.Response(body=get_init(segments[0].segment), headers=headers)
+        segment = segments[0]
+        return _fragment_response(
+            request, segment.init, segment.init_etag, "video/mp4", INIT_CACHE_CONTROL
+        )
 
 
 class HlsSegmentView(StreamView):
@@ -63,19 +72,32 @@ class HlsSegmentView(StreamView):
     url = r"/api/hls/{token:[a-f0-9]+}/segment/{sequence:\d+}.m4s"
     name = "api:stream:hls:segment"
     cors_allowed = True
+    provider = "hls"
 
     async def handle(self, request, stream, sequence):
         """Return fmp4 segment."""
-        track = stream.add_provider("hls")
+        track = stream.add_provider(self.provider)
         segment = track.get_segment(int(sequence))
         if not segment:
             return web.HTTPNotFound()
-        headers = {"Content-Type": "video/iso.segment"}
-        return web.Response(
-            body=get_m4s(segment.segment, int(sequence)), headers=headers,
+        return _fragment_response(
+            request,
+            segment.m4s,
+            segment.m4s_etag,
+            "video/iso.segment",
+            SEGMENT_CACHE_CONTROL,
         )
 
 
+def _fragment_response(request, body, etag, content_type, cache_control):
+    """Return the response for a fragment, or not modified if the client has it."""
+    headers = {hdrs.ETAG: etag, hdrs.CACHE_CONTROL: cache_control}
+    if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+        return web.Response(status=304, headers=headers)
+    headers[hdrs.CONTENT_TYPE] = content_type
+    return web.Response(body=body, headers=headers)
+
+
 class M3U8Renderer:
     """M3U8 Render Helper."""
 
@@ -0,0 +1,242 @@
+"""Provide functionality to stream low latency HLS."""
+import asyncio
+from typing import Callable, Optional, Tuple
+
+from aiohttp import web
+import async_timeout
+
+from homeassistant.core import callback
+
+from .const import FORMAT_CONTENT_TYPE, PART_TARGET_DURATION
+from .core import PROVIDERS, StreamView
+from .hls import (
+    SEGMENT_CACHE_CONTROL,
+    HlsInitView,
+    HlsSegmentView,
+    HlsStreamOutput,
+    M3U8Renderer,
+)
+
+# Blocking requests are held for at most this many target durations
+BLOCKING_TIMEOUT = 3
+# Parts of the segment this many segments ahead of the latest are not waited for
+MAX_SEQUENCE_AHEAD = 2
+
+
+@callback
+def async_setup_ll_hls(hass):
+    """Set up api endpoints."""
+    hass.http.register_view(LlHlsPlaylistView())
+    hass.http.register_view(LlHlsSegmentView())
+    hass.http.register_view(LlHlsInitView())
+    hass.http.register_view(LlHlsPartView())
+    return "/api/ll_hls/{}/playlist.m3u8"
+
+
+def _query_int(request, key) -> Optional[int]:
+    """Return an integer query parameter, raises ValueError if invalid."""
+    value = request.query.get(key)
+    return None if value is None else int(value)
+
+
+class LlHlsPlaylistView(StreamView):
+    """Stream view to serve a low latency M3U8 stream.
+
+    Requests with _HLS_msn and _HLS_part are held until the requested segment
+    or part is available.
+    """
+
+    url = r"/api/ll_hls/{token:[a-f0-9]+}/playlist.m3u8"
+    name = "api:stream:ll_hls:playlist"
+    cors_allowed = True
+
+    async def handle(self, request, stream, sequence):
+        """Return m3u8 playlist."""
+        try:
+            msn = _query_int(request, "_HLS_msn")
+            part = _query_int(request, "_HLS_part")
+        except ValueError:
+            return web.HTTPBadRequest()
+
+        if part is not None and msn is None:
+            return web.HTTPBadRequest()
+
+        renderer = LlM3U8Renderer(stream)
+        track = stream.add_provider("ll_hls")
+        stream.start()
+        # Wait for a segment to be ready
+        if not track.segments:
+            await track.recv()
+
+        last_part = track.last_part
+        if msn is not None and last_part is not None:
+            if msn > last_part[0] + MAX_SEQUENCE_AHEAD:
+                return web.HTTPBadRequest()
+
+            if part is None:
+                await track.async_wait(lambda: track.has_segment(msn))
+            else:
+                await track.async_wait(lambda: track.has_part(msn, part))
+
+        headers = {"Content-Type": FORMAT_CONTENT_TYPE["ll_hls"]}
+        return web.Response(
+            body=renderer.render(track).encode("utf-8"), headers=headers
+        )
+
+
+class LlHlsInitView(HlsInitView):
+    """Stream view to serve low latency HLS init.mp4."""
+
+    url = r"/api/ll_hls/{token:[a-f0-9]+}/init.mp4"
+    name = "api:stream:ll_hls:init"
+    provider = "ll_hls"
+
+
+class LlHlsSegmentView(HlsSegmentView):
+    """Stream view to serve a low latency HLS fmp4 segment."""
+
+    url = r"/api/ll_hls/{token:[a-f0-9]+}/segment/{sequence:\d+}.m4s"
+    name = "api:stream:ll_hls:segment"
+    provider = "ll_hls"
+
+
+class LlHlsPartView(StreamView):
+    """Stream view to serve a part of a low latency HLS segment.
+
+    Preload hints point to the next part, which is sent as soon as it exists.
+    """
+
+    url = r"/api/ll_hls/{token:[a-f0-9]+}/segment/{sequence:\d+\.\d+}.m4s"
+    name = "api:stream:ll_hls:part"
+    cors_allowed = True
+
+    async def handle(self, request, stream, sequence):
+        """Return fmp4 part."""
+        track = stream.add_provider("ll_hls")
+        sequence, index = (int(number) for number in sequence.split("."))
+
+        last_part = track.last_part
+        if last_part is not None and sequence <= last_part[0] + 1:
+            await track.async_wait(lambda: track.has_part(sequence, index))
+
+        part = track.get_part(sequence, index)
+        if not part:
+            return web.HTTPNotFound()
+        headers = {
+            "Content-Type": "video/iso.segment",
+            "Cache-Control": SEGMENT_CACHE_CONTROL,
+        }
+        return web.Response(body=part.data, headers=headers)
+
+
+class LlM3U8Renderer(M3U8Renderer):
+    """Low latency M3U8 Render Helper."""
+
+    @staticmethod
+    def render_preamble(track):
+        """Render preamble."""
+        return M3U8Renderer.render_preamble(track) + [
+            f"#EXT-X-PART-INF:PART-TARGET={PART_TARGET_DURATION:.3f}",
+            "#EXT-X-SERVER-CONTROL:CAN-BLOCK-RELOAD=YES,"
+            f"PART-HOLD-BACK={3 * PART_TARGET_DURATION:.3f}",
+        ]
+
+    @staticmethod
+    def render_parts(parts):
+        """Render the parts of a segment."""
+        return [
+            f"#EXT-X-PART:DURATION={part.duration:.3f},"
+            f'URI="./segment/{part.sequence}.{part.index}.m4s"'
+            + (",INDEPENDENT=YES" if part.independent else "")
+            for part in parts
+        ]
+
+    @staticmethod
+    def render_playlist(track):
+        """Render playlist."""
+        segments = track.get_segment()
+
+        if not segments:
+            return []
+
+        playlist = ["#EXT-X-MEDIA-SEQUENCE:{}".format(segments[0].sequence)]
+
+        for segment in segments:
+            playlist.extend(LlM3U8Renderer.render_parts(segment.parts))
+            playlist.extend(
+                [
+                    "#EXTINF:{:.04f},".format(float(segment.duration)),
+                    f"./segment/{segment.sequence}.m4s",
+                ]
+            )
+
+        parts = track.parts
+        playlist.extend(LlM3U8Renderer.render_parts(parts))
+
+        if parts:
+            next_part = parts[-1].sequence, parts[-1].index + 1
+        else:
+            next_part = segments[-1].sequence + 1, 0
+        playlist.append(
+            '#EXT-X-PRELOAD-HINT:TYPE=PART,URI="./segment/{}.{}.m4s"'.format(*next_part)
+        )
+
+        return playlist
+
+
+@PROVIDERS.register("ll_hls")
+class LlHlsStreamOutput(HlsStreamOutput):
+    """Represents low latency HLS Output formats."""
+
+    @property
+    def name(self) -> str:
+        """Return provider name."""
+        return "ll_hls"
+
+    @property
+    def part_duration(self) -> float:
+        """Return the target duration of parts."""
+        return PART_TARGET_DURATION
+
+    @property
+    def container_options(self) -> Callable[[int], dict]:
+        """Return Callable which takes a sequence number and returns container options."""
+        options = super().container_options
+        return lambda sequence: {
+            **options(sequence),
+            "frag_duration": str(int(PART_TARGET_DURATION * 1000000)),
+        }
+
+    @property
+    def last_part(self) -> Optional[Tuple[int, int]]:
+        """Return the sequence and index of the latest part."""
+        if self._parts:
+            return self._parts[-1].sequence, self._parts[-1].index
+        if self._segments:
+            segment = self._segments[-1]
+            return segment.sequence, max(len(segment.parts) - 1, 0)
+        return None
+
+    def has_segment(self, sequence: int) -> bool:
+        """Return if a segment has finished."""
+        return bool(self._segments) and self._segments[-1].sequence >= sequence
+
+    def has_part(self, sequence: int, index: int) -> bool:
+        """Return if a part or a later one is available."""
+        last_part = self.last_part
+        return last_part is not None and (sequence, index) <= last_part
+
+    async def async_wait(self, available: Callable[[], bool]) -> bool:
+        """Wait until something is available, for a few target durations."""
+        try:
+            async with async_timeout.timeout(
+                BLOCKING_TIMEOUT * (self.target_duration or 1)
+            ):
+                while not available():
+                    # The stream has ended
+                    if self._event.is_set():
+                        return False
+                    await self._event.wait()
+        except asyncio.TimeoutError:
+            return False
+        return True
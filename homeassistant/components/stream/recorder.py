@@ -1,5 +1,5 @@
 """Provide functionality to record stream."""
-
+from collections import deque
 import threading
 from typing import List
 
@@ -60,7 +60,7 @@ class RecorderOutput(StreamOutput):
         """Initialize recorder output."""
         super().__init__(stream, timeout)
         self.video_path = None
-        self._segments = []
+        self._segments = deque()
 
     @property
     def name(self) -> str:
@@ -84,9 +84,9 @@ class RecorderOutput(StreamOutput):
 
     def prepend(self, segments: List[Segment]) -> None:
         """Prepend segments to existing list."""
-        own_segments = self.segments
-        segments = [s for s in segments if s.sequence not in own_segments]
-        self._segments = segments + self._segments
+        segments = [s for s in segments if s.sequence not in self._sequences]
+        self._segments.extendleft(reversed(segments))
+        self._sequences.update((s.sequence, s) for s in segments)
 
     @callback
     def _timeout(self, _now=None):
@@ -103,5 +103,6 @@ class RecorderOutput(StreamOutput):
         )
         thread.start()
 
-        self._segments = []
+        self._segments = deque()
+        self._sequences = {}
         self._stream.remove_provider(self)
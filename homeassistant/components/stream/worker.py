@@ -1,12 +1,15 @@
 """Provides the worker thread needed for processing streams."""
 from collections import deque
+from fractions import Fraction
 import io
 import logging
+import zlib
 
 import av
 
-from .const import MIN_SEGMENT_DURATION, PACKETS_TO_WAIT_FOR_AUDIO
-from .core import Segment, StreamBuffer
+from .const import MIN_SEGMENT_DURATION, PACKETS_TO_WAIT_FOR_AUDIO, PART_TARGET_DURATION
+from .core import Part, Segment, StreamBuffer
+from .fmp4utils import find_fragments, get_init, get_m4s
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +37,82 @@ def create_stream_buffer(stream_output, video_stream, audio_stream, sequence):
     return StreamBuffer(segment, output, vstream, astream)
 
 
+def find_parts(buffer, sequence, end_time):
+    """Return the parts that were muxed into a buffer since the last call.
+
+    end_time is the time in the segment at which the latest part ends.
+    """
+    with buffer.segment.getbuffer() as data:
+        fragments = list(find_fragments(data, buffer.part_offset))
+        if not fragments:
+            return []
+
+        # The muxer cuts fragments at the part target duration, a longer
+        # estimate only means the packets arrived late
+        duration = min(
+            (end_time - buffer.part_start) / len(fragments), PART_TARGET_DURATION
+        )
+        parts = []
+        for start, end in fragments:
+            index = len(buffer.parts)
+            # Only the first part of a segment is known to start with a keyframe
+            part = Part(sequence, index, duration, index == 0, bytes(data[start:end]))
+            buffer.parts.append(part)
+            parts.append(part)
+
+    buffer.part_offset = fragments[-1][1]
+    buffer.part_start = end_time
+    return parts
+
+
+def create_segment(sequence, segment, duration, parts=()):
+    """Create a Segment from a finished buffer.
+
+    The init section and media fragment of fragmented mp4 segments are located
+    once here, instead of for every request that serves them.
+    """
+    with segment.getbuffer() as data:
+        try:
+            init = bytes(get_init(data))
+            m4s = bytes(get_m4s(data, sequence))
+        except StopIteration:
+            # Not a fragmented mp4
+            return Segment(sequence, segment, duration, parts=list(parts))
+
+    return Segment(
+        sequence,
+        segment,
+        duration,
+        parts=list(parts),
+        init=init,
+        init_etag=f'"{zlib.crc32(init):08x}"',
+        m4s=m4s,
+        m4s_etag=f'"{sequence}-{zlib.crc32(m4s):08x}"',
+    )
+
+
+def decode_keyframe(video_stream, packet):
+    """Decode a keyframe packet into a JPEG image.
+
+    A new decoder is used for each image, the decoder of the stream holds
+    frames back until it receives the packets that follow them.
+    """
+    decoder = av.CodecContext.create(video_stream.codec_context.name, "r")
+    decoder.extradata = video_stream.codec_context.extradata
+    frames = decoder.decode(packet) + decoder.decode(None)
+    if not frames:
+        return None
+
+    frame = frames[-1].reformat(format="yuvj420p")
+    encoder = av.CodecContext.create("mjpeg", "w")
+    encoder.width = frame.width
+    encoder.height = frame.height
+    encoder.pix_fmt = "yuvj420p"
+    encoder.time_base = Fraction(1, 1)
+    packets = encoder.encode(frame) + encoder.encode(None)
+    return b"".join(bytes(image_packet) for image_packet in packets)
+
+
 def stream_worker(hass, stream, quit_event):
     """Handle consuming streams."""
 
@@ -57,8 +136,11 @@ def stream_worker(hass, stream, quit_event):
     last_packet_was_without_dts = False
     # Holds the buffers for each stream provider
     outputs = None
-    # Keep track of the number of segments we've processed
-    sequence = 0
+    # The stream providers that get parts of the segments while they are muxed
+    part_outputs = []
+    # Keep track of the number of segments we've processed, continuing from
+    # the previous worker runs of this stream
+    sequence = stream.sequence
     # The video pts at the beginning of the segment
     segment_start_pts = None
     # Because of problems 1 and 2 below, we need to store the first few packets and replay them
@@ -122,10 +204,12 @@ def stream_worker(hass, stream, quit_event):
 
     def initialize_segment(video_pts):
         """Reset some variables and initialize outputs for each segment."""
-        nonlocal outputs, sequence, segment_start_pts
+        nonlocal outputs, part_outputs, sequence, segment_start_pts
         # Clear outputs and increment sequence
         outputs = {}
+        part_outputs = []
         sequence += 1
+        stream.sequence = sequence
         segment_start_pts = video_pts
         for stream_output in stream.outputs.values():
             if video_stream.name not in stream_output.video_codecs:
@@ -137,6 +221,26 @@ def stream_worker(hass, stream, quit_event):
                 buffer,
                 {video_stream: buffer.vstream, audio_stream: buffer.astream},
             )
+            if stream_output.part_duration:
+                part_outputs.append(stream_output.name)
+
+    def put_parts(packet_time):
+        """Send the parts flushed by muxing a packet to the providers using them."""
+        for fmt in part_outputs:
+            stream_output = stream.outputs.get(fmt)
+            for part in find_parts(outputs[fmt][0], sequence, packet_time):
+                if stream_output:
+                    hass.loop.call_soon_threadsafe(stream_output.put_part, part)
+
+    def put_image(packet):
+        """Decode a keyframe into the image of the stream."""
+        try:
+            image = decode_keyframe(video_stream, packet)
+        except av.AVError as ex:
+            _LOGGER.debug("Error decoding keyframe: %s", str(ex))
+            return
+        if image:
+            stream.set_image(image)
 
     def mux_video_packet(packet):
         # adjust pts and dts before muxing
@@ -196,20 +300,35 @@ def stream_worker(hass, stream, quit_event):
                 # Save segment to outputs
                 for fmt, (buffer, _) in outputs.items():
                     buffer.output.close()
+                    # The last part is only complete once the output is closed
+                    if fmt in part_outputs:
+                        find_parts(buffer, sequence, float(segment_duration))
                     if stream.outputs.get(fmt):
                         hass.loop.call_soon_threadsafe(
                             stream.outputs[fmt].put,
-                            Segment(sequence, buffer.segment, segment_duration,),
+                            create_segment(
+                                sequence,
+                                buffer.segment,
+                                segment_duration,
+                                buffer.parts,
+                            ),
                         )
 
                 # Reinitialize
                 initialize_segment(packet.pts)
 
+            if stream.wants_image():
+                put_image(packet)
+
         # Update last_dts processed
         last_dts[packet.stream] = packet.dts
         # mux video packets immediately, save audio packets to be muxed all at once
         if packet.stream == video_stream:
+            # Parts flushed while muxing a packet end where the packet starts
+            packet_time = float((packet.pts - segment_start_pts) * packet.time_base)
             mux_video_packet(packet)  # mutates packet timestamps
+            if part_outputs:
+                put_parts(packet_time)
         else:
             mux_audio_packet(packet)  # mutates packet timestamps
 
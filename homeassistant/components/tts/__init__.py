@@ -1,5 +1,6 @@
 """Provide functionality for TTS."""
 import asyncio
+from collections import OrderedDict
 import functools as ft
 import hashlib
 import io
@@ -7,6 +8,7 @@ import logging
 import mimetypes
 import os
 import re
+from timeit import default_timer as timer
 from typing import Dict, Optional
 
 from aiohttp import web
@@ -33,6 +35,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_per_platform, discovery
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.network import get_url
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.setup import async_prepare_setup_platform
 
@@ -52,14 +55,21 @@ CONF_CACHE_DIR = "cache_dir"
 CONF_LANG = "language"
 CONF_SERVICE_NAME = "service_name"
 CONF_TIME_MEMORY = "time_memory"
+CONF_MEMORY_SIZE = "memory_size"
 
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
 DEFAULT_TIME_MEMORY = 300
+DEFAULT_MEMORY_SIZE = 32
 DOMAIN = "tts"
 
 MEM_CACHE_FILENAME = "filename"
 MEM_CACHE_VOICE = "voice"
+MEM_CACHE_TIMER = "timer"
+
+STORAGE_KEY = f"{DOMAIN}.cache_index"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
 
 SERVICE_CLEAR_CACHE = "clear_cache"
 SERVICE_SAY = "say"
@@ -86,6 +96,9 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_TIME_MEMORY, default=DEFAULT_TIME_MEMORY): vol.All(
             vol.Coerce(int), vol.Range(min=60, max=57600)
         ),
+        vol.Optional(CONF_MEMORY_SIZE, default=DEFAULT_MEMORY_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
         vol.Optional(CONF_BASE_URL): cv.string,
         vol.Optional(CONF_SERVICE_NAME): cv.string,
     }
@@ -114,9 +127,12 @@ async def async_setup(hass, config):
         use_cache = conf.get(CONF_CACHE, DEFAULT_CACHE)
         cache_dir = conf.get(CONF_CACHE_DIR, DEFAULT_CACHE_DIR)
         time_memory = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
+        memory_size = conf.get(CONF_MEMORY_SIZE, DEFAULT_MEMORY_SIZE)
         base_url = conf.get(CONF_BASE_URL) or get_url(hass)
 
-        await tts.async_init_cache(use_cache, cache_dir, time_memory, base_url)
+        await tts.async_init_cache(
+            use_cache, cache_dir, time_memory, base_url, memory_size
+        )
     except (HomeAssistantError, KeyError) as err:
         _LOGGER.error("Error on cache init %s", err)
         return False
@@ -236,14 +252,29 @@ class SpeechManager:
         self.use_cache = DEFAULT_CACHE
         self.cache_dir = DEFAULT_CACHE_DIR
         self.time_memory = DEFAULT_TIME_MEMORY
+        # Bytes of voice data to keep in memory, least recently used is dropped
+        self.memory_size = DEFAULT_MEMORY_SIZE * 2 ** 20
         self.base_url = None
         self.file_cache = {}
-        self.mem_cache = {}
-
-    async def async_init_cache(self, use_cache, cache_dir, time_memory, base_url):
+        self.mem_cache = OrderedDict()
+        self.mem_cache_size = 0
+        self._cache_dir_mtime = None
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._index_changed = None
+        self._save_index_handle = None
+
+    async def async_init_cache(
+        self,
+        use_cache,
+        cache_dir,
+        time_memory,
+        base_url,
+        memory_size=DEFAULT_MEMORY_SIZE,
+    ):
         """Init config folder and load file cache."""
         self.use_cache = use_cache
         self.time_memory = time_memory
+        self.memory_size = memory_size * 2 ** 20
         self.base_url = base_url
 
         try:
@@ -253,6 +284,21 @@ class SpeechManager:
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}")
 
+        # The index avoids listing large cache dirs on every start, it is
+        # only used if the cache dir didn't change since it was saved.
+        index = await self._store.async_load()
+        self._cache_dir_mtime = await self.hass.async_add_executor_job(
+            _get_cache_dir_mtime, self.cache_dir
+        )
+        if (
+            index
+            and self._cache_dir_mtime is not None
+            and index["cache_dir"] == self.cache_dir
+            and index["mtime"] == self._cache_dir_mtime
+        ):
+            self.file_cache.update(index["files"])
+            return
+
         try:
             cache_files = await self.hass.async_add_executor_job(
                 _get_cache_files, self.cache_dir
@@ -262,10 +308,52 @@ class SpeechManager:
 
         if cache_files:
             self.file_cache.update(cache_files)
+        self._async_save_index()
+
+    @callback
+    def _async_save_index(self):
+        """Schedule saving the index of the file cache.
+
+        The index is not written on shutdown, an outdated index only means the
+        cache dir is listed again at the next start. So a short lived instance
+        leaves the storage alone.
+        """
+        self._index_changed = timer()
+        if self._save_index_handle is None:
+            self._save_index_handle = self.hass.loop.call_later(
+                STORAGE_SAVE_DELAY, self._async_write_index
+            )
+
+    @callback
+    def _async_write_index(self):
+        """Write the index once it didn't change for a while.
+
+        The elapsed time is measured on the wall clock, so handles run early
+        by simulated time changes are rescheduled.
+        """
+        remaining = STORAGE_SAVE_DELAY - (timer() - self._index_changed)
+        if remaining > 0:
+            self._save_index_handle = self.hass.loop.call_later(
+                remaining, self._async_write_index
+            )
+            return
+
+        self._save_index_handle = None
+        self.hass.async_create_task(self._store.async_save(self._index_to_save()))
+
+    @callback
+    def _index_to_save(self):
+        """Return the index of the file cache to store."""
+        return {
+            "cache_dir": self.cache_dir,
+            "mtime": self._cache_dir_mtime,
+            "files": self.file_cache,
+        }
 
     async def async_clear_cache(self):
         """Read file cache and delete files."""
-        self.mem_cache = {}
+        for key in list(self.mem_cache):
+            self._async_remove_from_memcache(key)
 
         def remove_files():
             """Remove files from filesystem."""
@@ -274,9 +362,11 @@ class SpeechManager:
                     os.remove(os.path.join(self.cache_dir, filename))
                 except OSError as err:
                     _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+            return _get_cache_dir_mtime(self.cache_dir)
 
-        await self.hass.async_add_executor_job(remove_files)
+        self._cache_dir_mtime = await self.hass.async_add_executor_job(remove_files)
         self.file_cache = {}
+        self._async_save_index()
 
     @callback
     def async_register_engine(self, engine, provider, config):
@@ -326,10 +416,10 @@ class SpeechManager:
         # Is speech already in memory
         if key in self.mem_cache:
             filename = self.mem_cache[key][MEM_CACHE_FILENAME]
-        # Is file store in file cache
+            self.mem_cache.move_to_end(key)
+        # Is file store in file cache, it is served from disk
         elif use_cache and key in self.file_cache:
             filename = self.file_cache[key]
-            self.hass.async_create_task(self.async_file_to_mem(key))
         # Load speech from provider into memory
         else:
             filename = await self.async_get_tts_audio(
@@ -373,12 +463,19 @@ class SpeechManager:
             """Store speech to filesystem."""
             with open(voice_file, "wb") as speech:
                 speech.write(data)
+            return _get_cache_dir_mtime(self.cache_dir)
 
         try:
-            await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[key] = filename
+            mtime = await self.hass.async_add_executor_job(save_speech)
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+
+        self.file_cache[key] = filename
+        self._cache_dir_mtime = mtime
+        self._async_save_index()
+        # The voice can now be dropped from memory if needed
+        self._async_evict_memcache()
 
     async def async_file_to_mem(self, key):
         """Load voice from file cache into memory.
@@ -399,40 +496,101 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError:
-            del self.file_cache[key]
+            self._async_remove_from_file_cache(key)
             raise HomeAssistantError(f"Can't read {voice_file}")
 
         self._async_store_to_memcache(key, filename, data)
 
+    @callback
+    def _async_remove_from_file_cache(self, key):
+        """Forget a voice file that is gone from the cache dir."""
+        del self.file_cache[key]
+        self._async_save_index()
+
     @callback
     def _async_store_to_memcache(self, key, filename, data):
         """Store data to memcache and set timer to remove it."""
-        self.mem_cache[key] = {MEM_CACHE_FILENAME: filename, MEM_CACHE_VOICE: data}
+        self._async_remove_from_memcache(key)
+        self.mem_cache[key] = {
+            MEM_CACHE_FILENAME: filename,
+            MEM_CACHE_VOICE: data,
+            MEM_CACHE_TIMER: self.hass.loop.call_later(
+                self.time_memory, self._async_remove_from_memcache, key
+            ),
+        }
+        self.mem_cache_size += len(data)
+        self._async_evict_memcache()
 
-        @callback
-        def async_remove_from_mem():
-            """Cleanup memcache."""
-            self.mem_cache.pop(key, None)
+    @callback
+    def _async_remove_from_memcache(self, key):
+        """Remove data from memcache."""
+        entry = self.mem_cache.pop(key, None)
+        if entry is None:
+            return
 
-        self.hass.loop.call_later(self.time_memory, async_remove_from_mem)
+        entry[MEM_CACHE_TIMER].cancel()
+        self.mem_cache_size -= len(entry[MEM_CACHE_VOICE])
 
-    async def async_read_tts(self, filename):
-        """Read a voice file and return binary.
+    @callback
+    def _async_evict_memcache(self):
+        """Drop least recently used voices until memcache is within budget.
 
-        This method is a coroutine.
+        Only voices that are in the file cache are dropped, other voices
+        can't be served anymore until their timer expires. The most recent
+        voice is always kept.
         """
+        for key in list(self.mem_cache)[:-1]:
+            if self.mem_cache_size <= self.memory_size:
+                break
+            if key in self.file_cache:
+                self._async_remove_from_memcache(key)
+
+    @staticmethod
+    def _filename_key(filename):
+        """Return the cache key of a voice filename."""
         record = _RE_VOICE_FILE.match(filename.lower())
         if not record:
             raise HomeAssistantError("Wrong tts file format!")
 
-        key = KEY_PATTERN.format(
+        return KEY_PATTERN.format(
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
+    async def async_get_tts_file(self, filename):
+        """Return the path of a voice file to serve from disk.
+
+        Returns None if the voice is in memory.
+
+        This method is a coroutine.
+        """
+        key = self._filename_key(filename)
+
+        if key in self.mem_cache:
+            return None
+
+        if key not in self.file_cache:
+            raise HomeAssistantError(f"{key} not in cache!")
+
+        voice_file = os.path.join(self.cache_dir, self.file_cache[key])
+        if not await self.hass.async_add_executor_job(os.path.isfile, voice_file):
+            self._async_remove_from_file_cache(key)
+            raise HomeAssistantError(f"Can't read {voice_file}")
+
+        return voice_file
+
+    async def async_read_tts(self, filename):
+        """Read a voice file and return binary.
+
+        This method is a coroutine.
+        """
+        key = self._filename_key(filename)
+
         if key not in self.mem_cache:
             if key not in self.file_cache:
                 raise HomeAssistantError(f"{key} not in cache!")
             await self.async_file_to_mem(key)
+        else:
+            self.mem_cache.move_to_end(key)
 
         content, _ = mimetypes.guess_type(filename)
         return content, self.mem_cache[key][MEM_CACHE_VOICE]
@@ -517,6 +675,14 @@ def _init_tts_cache_dir(hass, cache_dir):
     return cache_dir
 
 
+def _get_cache_dir_mtime(cache_dir):
+    """Return the modification time of the cache folder."""
+    try:
+        return os.stat(cache_dir).st_mtime_ns
+    except OSError:
+        return None
+
+
 def _get_cache_files(cache_dir):
     """Return a dict of given engine files."""
     cache = {}
@@ -586,6 +752,11 @@ class TextToSpeechView(HomeAssistantView):
     async def get(self, request: web.Request, filename: str) -> web.Response:
         """Start a get request."""
         try:
+            # Voices that are only on disk are streamed from the file
+            voice_file = await self.tts.async_get_tts_file(filename)
+            if voice_file is not None:
+                return web.FileResponse(voice_file)
+
             content, data = await self.tts.async_read_tts(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
@@ -11,7 +11,17 @@ from homeassistant.exceptions import HomeAssistantError, ServiceNotFound, Unauth
 from homeassistant.helpers import config_validation as cv, entity
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.service import async_get_all_descriptions
-from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.loader import (
+    IntegrationNotFound,
+    async_get_integration,
+    get_import_times,
+)
+from homeassistant.setup import (
+    async_get_setup_critical_path,
+    async_get_setup_timeline,
+    async_get_setup_trace_events,
+    async_save_setup_trace,
+)
 
 from . import const, decorators, messages
 
@@ -31,6 +41,12 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_manifest_get)
+    async_reg(hass, handle_integration_import_times)
+    async_reg(hass, handle_integration_setup_timeline)
+    async_reg(hass, handle_integration_setup_timeline_export)
+    async_reg(hass, handle_script_trace)
+    async_reg(hass, handle_script_traces)
+    async_reg(hass, handle_script_trace_export)
     async_reg(hass, handle_entity_source)
 
 
@@ -221,6 +237,115 @@ async def handle_manifest_get(hass, connection, msg):
         connection.send_error(msg["id"], const.ERR_NOT_FOUND, "Integration not found")
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "integration/import_times"})
+def handle_integration_import_times(hass, connection, msg):
+    """Handle integration import times command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"module": module, "seconds": duration}
+            for module, duration in get_import_times(hass).items()
+        ],
+    )
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "integration/setup_timeline",
+        vol.Optional("trace_events", default=False): bool,
+    }
+)
+def handle_integration_setup_timeline(hass, connection, msg):
+    """Handle integration setup timeline command."""
+    if msg["trace_events"]:
+        connection.send_result(msg["id"], async_get_setup_trace_events(hass))
+        return
+
+    connection.send_result(
+        msg["id"],
+        {
+            "timeline": async_get_setup_timeline(hass),
+            "critical_path": async_get_setup_critical_path(hass),
+        },
+    )
+
+
+@decorators.require_admin
+@decorators.websocket_command(
+    {vol.Required("type"): "integration/setup_timeline/export"}
+)
+@decorators.async_response
+async def handle_integration_setup_timeline_export(hass, connection, msg):
+    """Handle writing the setup timeline to a trace file."""
+    try:
+        path = await async_save_setup_trace(hass)
+    except HomeAssistantError as err:
+        connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
+        return
+
+    connection.send_result(msg["id"], {"path": path})
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command(
+    {vol.Required("type"): "script/trace", vol.Optional("enabled"): bool}
+)
+def handle_script_trace(hass, connection, msg):
+    """Handle enabling or disabling the tracing of script runs."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import script
+
+    if "enabled" in msg:
+        script.async_set_trace_enabled(hass, msg["enabled"])
+
+    connection.send_result(msg["id"], {"enabled": script.async_is_trace_enabled(hass)})
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "script/traces",
+        vol.Optional("domain"): str,
+        vol.Optional("name"): str,
+        vol.Optional("trace_events", default=False): bool,
+    }
+)
+def handle_script_traces(hass, connection, msg):
+    """Handle getting the recorded runs of scripts."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import script
+
+    if msg["trace_events"]:
+        result = script.async_get_trace_events(hass, msg.get("domain"), msg.get("name"))
+    else:
+        result = script.async_get_traces(hass, msg.get("domain"), msg.get("name"))
+
+    connection.send_result(msg["id"], result)
+
+
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "script/trace/export"})
+@decorators.async_response
+async def handle_script_trace_export(hass, connection, msg):
+    """Handle writing the recorded runs of scripts to a trace file."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import script
+
+    try:
+        path = await script.async_save_trace(hass)
+    except HomeAssistantError as err:
+        connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
+        return
+
+    connection.send_result(msg["id"], {"path": path})
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(hass, connection, msg):
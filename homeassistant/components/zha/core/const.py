@@ -219,6 +219,17 @@ class RadioType(enum.Enum):
         return self._desc
 
 
+# Number of mains powered devices refreshed concurrently after startup, roughly
+# matching how many requests each radio can keep in flight
+STARTUP_REFRESH_CONCURRENCY = {
+    RadioType.ezsp: 8,
+    RadioType.deconz: 4,
+    RadioType.ti_cc: 4,
+    RadioType.zigate: 2,
+    RadioType.xbee: 2,
+}
+DEFAULT_STARTUP_REFRESH_CONCURRENCY = 2
+
 REPORT_CONFIG_MAX_INT = 900
 REPORT_CONFIG_MAX_INT_BATTERY_SAVE = 10800
 REPORT_CONFIG_MIN_INT = 30
@@ -441,6 +441,9 @@ class ZHADevice(LogMixin):
             device_info["user_given_name"] = reg_device.name_by_user
             device_info["device_reg_id"] = reg_device.id
             device_info["area_id"] = reg_device.area_id
+        device_info["initialization_time"] = self.gateway.initialization_timings.get(
+            self.ieee
+        )
         return device_info
 
     @callback
@@ -3,7 +3,6 @@
 import asyncio
 import collections
 from datetime import timedelta
-import itertools
 import logging
 import os
 import time
@@ -53,10 +52,12 @@ from .const import (
     DEBUG_LEVELS,
     DEBUG_RELAY_LOGGERS,
     DEFAULT_DATABASE_NAME,
+    DEFAULT_STARTUP_REFRESH_CONCURRENCY,
     DOMAIN,
     SIGNAL_ADD_ENTITIES,
     SIGNAL_GROUP_MEMBERSHIP_CHANGE,
     SIGNAL_REMOVE,
+    STARTUP_REFRESH_CONCURRENCY,
     UNKNOWN_MANUFACTURER,
     UNKNOWN_MODEL,
     ZHA_GW_MSG,
@@ -103,13 +104,18 @@ class ZHAGateway:
         self._config = config
         self._devices = {}
         self._groups = {}
+        self._groups_by_name = {}
         self.coordinator_zha_device = None
         self._device_registry = collections.defaultdict(list)
+        self._entity_references = {}
         self.zha_storage = None
         self.ha_device_registry = None
         self.ha_entity_registry = None
         self.application_controller = None
         self.radio_description = None
+        self.radio_concurrency = DEFAULT_STARTUP_REFRESH_CONCURRENCY
+        self.initialization_timings = {}
+        self._fetch_updated_state_task = None
         self._log_levels = {
             DEBUG_LEVEL_ORIGINAL: async_capture_log_levels(),
             DEBUG_LEVEL_CURRENT: async_capture_log_levels(),
@@ -131,6 +137,9 @@ class ZHAGateway:
 
         app_controller_cls = RadioType[radio_type].controller
         self.radio_description = RadioType[radio_type].description
+        self.radio_concurrency = STARTUP_REFRESH_CONCURRENCY.get(
+            RadioType[radio_type], DEFAULT_STARTUP_REFRESH_CONCURRENCY
+        )
 
         app_config = self._config.get(CONF_ZIGPY, {})
         database = self._config.get(
@@ -197,29 +206,68 @@ class ZHAGateway:
             discovery.GROUP_PROBE.discover_group_entities(zha_group)
 
     async def async_initialize_devices_and_entities(self) -> None:
-        """Initialize devices and load entities."""
-        semaphore = asyncio.Semaphore(2)
-
-        async def _throttle(zha_device: zha_typing.ZhaDeviceType, cached: bool):
-            async with semaphore:
-                await zha_device.async_initialize(from_cache=cached)
+        """Initialize devices and load entities.
 
-        _LOGGER.debug("Loading battery powered devices")
+        All devices are initialized from the zigpy attribute cache first, which
+        does not touch the radio, so entities can be created right away. The
+        current state of mains powered devices is then fetched in the background.
+        """
+        _LOGGER.debug("Loading all devices from cache")
         await asyncio.gather(
             *[
-                _throttle(dev, cached=True)
+                self._async_timed_initialize(dev, from_cache=True)
                 for dev in self.devices.values()
-                if not dev.is_mains_powered
             ]
         )
+        self._fetch_updated_state_task = self._hass.async_create_task(
+            self.async_fetch_updated_state_mains()
+        )
 
-        _LOGGER.debug("Loading mains powered devices")
-        await asyncio.gather(
-            *[
-                _throttle(dev, cached=False)
+    async def async_fetch_updated_state_mains(self) -> None:
+        """Fetch updated state for mains powered devices."""
+        semaphore = asyncio.Semaphore(self.radio_concurrency)
+
+        async def _throttle(zha_device: zha_typing.ZhaDeviceType):
+            async with semaphore:
+                await self._async_timed_initialize(zha_device, from_cache=False)
+
+        # unavailable devices are refreshed when they show up again, so they
+        # should not hold up the devices that are online
+        devices = sorted(
+            (
+                dev
                 for dev in self.devices.values()
-                if dev.is_mains_powered
-            ]
+                if dev.is_mains_powered and dev.available
+            ),
+            key=lambda dev: dev.last_seen or 0,
+            reverse=True,
+        )
+        _LOGGER.debug(
+            "Fetching current state for %s mains powered devices, concurrency: %s",
+            len(devices),
+            self.radio_concurrency,
+        )
+        start = time.monotonic()
+        await asyncio.gather(*[_throttle(dev) for dev in devices])
+        _LOGGER.debug(
+            "Completed fetching current state for mains powered devices in %.2fs",
+            time.monotonic() - start,
+        )
+
+    async def _async_timed_initialize(
+        self, zha_device: zha_typing.ZhaDeviceType, from_cache: bool
+    ) -> None:
+        """Initialize a device and record how long it took."""
+        start = time.monotonic()
+        await zha_device.async_initialize(from_cache=from_cache)
+        duration = time.monotonic() - start
+        self.initialization_timings[zha_device.ieee] = duration
+        _LOGGER.debug(
+            "[%s](%s) initialized %s in %.3fs",
+            zha_device.nwk,
+            zha_device.name,
+            "from cache" if from_cache else "from device",
+            duration,
         )
 
     def device_joined(self, device):
@@ -300,6 +348,7 @@ class ZHAGateway:
         """Handle zigpy group removed event."""
         self._send_group_gateway_message(zigpy_group, ZHA_GW_MSG_GROUP_REMOVED)
         zha_group = self._groups.pop(zigpy_group.group_id, None)
+        self._groups_by_name.pop(zha_group.name, None)
         zha_group.info("group_removed")
         self._cleanup_group_entity_registry_entries(zigpy_group)
 
@@ -332,6 +381,9 @@ class ZHAGateway:
         """Handle device being removed from the network."""
         zha_device = self._devices.pop(device.ieee, None)
         entity_refs = self._device_registry.pop(device.ieee, None)
+        self.initialization_timings.pop(device.ieee, None)
+        for entity_ref in entity_refs or []:
+            self._entity_references.pop(entity_ref.reference_id, None)
         if zha_device is not None:
             device_info = zha_device.zha_device_info
             zha_device.async_cleanup_handles()
@@ -360,21 +412,15 @@ class ZHAGateway:
     @callback
     def async_get_group_by_name(self, group_name: str) -> Optional[ZhaGroupType]:
         """Get ZHA group by name."""
-        for group in self.groups.values():
-            if group.name == group_name:
-                return group
-        return None
+        return self._groups_by_name.get(group_name)
 
     def get_entity_reference(self, entity_id):
         """Return entity reference for given entity_id if found."""
-        for entity_reference in itertools.chain.from_iterable(
-            self.device_registry.values()
-        ):
-            if entity_id == entity_reference.reference_id:
-                return entity_reference
+        return self._entity_references.get(entity_id)
 
     def remove_entity_reference(self, entity):
         """Remove entity reference for given entity_id if found."""
+        self._entity_references.pop(entity.entity_id, None)
         if entity.zha_device.ieee in self.device_registry:
             entity_refs = self.device_registry.get(entity.zha_device.ieee)
             self.device_registry[entity.zha_device.ieee] = [
@@ -435,15 +481,15 @@ class ZHAGateway:
         remove_future,
     ):
         """Record the creation of a hass entity associated with ieee."""
-        self._device_registry[ieee].append(
-            EntityReference(
-                reference_id=reference_id,
-                zha_device=zha_device,
-                cluster_channels=cluster_channels,
-                device_info=device_info,
-                remove_future=remove_future,
-            )
+        entity_reference = EntityReference(
+            reference_id=reference_id,
+            zha_device=zha_device,
+            cluster_channels=cluster_channels,
+            device_info=device_info,
+            remove_future=remove_future,
         )
+        self._device_registry[ieee].append(entity_reference)
+        self._entity_references[reference_id] = entity_reference
 
     @callback
     def async_enable_debug_mode(self):
@@ -495,6 +541,7 @@ class ZHAGateway:
         if zha_group is None:
             zha_group = ZHAGroup(self._hass, self, zigpy_group)
             self._groups[zigpy_group.group_id] = zha_group
+            self._groups_by_name[zha_group.name] = zha_group
         return zha_group
 
     @callback
@@ -626,6 +673,10 @@ class ZHAGateway:
     async def shutdown(self):
         """Stop ZHA Controller Application."""
         _LOGGER.debug("Shutting down ZHA ControllerApplication")
+        if self._fetch_updated_state_task is not None:
+            self._fetch_updated_state_task.cancel()
+            await asyncio.wait([self._fetch_updated_state_task])
+            self._fetch_updated_state_task = None
         await self.application_controller.shutdown()
 
 
@@ -16,6 +16,8 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_RADIUS,
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_UNAVAILABLE,
 )
@@ -30,9 +32,16 @@ from homeassistant.helpers import (
     storage,
 )
 from homeassistant.loader import bind_hass
-from homeassistant.util.location import distance
-
-from .const import ATTR_PASSIVE, ATTR_RADIUS, CONF_PASSIVE, DOMAIN, HOME_ZONE
+from homeassistant.util.location import GridIndex, distance
+
+from .const import (
+    ATTR_PASSIVE,
+    ATTR_RADIUS,
+    CONF_PASSIVE,
+    DATA_INDEX,
+    DOMAIN,
+    HOME_ZONE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -87,6 +96,59 @@ STORAGE_KEY = DOMAIN
 STORAGE_VERSION = 1
 
 
+class ZoneIndex:
+    """Spatial index of the zone states, following the state machine."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Index the current zones and listen for changes."""
+        self.grid = GridIndex()
+
+        for state in hass.states.async_all():
+            if state.domain == DOMAIN:
+                self._async_update(state.entity_id, state)
+
+        self._unsub_listener = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed
+        )
+
+    @callback
+    def async_remove(self) -> None:
+        """Stop following the state machine."""
+        self._unsub_listener()
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Update the index when a zone changes."""
+        entity_id = event.data["entity_id"]
+        if entity_id.startswith(f"{DOMAIN}."):
+            self._async_update(entity_id, event.data.get("new_state"))
+
+    @callback
+    def _async_update(self, entity_id: str, state: Optional[State]) -> None:
+        """Update the location of a zone."""
+        try:
+            location = (
+                float(state.attributes[ATTR_LATITUDE]),  # type: ignore
+                float(state.attributes[ATTR_LONGITUDE]),  # type: ignore
+                float(state.attributes.get(ATTR_RADIUS, 0)),  # type: ignore
+            )
+        except (AttributeError, KeyError, TypeError, ValueError):
+            self.grid.remove(entity_id)
+            return
+
+        if self.grid.items.get(entity_id) != location:
+            self.grid.add(entity_id, *location)
+
+
+@callback
+def async_get_index(hass: HomeAssistant) -> Optional[ZoneIndex]:
+    """Return the spatial index of the zones, None if zone is not set up.
+
+    This method must be run in the event loop.
+    """
+    return cast(Optional[ZoneIndex], hass.data.get(DATA_INDEX))
+
+
 @bind_hass
 def async_active_zone(
     hass: HomeAssistant, latitude: float, longitude: float, radius: int = 0
@@ -95,17 +157,25 @@ def async_active_zone(
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        cast(State, hass.states.get(entity_id))
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
-    )
+    # Only the zones close enough to contain the location are compared. Sort
+    # entity IDs so that we are deterministic if equal distance to 2 zones.
+    index = async_get_index(hass)
+    if index is None:
+        candidates = hass.states.async_entity_ids(DOMAIN)
+    else:
+        candidates = index.grid.candidates(latitude, longitude, radius)
 
     min_dist = None
     closest = None
 
-    for zone in zones:
-        if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
+    for entity_id in sorted(candidates):
+        zone = hass.states.get(entity_id)
+
+        if (
+            zone is None
+            or zone.state == STATE_UNAVAILABLE
+            or zone.attributes.get(ATTR_PASSIVE)
+        ):
             continue
 
         zone_dist = distance(
@@ -176,6 +246,16 @@ class ZoneStorageCollection(collection.StorageCollection):
 
 async def async_setup(hass: HomeAssistant, config: Dict) -> bool:
     """Set up configured zones as well as Home Assistant zone if necessary."""
+    index = hass.data[DATA_INDEX] = ZoneIndex(hass)
+
+    @callback
+    def async_remove_index(_event: Event) -> None:
+        """Stop indexing the zones."""
+        hass.data.pop(DATA_INDEX, None)
+        index.async_remove()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_remove_index)
+
     component = entity_component.EntityComponent(_LOGGER, DOMAIN, hass)
     id_manager = collection.IDManager()
 
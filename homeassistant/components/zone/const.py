@@ -3,5 +3,6 @@
 CONF_PASSIVE = "passive"
 DOMAIN = "zone"
 HOME_ZONE = "home"
+DATA_INDEX = "zone_index"
 ATTR_PASSIVE = "passive"
 ATTR_RADIUS = "radius"
@@ -5,7 +5,17 @@ from datetime import datetime, timedelta
 import functools as ft
 import logging
 import sys
-from typing import Any, Callable, Container, List, Optional, Set, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Container,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Union,
+    cast,
+)
 
 from homeassistant.components import zone as zone_cmp
 from homeassistant.components.device_automation import (
@@ -37,6 +47,7 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError, TemplateError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import state as state_helper
 from homeassistant.helpers.sun import get_astral_event_date
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import ConfigType, TemplateVarsType
@@ -50,6 +61,10 @@ _LOGGER = logging.getLogger(__name__)
 
 ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool]
 
+# Conditions that render templates are checked after all cheaper conditions
+COST_CHEAP = 0
+COST_TEMPLATE = 1
+
 
 async def async_from_config(
     hass: HomeAssistant, config: ConfigType, config_validation: bool = True
@@ -85,6 +100,48 @@ async def async_from_config(
     return cast(ConditionCheckerType, factory(config, config_validation))
 
 
+def _flatten_conditions(
+    conditions: Iterable[ConfigType], condition_type: str
+) -> List[ConfigType]:
+    """Inline the conditions of nested groups of the same type.
+
+    A nested group is evaluated the same way as its parent, so its conditions
+    can be checked directly instead of through another checker.
+    """
+    flat: List[ConfigType] = []
+
+    for entry in conditions:
+        if entry.get(CONF_CONDITION) == condition_type:
+            flat.extend(_flatten_conditions(entry["conditions"], condition_type))
+        else:
+            flat.append(entry)
+
+    return flat
+
+
+def _condition_cost(config: ConfigType) -> int:
+    """Return the relative cost of checking a condition."""
+    condition_type = config.get(CONF_CONDITION)
+
+    if condition_type in ("and", "or", "not"):
+        return max(
+            (_condition_cost(entry) for entry in config["conditions"]),
+            default=COST_CHEAP,
+        )
+
+    if condition_type == "template" or (
+        condition_type == "numeric_state" and CONF_VALUE_TEMPLATE in config
+    ):
+        return COST_TEMPLATE
+
+    return COST_CHEAP
+
+
+def _sorted_conditions(conditions: List[ConfigType]) -> List[ConfigType]:
+    """Order conditions so cheap checks can short-circuit template rendering."""
+    return sorted(conditions, key=_condition_cost)
+
+
 async def async_and_from_config(
     hass: HomeAssistant, config: ConfigType, config_validation: bool = True
 ) -> ConditionCheckerType:
@@ -92,7 +149,10 @@ async def async_and_from_config(
     if config_validation:
         config = cv.AND_CONDITION_SCHEMA(config)
     checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
+        await async_from_config(hass, entry, False)
+        for entry in _sorted_conditions(
+            _flatten_conditions(config["conditions"], "and")
+        )
     ]
 
     def if_and_condition(
@@ -119,7 +179,8 @@ async def async_or_from_config(
     if config_validation:
         config = cv.OR_CONDITION_SCHEMA(config)
     checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
+        await async_from_config(hass, entry, False)
+        for entry in _sorted_conditions(_flatten_conditions(config["conditions"], "or"))
     ]
 
     def if_or_condition(
@@ -145,7 +206,8 @@ async def async_not_from_config(
     if config_validation:
         config = cv.NOT_CONDITION_SCHEMA(config)
     checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
+        await async_from_config(hass, entry, False)
+        for entry in _sorted_conditions(_flatten_conditions(config["conditions"], "or"))
     ]
 
     def if_not_condition(
@@ -198,8 +260,20 @@ def async_numeric_state(
     if isinstance(entity, str):
         entity = hass.states.get(entity)
 
+    fvalue = _numeric_value(entity, value_template, variables, attribute)
+
+    return fvalue is not None and _in_range(fvalue, below, above)
+
+
+def _numeric_value(
+    entity: Optional[State],
+    value_template: Optional[Template] = None,
+    variables: TemplateVarsType = None,
+    attribute: Optional[str] = None,
+) -> Optional[float]:
+    """Return the numeric value of a state or None if it has none."""
     if entity is None or (attribute is not None and attribute not in entity.attributes):
-        return False
+        return None
 
     value: Any = None
     if value_template is None:
@@ -214,21 +288,24 @@ def async_numeric_state(
             value = value_template.async_render(variables)
         except TemplateError as ex:
             _LOGGER.error("Template error: %s", ex)
-            return False
+            return None
 
     if value in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-        return False
+        return None
 
     try:
-        fvalue = float(value)
+        return float(value)
     except ValueError:
         _LOGGER.warning(
             "Value cannot be processed as a number: %s (Offending entity: %s)",
             entity,
             value,
         )
-        return False
+        return None
 
+
+def _in_range(fvalue: float, below: Optional[float], above: Optional[float]) -> bool:
+    """Test if a value is within the thresholds."""
     if below is not None and fvalue >= below:
         return False
 
@@ -250,19 +327,66 @@ def async_numeric_state_from_config(
     above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
 
+    if below is not None and above is not None and above >= below:
+        _LOGGER.warning(
+            "Numeric state condition for %s can never be true: above %s is not "
+            "below %s",
+            ", ".join(entity_ids),
+            above,
+            below,
+        )
+
+        def if_never(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+            """Test numeric state condition with an empty range."""
+            return False
+
+        return if_never
+
+    if value_template is not None:
+
+        def if_numeric_template(
+            hass: HomeAssistant, variables: TemplateVarsType = None
+        ) -> bool:
+            """Test numeric state condition."""
+            value_template.hass = hass
+
+            return all(
+                async_numeric_state(
+                    hass, entity_id, below, above, value_template, variables, attribute
+                )
+                for entity_id in entity_ids
+            )
+
+        return if_numeric_template
+
     def if_numeric_state(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
         """Test numeric state condition."""
-        if value_template is not None:
-            value_template.hass = hass
+        for entity_id in entity_ids:
+            entity = hass.states.get(entity_id)
 
-        return all(
-            async_numeric_state(
-                hass, entity_id, below, above, value_template, variables, attribute
-            )
-            for entity_id in entity_ids
-        )
+            if entity is None:
+                return False
+
+            # The numeric view is computed once per state object and shared
+            # with the exporters of state changes.
+            numeric = state_helper.numeric_state(hass, entity)
+
+            if attribute is None:
+                fvalue = numeric.value if numeric.is_number else None
+            else:
+                fvalue = numeric.attributes.get(attribute)
+
+            # Values that are not numbers, like numeric strings in attributes,
+            # go through the regular conversion.
+            if fvalue is None:
+                fvalue = _numeric_value(entity, attribute=attribute)
+
+            if fvalue is None or not _in_range(fvalue, below, above):
+                return False
+
+        return True
 
     return if_numeric_state
 
@@ -54,6 +54,8 @@ from homeassistant.const import (
     CONF_EVENT_DATA,
     CONF_EVENT_DATA_TEMPLATE,
     CONF_FOR,
+    CONF_MAX_PARALLEL,
+    CONF_PARALLEL,
     CONF_PLATFORM,
     CONF_REPEAT,
     CONF_SCAN_INTERVAL,
@@ -1074,6 +1076,15 @@ _SCRIPT_CHOOSE_SCHEMA = vol.Schema(
     }
 )
 
+_SCRIPT_PARALLEL_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ALIAS): string,
+        # Every branch is a single action or a sequence of actions
+        vol.Required(CONF_PARALLEL): vol.All(ensure_list, [SCRIPT_SCHEMA]),
+        vol.Optional(CONF_MAX_PARALLEL): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
 SCRIPT_ACTION_DELAY = "delay"
 SCRIPT_ACTION_WAIT_TEMPLATE = "wait_template"
 SCRIPT_ACTION_CHECK_CONDITION = "condition"
@@ -1083,6 +1094,7 @@ SCRIPT_ACTION_DEVICE_AUTOMATION = "device"
 SCRIPT_ACTION_ACTIVATE_SCENE = "scene"
 SCRIPT_ACTION_REPEAT = "repeat"
 SCRIPT_ACTION_CHOOSE = "choose"
+SCRIPT_ACTION_PARALLEL = "parallel"
 
 
 def determine_script_action(action: dict) -> str:
@@ -1111,6 +1123,9 @@ def determine_script_action(action: dict) -> str:
     if CONF_CHOOSE in action:
         return SCRIPT_ACTION_CHOOSE
 
+    if CONF_PARALLEL in action:
+        return SCRIPT_ACTION_PARALLEL
+
     return SCRIPT_ACTION_CALL_SERVICE
 
 
@@ -1124,4 +1139,5 @@ ACTION_TYPE_SCHEMAS: Dict[str, Callable[[Any], dict]] = {
     SCRIPT_ACTION_ACTIVATE_SCENE: _SCRIPT_SCENE_SCHEMA,
     SCRIPT_ACTION_REPEAT: _SCRIPT_REPEAT_SCHEMA,
     SCRIPT_ACTION_CHOOSE: _SCRIPT_CHOOSE_SCHEMA,
+    SCRIPT_ACTION_PARALLEL: _SCRIPT_PARALLEL_SCHEMA,
 }
@@ -18,6 +18,7 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import config_validation as cv, service
 from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.setup import track_setup_phase
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import DISABLED_INTEGRATION
@@ -186,57 +187,58 @@ class EntityPlatform:
             SLOW_SETUP_WARNING,
         )
 
-        try:
-            task = async_create_setup_task()
-
-            async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, self.domain):
-                await asyncio.shield(task)
-
-            # Block till all entities are done
-            if self._tasks:
-                pending = [task for task in self._tasks if not task.done()]
-                self._tasks.clear()
-
-                if pending:
-                    await asyncio.gather(*pending)
-
-            hass.config.components.add(full_name)
-            return True
-        except PlatformNotReady:
-            tries += 1
-            wait_time = min(tries, 6) * PLATFORM_NOT_READY_BASE_WAIT_TIME
-            logger.warning(
-                "Platform %s not ready yet. Retrying in %d seconds.",
-                self.platform_name,
-                wait_time,
-            )
+        with track_setup_phase(hass, self.platform_name, "platform", self.domain):
+            try:
+                task = async_create_setup_task()
+
+                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, self.domain):
+                    await asyncio.shield(task)
+
+                # Block till all entities are done
+                if self._tasks:
+                    pending = [task for task in self._tasks if not task.done()]
+                    self._tasks.clear()
+
+                    if pending:
+                        await asyncio.gather(*pending)
+
+                hass.config.components.add(full_name)
+                return True
+            except PlatformNotReady:
+                tries += 1
+                wait_time = min(tries, 6) * PLATFORM_NOT_READY_BASE_WAIT_TIME
+                logger.warning(
+                    "Platform %s not ready yet. Retrying in %d seconds.",
+                    self.platform_name,
+                    wait_time,
+                )
 
-            async def setup_again(now):
-                """Run setup again."""
-                self._async_cancel_retry_setup = None
-                await self._async_setup_platform(async_create_setup_task, tries)
+                async def setup_again(now):
+                    """Run setup again."""
+                    self._async_cancel_retry_setup = None
+                    await self._async_setup_platform(async_create_setup_task, tries)
 
-            self._async_cancel_retry_setup = async_call_later(
-                hass, wait_time, setup_again
-            )
-            return False
-        except asyncio.TimeoutError:
-            logger.error(
-                "Setup of platform %s is taking longer than %s seconds."
-                " Startup will proceed without waiting any longer.",
-                self.platform_name,
-                SLOW_SETUP_MAX_WAIT,
-            )
-            return False
-        except Exception:  # pylint: disable=broad-except
-            logger.exception(
-                "Error while setting up %s platform for %s",
-                self.platform_name,
-                self.domain,
-            )
-            return False
-        finally:
-            warn_task.cancel()
+                self._async_cancel_retry_setup = async_call_later(
+                    hass, wait_time, setup_again
+                )
+                return False
+            except asyncio.TimeoutError:
+                logger.error(
+                    "Setup of platform %s is taking longer than %s seconds."
+                    " Startup will proceed without waiting any longer.",
+                    self.platform_name,
+                    SLOW_SETUP_MAX_WAIT,
+                )
+                return False
+            except Exception:  # pylint: disable=broad-except
+                logger.exception(
+                    "Error while setting up %s platform for %s",
+                    self.platform_name,
+                    self.domain,
+                )
+                return False
+            finally:
+                warn_task.cancel()
 
     def _schedule_add_entities(
         self, new_entities: Iterable["Entity"], update_before_add: bool = False
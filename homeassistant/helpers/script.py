@@ -1,13 +1,17 @@
 """Helpers to execute scripts."""
 import asyncio
+from collections import deque
+from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import partial
 import itertools
 import logging
+from timeit import default_timer as timer
 from types import MappingProxyType
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     List,
     Optional,
@@ -39,7 +43,9 @@ from homeassistant.const import (
     CONF_EVENT,
     CONF_EVENT_DATA,
     CONF_EVENT_DATA_TEMPLATE,
+    CONF_MAX_PARALLEL,
     CONF_MODE,
+    CONF_PARALLEL,
     CONF_REPEAT,
     CONF_SCENE,
     CONF_SEQUENCE,
@@ -64,6 +70,7 @@ from homeassistant.helpers.service import (
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import slugify
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import save_json
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 
@@ -87,6 +94,12 @@ ATTR_MAX = "max"
 ATTR_MODE = "mode"
 
 DATA_SCRIPTS = "helpers.script"
+DATA_SCRIPT_TRACE = "helpers.script.trace"
+
+# Runs kept per script and steps kept per run while tracing is enabled
+TRACE_MAX_RUNS = 20
+TRACE_MAX_STEPS = 1000
+TRACE_FILENAME = "home-assistant.script_trace.json"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -139,6 +152,173 @@ class _StopScript(Exception):
     """Throw if script needs to stop."""
 
 
+class _RunTrace:
+    """Record the steps of a script run and how long they take."""
+
+    def __init__(self, context: Optional[Context]) -> None:
+        """Initialize the trace."""
+        self.context_id = context.id if context else None
+        self.started = utcnow()
+        self.start = timer()
+        self.end: Optional[float] = None
+        self.steps: List[Dict[str, Any]] = []
+        self.steps_dropped = 0
+
+    @callback
+    def async_start_step(self, path: str, action: str) -> Optional[Dict[str, Any]]:
+        """Start recording a step, unless the trace is full."""
+        if len(self.steps) == TRACE_MAX_STEPS:
+            self.steps_dropped += 1
+            return None
+
+        step = {"path": path, "action": action, "start": timer(), "end": None}
+        self.steps.append(step)
+        return step
+
+    @callback
+    def async_finish(self) -> None:
+        """Finish the trace of the run."""
+        self.end = timer()
+
+    @callback
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the trace with times relative to the start of the run."""
+
+        def relative(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value - self.start, 6)
+
+        return {
+            "context_id": self.context_id,
+            "started": self.started.isoformat(),
+            "duration": relative(self.end),
+            "steps": [
+                {**step, "start": relative(step["start"]), "end": relative(step["end"])}
+                for step in self.steps
+            ],
+            "steps_dropped": self.steps_dropped,
+        }
+
+
+# Trace and step path prefix of the run that starts a sub-script run
+_current_trace: ContextVar[Tuple[Optional[_RunTrace], str]] = ContextVar(
+    "script_trace", default=(None, "")
+)
+
+
+@callback
+def async_set_trace_enabled(hass: HomeAssistant, enabled: bool) -> None:
+    """Enable or disable tracing of script runs that start from now on."""
+    hass.data[DATA_SCRIPT_TRACE] = enabled
+
+
+@callback
+def async_is_trace_enabled(hass: HomeAssistant) -> bool:
+    """Return if script runs are traced."""
+    return cast(bool, hass.data.get(DATA_SCRIPT_TRACE, False))
+
+
+def _async_traced_scripts(
+    hass: HomeAssistant, domain: Optional[str], name: Optional[str]
+) -> List["Script"]:
+    """Return the scripts with recorded runs, optionally filtered."""
+    return [
+        script
+        for script in (entry["instance"] for entry in hass.data.get(DATA_SCRIPTS, []))
+        if script.traces
+        and (domain is None or script.domain == domain)
+        and (name is None or script.name == name)
+    ]
+
+
+@callback
+def async_get_traces(
+    hass: HomeAssistant, domain: Optional[str] = None, name: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Return the recorded runs of all scripts that have been traced."""
+    return [
+        {
+            "domain": script.domain,
+            "name": script.name,
+            "runs": [trace.as_dict() for trace in script.traces],
+        }
+        for script in _async_traced_scripts(hass, domain, name)
+    ]
+
+
+@callback
+def async_get_trace_events(
+    hass: HomeAssistant, domain: Optional[str] = None, name: Optional[str] = None
+) -> Dict[str, Any]:
+    """Return the recorded runs in the Trace Event Format.
+
+    Every script gets its own track. The result can be loaded in
+    chrome://tracing or Perfetto.
+    """
+    scripts = _async_traced_scripts(hass, domain, name)
+    if not scripts:
+        return {"traceEvents": [], "displayTimeUnit": "ms"}
+
+    origin = min(trace.start for script in scripts for trace in script.traces)
+    events: List[Dict[str, Any]] = []
+
+    def micros(value: float) -> int:
+        return int((value - origin) * 1_000_000)
+
+    for tid, script in enumerate(scripts, start=1):
+        events.append(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": f"{script.domain}: {script.name}"},
+            }
+        )
+
+        for trace in script.traces:
+            # Runs and steps that are still in progress end now
+            end = timer() if trace.end is None else trace.end
+            events.append(
+                {
+                    "name": script.name,
+                    "cat": script.domain,
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tid,
+                    "ts": micros(trace.start),
+                    "dur": micros(end) - micros(trace.start),
+                    "args": {"context_id": trace.context_id},
+                }
+            )
+            for step in trace.steps:
+                step_end = end if step["end"] is None else step["end"]
+                events.append(
+                    {
+                        "name": f"{step['path']} {step['action']}",
+                        "cat": script.domain,
+                        "ph": "X",
+                        "pid": 1,
+                        "tid": tid,
+                        "ts": micros(step["start"]),
+                        "dur": micros(step_end) - micros(step["start"]),
+                        "args": {
+                            key: value
+                            for key, value in step.items()
+                            if key not in ("path", "action", "start", "end")
+                        },
+                    }
+                )
+
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+async def async_save_trace(hass: HomeAssistant) -> str:
+    """Write the recorded runs in the Trace Event Format to the config dir."""
+    path = hass.config.path(TRACE_FILENAME)
+    await hass.async_add_executor_job(save_json, path, async_get_trace_events(hass))
+    return path
+
+
 class _ScriptRun:
     """Manage Script sequence run."""
 
@@ -149,6 +329,8 @@ class _ScriptRun:
         variables: Dict[str, Any],
         context: Optional[Context],
         log_exceptions: bool,
+        trace: Optional[_RunTrace] = None,
+        trace_path: str = "",
     ) -> None:
         self._hass = hass
         self._script = script
@@ -159,6 +341,9 @@ class _ScriptRun:
         self._action: Optional[Dict[str, Any]] = None
         self._stop = asyncio.Event()
         self._stopped = asyncio.Event()
+        self._trace = trace
+        self._trace_path = trace_path
+        self._trace_step: Optional[Dict[str, Any]] = None
 
     def _changed(self):
         if not self._stop.is_set():
@@ -187,18 +372,44 @@ class _ScriptRun:
             self._finish()
 
     async def _async_step(self, log_exceptions):
+        action_type = cv.determine_script_action(self._action)
+
+        if self._trace is not None:
+            self._trace_step = self._trace.async_start_step(
+                f"{self._trace_path}{self._step + 1}", action_type
+            )
+
         try:
-            await getattr(
-                self, f"_async_{cv.determine_script_action(self._action)}_step"
-            )()
+            await getattr(self, f"_async_{action_type}_step")()
         except Exception as ex:
+            if self._trace_step is not None and not isinstance(ex, _StopScript):
+                self._trace_step["error"] = str(ex) or type(ex).__name__
             if not isinstance(ex, (_StopScript, asyncio.CancelledError)) and (
                 self._log_exceptions or log_exceptions
             ):
                 self._log_exception(ex)
             raise
+        finally:
+            if self._trace_step is not None:
+                self._trace_step["end"] = timer()
+                self._trace_step = None
+
+    def _trace_start(self):
+        """Return the start of a timing, or 0 if the step is not traced."""
+        if self._trace_step is None:
+            return 0
+        return timer()
+
+    def _trace_timing(self, key, start):
+        """Add the time since start to a timing of the traced step."""
+        if self._trace_step is not None:
+            self._trace_step[key] = round(
+                self._trace_step.get(key, 0) + timer() - start, 6
+            )
 
     def _finish(self):
+        if self._trace is not None and not self._trace_path:
+            self._trace.async_finish()
         self._script._runs.remove(self)  # pylint: disable=protected-access
         if not self._script.is_running:
             self._script.last_action = None
@@ -242,6 +453,7 @@ class _ScriptRun:
         )
 
     def _get_pos_time_period_template(self, key):
+        start = self._trace_start()
         try:
             return cv.positive_time_period(
                 template.render_complex(self._action[key], self._variables)
@@ -255,6 +467,8 @@ class _ScriptRun:
                 level=logging.ERROR,
             )
             raise _StopScript
+        finally:
+            self._trace_timing("template", start)
 
     async def _async_delay_step(self):
         """Handle delay."""
@@ -265,11 +479,14 @@ class _ScriptRun:
 
         delay = delay.total_seconds()
         self._changed()
+        start = self._trace_start()
         try:
             async with timeout(delay):
                 await self._stop.wait()
         except asyncio.TimeoutError:
             pass
+        finally:
+            self._trace_timing("wait", start)
 
     async def _async_wait_template_step(self):
         """Handle a wait template."""
@@ -291,7 +508,10 @@ class _ScriptRun:
         wait_template.hass = self._hass
 
         # check if condition already okay
-        if condition.async_template(self._hass, wait_template, self._variables):
+        start = self._trace_start()
+        completed = condition.async_template(self._hass, wait_template, self._variables)
+        self._trace_timing("template", start)
+        if completed:
             self._variables["wait"]["completed"] = True
             return
 
@@ -314,6 +534,7 @@ class _ScriptRun:
         tasks = [
             self._hass.async_create_task(flag.wait()) for flag in (self._stop, done)
         ]
+        start = self._trace_start()
         try:
             async with timeout(delay) as to_context:
                 await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
@@ -323,6 +544,7 @@ class _ScriptRun:
                 raise _StopScript
             self._variables["wait"]["remaining"] = 0.0
         finally:
+            self._trace_timing("wait", start)
             for task in tasks:
                 task.cancel()
             unsub()
@@ -367,9 +589,13 @@ class _ScriptRun:
         self._script.last_action = self._action.get(CONF_ALIAS, "call service")
         self._log("Executing step %s", self._script.last_action)
 
+        start = self._trace_start()
         domain, service, service_data = async_prepare_call_from_config(
             self._hass, self._action, self._variables
         )
+        self._trace_timing("template", start)
+        if self._trace_step is not None:
+            self._trace_step["service"] = f"{domain}.{service}"
 
         running_script = (
             domain == "automation"
@@ -393,12 +619,16 @@ class _ScriptRun:
                 limit=limit,
             )
         )
-        if limit is not None:
-            # There is a call limit, so just wait for it to finish.
-            await service_task
-            return
+        start = self._trace_start()
+        try:
+            if limit is not None:
+                # There is a call limit, so just wait for it to finish.
+                await service_task
+                return
 
-        await self._async_run_long_action(service_task)
+            await self._async_run_long_action(service_task)
+        finally:
+            self._trace_timing("service_latency", start)
 
     async def _async_device_step(self):
         """Perform the device automation specified in the action."""
@@ -431,6 +661,7 @@ class _ScriptRun:
         self._log("Executing step %s", self._script.last_action)
         event_data = dict(self._action.get(CONF_EVENT_DATA, {}))
         if CONF_EVENT_DATA_TEMPLATE in self._action:
+            start = self._trace_start()
             try:
                 event_data.update(
                     template.render_complex(
@@ -441,6 +672,8 @@ class _ScriptRun:
                 self._log(
                     "Error rendering event data template: %s", ex, level=logging.ERROR
                 )
+            finally:
+                self._trace_timing("template", start)
 
         self._hass.bus.async_fire(
             self._action[CONF_EVENT], event_data, context=self._context
@@ -452,7 +685,11 @@ class _ScriptRun:
             CONF_ALIAS, self._action[CONF_CONDITION]
         )
         cond = await self._async_get_condition(self._action)
+        start = self._trace_start()
         check = cond(self._hass, self._variables)
+        self._trace_timing("condition", start)
+        if self._trace_step is not None:
+            self._trace_step["result"] = check
         self._log("Test condition %s: %s", self._script.last_action, check)
         if not check:
             raise _StopScript
@@ -475,7 +712,7 @@ class _ScriptRun:
 
         async def async_run_sequence(iteration, extra_msg=""):
             self._log("Repeating %s: Iteration %i%s", description, iteration, extra_msg)
-            await self._async_run_script(script)
+            await self._async_run_script(script, f"iteration {iteration}")
 
         if CONF_COUNT in repeat:
             count = repeat[CONF_COUNT]
@@ -531,21 +768,79 @@ class _ScriptRun:
         # pylint: disable=protected-access
         choose_data = await self._script._async_get_choose_data(self._step)
 
-        for conditions, script in choose_data["choices"]:
+        for idx, (conditions, script) in enumerate(choose_data["choices"], start=1):
             if all(condition(self._hass, self._variables) for condition in conditions):
-                await self._async_run_script(script)
+                await self._async_run_script(script, f"choice {idx}")
                 return
 
         if choose_data["default"]:
-            await self._async_run_script(choose_data["default"])
+            await self._async_run_script(choose_data["default"], "default")
+
+    async def _async_parallel_step(self):
+        """Run sequences concurrently."""
+        description = self._action.get(CONF_ALIAS, "parallel")
+        # pylint: disable=protected-access
+        scripts = self._script._get_parallel_scripts(self._step)
+        max_parallel = self._action.get(CONF_MAX_PARALLEL)
+        semaphore = asyncio.Semaphore(max_parallel) if max_parallel else None
+
+        self._script.last_action = description
+        self._log("Executing step %s: %i branches", description, len(scripts))
+
+        async def async_run_branch(idx, script):
+            if semaphore is None:
+                await self._async_run_branch(idx, script)
+                return
+
+            async with semaphore:
+                await self._async_run_branch(idx, script)
+
+        results = await asyncio.gather(
+            *(
+                async_run_branch(idx, script)
+                for idx, script in enumerate(scripts, start=1)
+            ),
+            return_exceptions=True,
+        )
+
+        # The branches have logged their own errors. Stop this run with the
+        # first one once all branches are done.
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+    async def _async_run_branch(self, idx, script):
+        """Run a branch of a parallel step unless the run has been stopped."""
+        if self._stop.is_set():
+            return
 
-    async def _async_run_script(self, script):
+        # Branches get a copy of the variables so they do not change the
+        # repeat and wait variables of each other.
+        await self._async_run_script(
+            script, f"branch {idx}", variables=dict(self._variables)
+        )
+
+    async def _async_run_script(self, script, trace_label=None, variables=None):
         """Execute a script."""
-        await self._async_run_long_action(
-            self._hass.async_create_task(
-                script.async_run(self._variables, self._context)
+        if variables is None:
+            variables = self._variables
+
+        # The run of the sub-script records its steps in the trace of this run,
+        # below the path of the current step.
+        if self._trace is None:
+            token = _current_trace.set((None, ""))
+        else:
+            token = _current_trace.set(
+                (self._trace, f"{self._trace_path}{self._step + 1}/{trace_label}/")
             )
-        )
+        try:
+            task = self._hass.async_create_task(
+                script.async_run(variables, self._context)
+            )
+        finally:
+            _current_trace.reset(token)
+
+        await self._async_run_long_action(task)
 
 
 class _QueuedScriptRun(_ScriptRun):
@@ -673,12 +968,14 @@ class Script:
         self.last_triggered: Optional[datetime] = None
 
         self._runs: List[_ScriptRun] = []
+        self.traces: Deque[_RunTrace] = deque(maxlen=TRACE_MAX_RUNS)
         self.max_runs = max_runs
         if script_mode == SCRIPT_MODE_QUEUED:
             self._queue_lck = asyncio.Lock()
         self._config_cache: Dict[Set[Tuple], Callable[..., bool]] = {}
         self._repeat_script: Dict[int, Script] = {}
         self._choose_data: Dict[int, Dict[str, Any]] = {}
+        self._parallel_scripts: Dict[int, List[Script]] = {}
         self._referenced_entities: Optional[Set[str]] = None
         self._referenced_devices: Optional[Set[str]] = None
 
@@ -698,6 +995,9 @@ class Script:
                 script.update_logger(self._logger)
             if choose_data["default"]:
                 choose_data["default"].update_logger(self._logger)
+        for scripts in self._parallel_scripts.values():
+            for script in scripts:
+                script.update_logger(self._logger)
 
     def _changed(self):
         if self.change_listener:
@@ -808,12 +1108,26 @@ class Script:
         if self._top_level:
             variables = dict(variables) if variables is not None else {}
 
+        if not self._top_level:
+            trace, trace_path = _current_trace.get()
+        elif self._hass.data.get(DATA_SCRIPT_TRACE):
+            trace, trace_path = _RunTrace(context), ""
+            self.traces.append(trace)
+        else:
+            trace, trace_path = None, ""
+
         if self.script_mode != SCRIPT_MODE_QUEUED:
             cls = _ScriptRun
         else:
             cls = _QueuedScriptRun
         run = cls(
-            self._hass, self, cast(dict, variables), context, self._log_exceptions
+            self._hass,
+            self,
+            cast(dict, variables),
+            context,
+            self._log_exceptions,
+            trace,
+            trace_path,
         )
         self._runs.append(run)
         self.last_triggered = utcnow()
@@ -922,6 +1236,35 @@ class Script:
             self._choose_data[step] = choose_data
         return choose_data
 
+    def _prep_parallel_scripts(self, step):
+        action = self.sequence[step]
+        step_name = action.get(CONF_ALIAS, f"Parallel at step {step+1}")
+        scripts = []
+        for idx, sequence in enumerate(action[CONF_PARALLEL], start=1):
+            sub_script = Script(
+                self._hass,
+                sequence,
+                f"{self.name}: {step_name}: branch {idx}",
+                self.domain,
+                running_description=self.running_description,
+                script_mode=SCRIPT_MODE_PARALLEL,
+                max_runs=self.max_runs,
+                logger=self._logger,
+                top_level=False,
+            )
+            sub_script.change_listener = partial(
+                self._chain_change_listener, sub_script
+            )
+            scripts.append(sub_script)
+        return scripts
+
+    def _get_parallel_scripts(self, step):
+        scripts = self._parallel_scripts.get(step)
+        if not scripts:
+            scripts = self._prep_parallel_scripts(step)
+            self._parallel_scripts[step] = scripts
+        return scripts
+
     def _log(self, msg, *args, level=logging.INFO):
         msg = f"%s: {msg}"
         args = [self.name, *args]
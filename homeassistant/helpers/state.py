@@ -3,11 +3,26 @@ import asyncio
 from collections import defaultdict
 import datetime as dt
 import logging
+import threading
 from types import ModuleType, TracebackType
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from homeassistant.components.sun import STATE_ABOVE_HORIZON, STATE_BELOW_HORIZON
 from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     STATE_CLOSED,
     STATE_HOME,
     STATE_LOCKED,
@@ -18,7 +33,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     STATE_UNLOCKED,
 )
-from homeassistant.core import Context, State
+from homeassistant.core import Context, Event, State, callback
 from homeassistant.loader import IntegrationNotFound, async_get_integration, bind_hass
 import homeassistant.util.dt as dt_util
 
@@ -26,6 +41,9 @@ from .typing import HomeAssistantType
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_NUMERIC_STATES = "numeric_states"
+_NUMERIC_STATES_LOCK = threading.Lock()
+
 
 class AsyncTrackStates:
     """
@@ -133,3 +151,105 @@ def state_as_number(state: State) -> float:
         return 0
 
     return float(state.state)
+
+
+class NumericState(NamedTuple):
+    """Numeric view of a state, shared by the exporters of state changes.
+
+    value: the state as returned by state_as_number, None if not numeric.
+    is_number: if the state itself is a number rather than mapped to one.
+    unit: the unit of measurement.
+    device_class: the device class.
+    attributes: attributes with numeric values, converted to float.
+    """
+
+    value: Optional[float]
+    is_number: bool
+    unit: Optional[str]
+    device_class: Optional[str]
+    attributes: Dict[str, float]
+
+
+def _get_numeric_states(
+    hass: HomeAssistantType,
+) -> Dict[str, Tuple[State, str, Any, NumericState]]:
+    """Return the numeric view of the last projected state object per entity_id.
+
+    The views are stored together with what they were computed from. Entries
+    of removed entities are dropped.
+    """
+    numeric_states = hass.data.get(DATA_NUMERIC_STATES)
+    if numeric_states is not None:
+        return cast(Dict[str, Tuple[State, str, Any, NumericState]], numeric_states)
+
+    # Exporters project states from worker threads too, the cache and its
+    # listener are only created once
+    with _NUMERIC_STATES_LOCK:
+        numeric_states = hass.data.get(DATA_NUMERIC_STATES)
+        if numeric_states is None:
+            numeric_states = _create_numeric_states(hass)
+
+    return cast(Dict[str, Tuple[State, str, Any, NumericState]], numeric_states)
+
+
+def _create_numeric_states(
+    hass: HomeAssistantType,
+) -> Dict[str, Tuple[State, str, Any, NumericState]]:
+    """Create the numeric states cache and drop entries of removed entities."""
+    numeric_states: Dict[str, Tuple[State, str, Any, NumericState]] = {}
+
+    @callback
+    def async_state_removed(event: Event) -> None:
+        """Drop the numeric view of a removed entity."""
+        if event.data.get("new_state") is None:
+            numeric_states.pop(event.data["entity_id"], None)
+
+    @callback
+    def async_listen() -> None:
+        hass.bus.async_listen(EVENT_STATE_CHANGED, async_state_removed)
+
+    hass.add_job(async_listen)
+    hass.data[DATA_NUMERIC_STATES] = numeric_states
+    return numeric_states
+
+
+def numeric_state(hass: HomeAssistantType, state: State) -> NumericState:
+    """Return the numeric view of a state.
+
+    The view is computed once per state object, exporters handling the same
+    state change share the result.
+    """
+    numeric_states = _get_numeric_states(hass)
+    attributes = state.attributes
+    cached = numeric_states.get(state.entity_id)
+    if (
+        cached is not None
+        and cached[0] is state
+        and cached[1] == state.state
+        and cached[2] is attributes
+    ):
+        return cached[3]
+
+    try:
+        value: Optional[float] = float(state.state)
+        is_number = True
+    except ValueError:
+        is_number = False
+        try:
+            value = state_as_number(state)
+        except ValueError:
+            value = None
+
+    numeric = NumericState(
+        value,
+        is_number,
+        attributes.get(ATTR_UNIT_OF_MEASUREMENT),
+        attributes.get(ATTR_DEVICE_CLASS),
+        {
+            key: float(attr)
+            for key, attr in attributes.items()
+            if isinstance(attr, (int, float))
+        },
+    )
+    numeric_states[state.entity_id] = (state, state.state, attributes, numeric)
+    return numeric
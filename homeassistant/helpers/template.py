@@ -631,7 +631,39 @@ def closest(hass, *args):
     states = expand(hass, entities)
 
     # state will already be wrapped here
-    return loc_helper.closest(latitude, longitude, states)
+    return loc_helper.closest(
+        latitude, longitude, _nearby_zones(hass, latitude, longitude, states)
+    )
+
+
+def _nearby_zones(hass, latitude, longitude, states):
+    """Limit a list of zones to the ones that can be closest to a point.
+
+    The zone index is only used if it's up to date with all the given zones,
+    other states are returned as is.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.zone.const import (
+        DATA_INDEX as ZONE_DATA_INDEX,
+        DOMAIN as ZONE_DOMAIN,
+    )
+
+    index = hass.data.get(ZONE_DATA_INDEX)
+    if index is None or not states:
+        return states
+
+    items = index.grid.items
+    for state in states:
+        if state.domain != ZONE_DOMAIN or items.get(state.entity_id, ())[:2] != (
+            state.attributes.get(ATTR_LATITUDE),
+            state.attributes.get(ATTR_LONGITUDE),
+        ):
+            return states
+
+    candidates = index.grid.nearest_candidates(
+        latitude, longitude, [state.entity_id for state in states]
+    )
+    return [state for state in states if state.entity_id in candidates]
 
 
 def closest_filter(hass, *args):
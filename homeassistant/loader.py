@@ -5,12 +5,14 @@ This module has quite some complex parts. I have tried to add as much
 documentation as possible to keep it understandable.
 """
 import asyncio
+import copy
 import functools as ft
 import importlib
 import json
 import logging
 import pathlib
 import sys
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
@@ -20,11 +22,13 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
     cast,
 )
 
+from homeassistant.generated.manifests import MANIFESTS
 from homeassistant.generated.ssdp import SSDP
 from homeassistant.generated.zeroconf import HOMEKIT, ZEROCONF
 
@@ -39,6 +43,10 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_TIMES = "integration_import_times"
+CUSTOM_COMPONENTS_STORAGE_KEY = "core.custom_components"
+CUSTOM_COMPONENTS_STORAGE_VERSION = 1
+CUSTOM_COMPONENTS_SAVE_DELAY = 60
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -74,33 +82,96 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: List[str]) -> List[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.storage import Store
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+    store = Store(
+        hass, CUSTOM_COMPONENTS_STORAGE_VERSION, CUSTOM_COMPONENTS_STORAGE_KEY
     )
+    cache = await store.async_load() or {}
 
-    integrations = await asyncio.gather(
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
-            )
-            for comp in dirs
-        )
+    manifests = await hass.async_add_executor_job(
+        _load_custom_manifests, list(custom_components.__path__), cache
     )
 
-    return {
-        integration.domain: integration
-        for integration in integrations
-        if integration is not None
-    }
+    if manifests != cache:
+        scanned = timer()
+
+        def save_manifests() -> None:
+            """Save the manifests once the instance has been running a while.
+
+            A short lived instance that just looks up integrations leaves the
+            storage alone. The elapsed time is measured on the wall clock, so
+            handles run early by simulated time changes are rescheduled.
+            """
+            remaining = CUSTOM_COMPONENTS_SAVE_DELAY - (timer() - scanned)
+            if remaining > 0:
+                hass.loop.call_later(remaining, save_manifests)
+                return
+            hass.async_create_task(store.async_save(manifests))
+
+        hass.loop.call_later(CUSTOM_COMPONENTS_SAVE_DELAY, save_manifests)
+
+    integrations: Dict[str, Integration] = {}
+    for path, entry in manifests["manifests"].items():
+        file_path = pathlib.Path(path)
+        integration = Integration(
+            hass,
+            f"{custom_components.__name__}.{file_path.name}",
+            file_path,
+            copy.deepcopy(entry["manifest"]),
+        )
+        integrations[integration.domain] = integration
+
+    return integrations
+
+
+def _load_custom_manifests(paths: List[str], cache: Dict[str, Dict]) -> Dict:
+    """Load the manifests of the custom integrations.
+
+    The cache holds the sub directories of each custom components directory
+    and the parsed manifests, together with their modification times. Only
+    directories and manifests that have been modified since are read again.
+    """
+    dirs_cache = cache.get("dirs", {})
+    manifests_cache = cache.get("manifests", {})
+    dirs = {}
+    manifests = {}
+
+    for path in paths:
+        base = pathlib.Path(path)
+        mtime = base.stat().st_mtime
+        cached = dirs_cache.get(path)
+        if cached is not None and cached["mtime"] == mtime:
+            names = cached["names"]
+        else:
+            names = sorted(entry.name for entry in base.iterdir() if entry.is_dir())
+        dirs[path] = {"mtime": mtime, "names": names}
+
+        for name in names:
+            integration_path = str(base / name)
+            manifest_path = base / name / "manifest.json"
+            try:
+                mtime = manifest_path.stat().st_mtime
+            except OSError:
+                continue
+
+            cached = manifests_cache.get(integration_path)
+            if cached is not None and cached["mtime"] == mtime:
+                manifests[integration_path] = cached
+                continue
+
+            try:
+                manifest = json.loads(manifest_path.read_text())
+            except ValueError as err:
+                _LOGGER.error(
+                    "Error parsing manifest.json file at %s: %s", manifest_path, err
+                )
+                continue
+
+            manifests[integration_path] = {"mtime": mtime, "manifest": manifest}
+
+    return {"dirs": dirs, "manifests": manifests}
 
 
 async def async_get_custom_components(
@@ -223,6 +294,23 @@ class Integration:
 
         return None
 
+    @classmethod
+    def resolve_from_manifests(
+        cls, hass: "HomeAssistant", root_module: ModuleType, domain: str
+    ) -> "Optional[Integration]":
+        """Resolve a built-in integration from the generated manifests."""
+        manifest = MANIFESTS.get(domain)
+
+        if manifest is None:
+            return None
+
+        return cls(
+            hass,
+            f"{root_module.__name__}.{domain}",
+            pathlib.Path(root_module.__path__[0]) / domain,  # type: ignore
+            copy.deepcopy(manifest),
+        )
+
     @classmethod
     def resolve_legacy(
         cls, hass: "HomeAssistant", domain: str
@@ -311,6 +399,11 @@ class Integration:
         """Return Integration Quality Scale."""
         return cast(str, self.manifest.get("quality_scale"))
 
+    @property
+    def preload_platforms(self) -> List[str]:
+        """Return platforms to import in the executor before setup."""
+        return cast(List[str], self.manifest.get("preload_platforms", []))
+
     @property
     def ssdp(self) -> Optional[list]:
         """Return Integration SSDP entries."""
@@ -378,7 +471,7 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            cache[self.domain] = self._import_module(self.pkg_path)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -386,16 +479,74 @@ class Integration:
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name not in cache:
-            cache[full_name] = importlib.import_module(
-                f"{self.pkg_path}.{platform_name}"
-            )
+            cache[full_name] = self._import_module(f"{self.pkg_path}.{platform_name}")
         return cache[full_name]  # type: ignore
 
+    async def async_preload_platforms(self) -> None:
+        """Import the platforms listed in the manifest in the executor.
+
+        The imports run in parallel so heavy platforms don't block the event
+        loop when they are set up. Import errors are not raised here, they
+        will surface when the platform is set up.
+        """
+        cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        to_import = [
+            platform_name
+            for platform_name in self.preload_platforms
+            if f"{self.domain}.{platform_name}" not in cache
+        ]
+
+        if not to_import:
+            return
+
+        results = await asyncio.gather(
+            *(
+                self.hass.async_add_executor_job(
+                    _timed_import_module, f"{self.pkg_path}.{platform_name}"
+                )
+                for platform_name in to_import
+            ),
+            return_exceptions=True,
+        )
+
+        for platform_name, result in zip(to_import, results):
+            if isinstance(result, BaseException):
+                _LOGGER.debug(
+                    "Unable to preload platform %s.%s: %s",
+                    self.domain,
+                    platform_name,
+                    result,
+                )
+                continue
+
+            module, duration = result
+            cache[f"{self.domain}.{platform_name}"] = module
+            self.hass.data.setdefault(DATA_IMPORT_TIMES, {})[module.__name__] = duration
+
+    def _import_module(self, name: str) -> ModuleType:
+        """Import a module and record how long it took."""
+        module, duration = _timed_import_module(name)
+        self.hass.data.setdefault(DATA_IMPORT_TIMES, {})[name] = duration
+        return module
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+def _timed_import_module(name: str) -> Tuple[ModuleType, float]:
+    """Import a module and return it with the import duration in seconds."""
+    start = timer()
+    module = importlib.import_module(name)
+    return module, timer() - start
+
+
+def get_import_times(hass: "HomeAssistant") -> Dict[str, float]:
+    """Return import durations in seconds of integration modules, slowest first."""
+    import_times: Dict[str, float] = hass.data.get(DATA_IMPORT_TIMES, {})
+    return dict(sorted(import_times.items(), key=lambda item: item[1], reverse=True))
+
+
 async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integration:
     """Get an integration."""
     cache = hass.data.get(DATA_INTEGRATIONS)
@@ -432,9 +583,14 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    # Built-in integrations are known without touching the disk. Only a
+    # domain missing from the generated manifests is looked up on disk
+    integration = Integration.resolve_from_manifests(hass, components, domain)
+
+    if integration is None:
+        integration = await hass.async_add_executor_job(
+            Integration.resolve_from_root, hass, components, domain
+        )
 
     if integration is not None:
         cache[domain] = integration
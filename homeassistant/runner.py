@@ -40,6 +40,7 @@ class RuntimeConfig:
 
     debug: bool = False
     open_ui: bool = False
+    startup_trace: bool = False
 
 
 # In Python 3.8+ proactor policy is the default on Windows
@@ -6,12 +6,15 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+import os
+import tempfile
 from timeit import default_timer as timer
 from typing import Callable, Dict, TypeVar
 
-from homeassistant import core
+from homeassistant import config_entries, core
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.helpers import condition
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt as dt_util
@@ -185,6 +188,67 @@ async def state_changed_event_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def history_stats_updates(hass):
+    """Update a history_stats sensor 100 times over a day of 5000 state changes."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy.ext import baked
+
+    from homeassistant.components import history, recorder
+    from homeassistant.components.history_stats.sensor import HistoryStatsSensor
+    from homeassistant.helpers.template import Template
+    from homeassistant.setup import async_setup_component
+
+    entity_id = "binary_sensor.benchmark"
+    hass.config.config_dir = tempfile.mkdtemp()
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await async_setup_component(
+        hass,
+        recorder.DOMAIN,
+        {
+            recorder.DOMAIN: {
+                recorder.CONF_DB_URL: "sqlite://",
+                recorder.CONF_COMMIT_INTERVAL: 0,
+            }
+        },
+    )
+    # Only the history queries are needed, not the history API
+    hass.data[history.HISTORY_BAKERY] = baked.bakery()
+
+    sensor = await hass.async_add_executor_job(
+        HistoryStatsSensor,
+        hass,
+        entity_id,
+        "on",
+        Template("{{ as_timestamp(now()) - 86400 }}", hass),
+        Template("{{ now() }}", hass),
+        None,
+        "time",
+        "Benchmark",
+    )
+    sensor.hass = hass
+    sensor.entity_id = "sensor.benchmark"
+    await hass.async_start()
+
+    for idx in range(5000):
+        hass.states.async_set(entity_id, "on" if idx % 2 else "off")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = timer()
+
+    for idx in range(100):
+        hass.states.async_set(entity_id, "on" if idx % 2 else "off")
+        await hass.async_block_till_done()
+        # Polls happen seconds apart, so don't let the sensor skip the update
+        sensor._period = (  # pylint: disable=protected-access
+            dt_util.utc_from_timestamp(0),
+        ) * 2
+        await hass.async_add_executor_job(sensor.update)
+
+    return timer() - start
+
+
 @benchmark
 async def logbook_filtering_state(hass):
     """Filter state changes."""
@@ -323,6 +387,169 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def automation_conditions(hass):
+    """Check a typical automation condition set 100k times."""
+    check = await condition.async_from_config(
+        hass,
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "template",
+                    "value_template": "{{ is_state('input_boolean.guests', 'off') }}",
+                },
+                {
+                    "condition": "state",
+                    "entity_id": ["binary_sensor.motion", "light.hallway"],
+                    "state": ["on", "off"],
+                },
+                {
+                    "condition": "numeric_state",
+                    "entity_id": "sensor.illuminance",
+                    "above": 5,
+                    "below": 40,
+                },
+                {
+                    "condition": "not",
+                    "conditions": [
+                        {
+                            "condition": "or",
+                            "conditions": [
+                                {
+                                    "condition": "state",
+                                    "entity_id": "alarm_control_panel.home",
+                                    "state": "armed_away",
+                                },
+                                {
+                                    "condition": "state",
+                                    "entity_id": "alarm_control_panel.home",
+                                    "state": "armed_night",
+                                },
+                            ],
+                        }
+                    ],
+                },
+            ],
+        },
+    )
+
+    hass.states.async_set("input_boolean.guests", "off")
+    hass.states.async_set("binary_sensor.motion", "on")
+    hass.states.async_set("light.hallway", "off")
+    hass.states.async_set("alarm_control_panel.home", "disarmed")
+
+    start = timer()
+
+    for i in range(10 ** 5):
+        # Illuminance changes every 10 checks, half of the values fail the check
+        if i % 10 == 0:
+            hass.states.async_set("sensor.illuminance", str(i % 80))
+        check(hass, None)
+
+    return timer() - start
+
+
+@benchmark
+async def camera_stills_from_source(hass):
+    """Take 100 camera stills with ffmpeg from the source, like ffmpeg cameras."""
+    # pylint: disable=import-outside-toplevel
+    import shutil
+
+    from haffmpeg.tools import IMAGE_JPEG, ImageFrame
+
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError("The ffmpeg binary is needed for this benchmark")
+
+    with tempfile.NamedTemporaryFile(suffix=".mp4") as source:
+        source.write(_create_h264_video().getvalue())
+        source.flush()
+        ffmpeg = ImageFrame("ffmpeg", loop=hass.loop)
+        start = _cpu_time()
+
+        for _ in range(100):
+            await ffmpeg.get_image(source.name, output_format=IMAGE_JPEG)
+
+        return _cpu_time() - start
+
+
+@benchmark
+async def camera_stills_from_stream(hass):
+    """Take 100 camera stills from an active stream over 20 seconds of video.
+
+    The worker decodes keyframes at the default image interval while the
+    stills are requested 5 times per second.
+    """
+    # pylint: disable=import-outside-toplevel
+    from unittest.mock import patch
+
+    import av
+
+    from homeassistant.components.stream import Stream
+    from homeassistant.components.stream.worker import decode_keyframe
+
+    container = av.open(_create_h264_video())
+    video_stream = container.streams.video[0]
+    packets = [packet for packet in container.demux(video_stream) if packet.size]
+    stream = Stream(hass, "benchmark")
+    clock = 0
+    served = 0
+
+    with patch("homeassistant.components.stream.time.monotonic", lambda: clock):
+        start = _cpu_time()
+
+        # 20 seconds of video at 25 frames per second
+        for idx in range(500):
+            clock = idx / 25
+            packet = packets[idx % len(packets)]
+            if packet.is_keyframe and stream.wants_image():
+                stream.set_image(decode_keyframe(video_stream, packet))
+            if idx % 5 == 0 and stream.get_image() is not None:
+                served += 1
+
+        runtime = _cpu_time() - start
+
+    container.close()
+    print(f"Served {served} of 100 stills")
+    return runtime
+
+
+def _cpu_time():
+    """Return the CPU time of this process and its finished child processes."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def _create_h264_video():
+    """Create a 5 second video with a keyframe every 25 frames."""
+    # pylint: disable=import-outside-toplevel
+    import io
+
+    import av
+
+    output = io.BytesIO()
+    container = av.open(output, mode="w", format="mp4")
+    stream = container.add_stream("libx264", rate=25)
+    stream.width = 640
+    stream.height = 480
+    stream.pix_fmt = "yuv420p"
+    stream.options = {"g": "25"}
+
+    for idx in range(125):
+        frame = av.VideoFrame(stream.width, stream.height, "yuv420p")
+        for plane in frame.planes:
+            plane.update(bytes([(idx * 2) % 256]) * plane.buffer_size)
+        for packet in stream.encode(frame):
+            container.mux(packet)
+
+    for packet in stream.encode(None):
+        container.mux(packet)
+
+    container.close()
+    output.seek(0)
+    return output
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
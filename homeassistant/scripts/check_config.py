@@ -191,6 +191,9 @@ def check(config_dir, secrets=False):
         mock_function = locals()[f"mock_{key.replace('*', '')}"]
         PATCHES[key] = patch(val[0], side_effect=mock_function)
 
+    # Parse all files, so every loaded file is seen by the patches
+    yaml_loader.clear_document_cache()
+
     # Start all patches
     for pat in PATCHES.values():
         pat.start()
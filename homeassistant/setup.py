@@ -1,9 +1,21 @@
 """All methods needed to bootstrap a Home Assistant instance."""
 import asyncio
+import contextlib
 import logging.handlers
 from timeit import default_timer as timer
 from types import ModuleType
-from typing import Awaitable, Callable, Optional, Set
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+)
 
 from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
@@ -11,6 +23,10 @@ from homeassistant.const import EVENT_COMPONENT_LOADED, PLATFORM_FORMAT
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import save_json
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,11 +36,152 @@ DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_SETUP_TIMELINE = "setup_timeline"
+DATA_SETUP_DEPENDENCIES = "setup_dependencies"
+
+STARTUP_TRACE_FILENAME = "home-assistant.startup_trace.json"
 
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
 
+class SetupPhase(NamedTuple):
+    """A timed phase of setting up an integration."""
+
+    integration: str
+    phase: str
+    detail: Optional[str]
+    start: float
+    end: float
+
+
+@contextlib.contextmanager
+def track_setup_phase(
+    hass: core.HomeAssistant, integration: str, phase: str, detail: Optional[str] = None
+) -> Generator[None, None, None]:
+    """Record the time a setup phase of an integration takes during startup."""
+    if hass.state == core.CoreState.running:
+        yield
+        return
+
+    start = timer()
+    try:
+        yield
+    finally:
+        hass.data.setdefault(DATA_SETUP_TIMELINE, []).append(
+            SetupPhase(integration, phase, detail, start, timer())
+        )
+
+
+@core.callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> List[Dict[str, Any]]:
+    """Return the recorded setup phases, relative to the first one."""
+    timeline: List[SetupPhase] = hass.data.get(DATA_SETUP_TIMELINE, [])
+    if not timeline:
+        return []
+
+    origin = min(phase.start for phase in timeline)
+    return [
+        {
+            "integration": phase.integration,
+            "phase": phase.phase,
+            "detail": phase.detail,
+            "start": round(phase.start - origin, 6),
+            "duration": round(phase.end - phase.start, 6),
+        }
+        for phase in sorted(timeline, key=lambda phase: phase.start)
+    ]
+
+
+@core.callback
+def async_get_setup_critical_path(hass: core.HomeAssistant) -> List[Dict[str, Any]]:
+    """Return the chain of integrations that determined how long setup took.
+
+    Starting at the integration that finished last, walk back through the
+    dependency that finished last until an integration without recorded
+    dependencies is reached.
+    """
+    timeline: List[SetupPhase] = hass.data.get(DATA_SETUP_TIMELINE, [])
+    if not timeline:
+        return []
+
+    origin = min(phase.start for phase in timeline)
+    spans: Dict[str, List[float]] = {}
+    for phase in timeline:
+        span = spans.setdefault(phase.integration, [phase.start, phase.end])
+        span[0] = min(span[0], phase.start)
+        span[1] = max(span[1], phase.end)
+
+    dependencies: Dict[str, Set[str]] = hass.data.get(DATA_SETUP_DEPENDENCIES, {})
+    current: Optional[str] = max(spans, key=lambda domain: spans[domain][1])
+    path: List[str] = []
+
+    while current is not None and current not in path:
+        path.append(current)
+        recorded = [dep for dep in dependencies.get(current, ()) if dep in spans]
+        current = max(recorded, key=lambda dep: spans[dep][1]) if recorded else None
+
+    return [
+        {
+            "integration": domain,
+            "start": round(spans[domain][0] - origin, 6),
+            "end": round(spans[domain][1] - origin, 6),
+        }
+        for domain in reversed(path)
+    ]
+
+
+@core.callback
+def async_get_setup_trace_events(hass: core.HomeAssistant) -> Dict[str, Any]:
+    """Return the setup timeline in the Trace Event Format.
+
+    The result can be loaded in chrome://tracing or Perfetto.
+    """
+    thread_ids: Dict[str, int] = {}
+    events: List[Dict[str, Any]] = []
+
+    for phase in async_get_setup_timeline(hass):
+        integration = phase["integration"]
+        if integration not in thread_ids:
+            thread_ids[integration] = len(thread_ids) + 1
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": thread_ids[integration],
+                    "args": {"name": integration},
+                }
+            )
+
+        name = phase["phase"]
+        if phase["detail"] is not None:
+            name = f"{name} {phase['detail']}"
+
+        events.append(
+            {
+                "name": name,
+                "cat": integration,
+                "ph": "X",
+                "pid": 1,
+                "tid": thread_ids[integration],
+                "ts": int(phase["start"] * 1_000_000),
+                "dur": int(phase["duration"] * 1_000_000),
+            }
+        )
+
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+async def async_save_setup_trace(hass: core.HomeAssistant) -> str:
+    """Write the setup timeline in the Trace Event Format to the config dir."""
+    path = hass.config.path(STARTUP_TRACE_FILENAME)
+    await hass.async_add_executor_job(
+        save_json, path, async_get_setup_trace_events(hass)
+    )
+    return path
+
+
 @core.callback
 def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: Set[str]) -> None:
     """Set domains that are going to be loaded from the config.
@@ -118,15 +275,21 @@ async def _async_setup_component(
         _LOGGER.error("Setup failed for %s: %s", domain, msg)
         async_notify_setup_error(hass, domain, link)
 
-    try:
-        integration = await loader.async_get_integration(hass, domain)
-    except loader.IntegrationNotFound:
-        log_error("Integration not found.")
-        return False
+    with track_setup_phase(hass, domain, "resolve"):
+        try:
+            integration = await loader.async_get_integration(hass, domain)
+        except loader.IntegrationNotFound:
+            log_error("Integration not found.")
+            return False
 
-    # Validate all dependencies exist and there are no circular dependencies
-    if not await integration.resolve_dependencies():
-        return False
+        # Validate all dependencies exist and there are no circular dependencies
+        if not await integration.resolve_dependencies():
+            return False
+
+    hass.data.setdefault(DATA_SETUP_DEPENDENCIES, {})[domain] = {
+        *integration.dependencies,
+        *integration.after_dependencies,
+    }
 
     # Process requirements as soon as possible, so we can import the component
     # without requiring imports to be in functions.
@@ -138,14 +301,18 @@ async def _async_setup_component(
 
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
-    try:
-        component = integration.get_component()
-    except ImportError as err:
-        log_error(f"Unable to import component: {err}", integration.documentation)
-        return False
-    except Exception:  # pylint: disable=broad-except
-        _LOGGER.exception("Setup failed for %s: unknown error", domain)
-        return False
+    with track_setup_phase(hass, domain, "import"):
+        try:
+            component = integration.get_component()
+        except ImportError as err:
+            log_error(f"Unable to import component: {err}", integration.documentation)
+            return False
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Setup failed for %s: unknown error", domain)
+            return False
+
+        if integration.preload_platforms:
+            await integration.async_preload_platforms()
 
     processed_config = await conf_util.async_process_component_config(
         hass, config, integration
@@ -187,8 +354,9 @@ async def _async_setup_component(
             hass.data[DATA_SETUP_STARTED].pop(domain)
             return False
 
-        async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-            result = await task
+        with track_setup_phase(hass, domain, "setup"):
+            async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                result = await task
     except asyncio.TimeoutError:
         _LOGGER.error(
             "Setup of %s is taking longer than %s seconds."
@@ -225,9 +393,14 @@ async def _async_setup_component(
     await asyncio.sleep(0)
     await hass.config_entries.flow.async_wait_init_flow_finish(domain)
 
+    async def async_setup_entry(entry: "ConfigEntry") -> None:
+        """Set up a config entry and record how long it took."""
+        with track_setup_phase(hass, domain, "config_entry", entry.title):
+            await entry.async_setup(hass, integration=integration)
+
     await asyncio.gather(
         *[
-            entry.async_setup(hass, integration=integration)
+            async_setup_entry(entry)
             for entry in hass.config_entries.async_entries(domain)
         ]
     )
@@ -317,10 +490,11 @@ async def async_process_deps_reqs(
         raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
-        async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
-            )
+        with track_setup_phase(hass, integration.domain, "requirements"):
+            async with hass.timeout.async_freeze(integration.domain):
+                await requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                )
 
     processed.add(integration.domain)
 
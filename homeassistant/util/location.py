@@ -6,7 +6,7 @@ detect_location_info and elevation are mocked by default during tests.
 import asyncio
 import collections
 import math
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
 
 import aiohttp
 
@@ -24,6 +24,12 @@ FLATTENING = 1 / 298.257223563
 AXIS_B = 6356752.314245
 
 MILES_PER_KILOMETER = 0.621371
+# Shortest distance covered by one degree of latitude, at the equator
+METERS_PER_DEGREE = 110574
+# Mean radius of the earth in meters
+EARTH_RADIUS = 6371008.8
+# Ratio between distances on a sphere that covers the error versus the spheroid
+SPHERE_TOLERANCE = 1.03
 MAX_ITERATIONS = 200
 CONVERGENCE_THRESHOLD = 1e-12
 
@@ -215,3 +221,182 @@ async def _get_ip_api(session: aiohttp.ClientSession) -> Optional[Dict[str, Any]
         "latitude": raw_info.get("lat"),
         "longitude": raw_info.get("lon"),
     }
+
+
+class GridIndex:
+    """Spatial index of circles on a grid of latitude/longitude cells.
+
+    Every item is registered in the cells its bounding box overlaps, queries
+    return the items registered in the cells around a point. This is a
+    superset of the matching items, callers calculate the exact distances.
+
+    Cells hold tuples that are replaced on updates, so queries are safe to run
+    outside of the thread that updates the index.
+    """
+
+    def __init__(self, cell_size: float = 0.01, max_cells: int = 64):
+        """Initialize the index.
+
+        cell_size: size of a cell in degrees.
+        max_cells: items and queries covering more cells are not looked up in
+        the grid, they are added to or compared with every item instead.
+        """
+        self.cell_size = cell_size
+        self.max_cells = max_cells
+        self.items: Dict[Hashable, Tuple[float, float, float]] = {}
+        self._cells: Dict[Tuple[int, int], Tuple[Hashable, ...]] = {}
+        self._large: Tuple[Hashable, ...] = ()
+
+    def __len__(self) -> int:
+        """Return the number of items in the index."""
+        return len(self.items)
+
+    def _cell_range(
+        self, latitude: float, longitude: float, radius: float
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Return the cells overlapped by a circle, None if there are too many."""
+        # Add a margin for the difference between the spheroid and a sphere
+        lat_delta = radius * 1.01 / METERS_PER_DEGREE
+        min_lat, max_lat = latitude - lat_delta, latitude + lat_delta
+        if min_lat < -89 or max_lat > 89:
+            return None
+
+        lon_delta = lat_delta / math.cos(math.radians(max(-min_lat, max_lat)))
+        min_lon, max_lon = longitude - lon_delta, longitude + lon_delta
+        if min_lon < -180 or max_lon > 180:
+            return None
+
+        size = self.cell_size
+        cells = (
+            math.floor(min_lat / size),
+            math.floor(max_lat / size),
+            math.floor(min_lon / size),
+            math.floor(max_lon / size),
+        )
+        if (cells[1] - cells[0] + 1) * (cells[3] - cells[2] + 1) > self.max_cells:
+            return None
+
+        return cells
+
+    def _cells_of(
+        self, latitude: float, longitude: float, radius: float
+    ) -> Optional[List[Tuple[int, int]]]:
+        """Return the cells overlapped by a circle, None if there are too many."""
+        cell_range = self._cell_range(latitude, longitude, radius)
+        if cell_range is None:
+            return None
+
+        min_lat, max_lat, min_lon, max_lon = cell_range
+        return [
+            (lat, lon)
+            for lat in range(min_lat, max_lat + 1)
+            for lon in range(min_lon, max_lon + 1)
+        ]
+
+    def add(self, key: Hashable, latitude: float, longitude: float, radius: float):
+        """Add or move an item."""
+        if key in self.items:
+            self.remove(key)
+
+        self.items[key] = (latitude, longitude, radius)
+        cells = self._cells_of(latitude, longitude, radius)
+
+        if cells is None:
+            self._large += (key,)
+            return
+
+        for cell in cells:
+            self._cells[cell] = self._cells.get(cell, ()) + (key,)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove an item if it is in the index."""
+        item = self.items.pop(key, None)
+        if item is None:
+            return
+
+        cells = self._cells_of(*item)
+
+        if cells is None:
+            self._large = tuple(other for other in self._large if other != key)
+            return
+
+        for cell in cells:
+            remaining = tuple(other for other in self._cells[cell] if other != key)
+            if remaining:
+                self._cells[cell] = remaining
+            else:
+                del self._cells[cell]
+
+    def candidates(
+        self, latitude: float, longitude: float, radius: float = 0
+    ) -> Set[Hashable]:
+        """Return the items which might overlap a circle around a point."""
+        cells = self._cells_of(latitude, longitude, radius)
+        if cells is None:
+            return set(self.items)
+
+        found = set(self._large)
+        for cell in cells:
+            found.update(self._cells.get(cell, ()))
+        return found
+
+    def nearest_candidates(
+        self,
+        latitude: float,
+        longitude: float,
+        keys: Optional[Iterable[Hashable]] = None,
+    ) -> Set[Hashable]:
+        """Return the items among which the one closest to a point is.
+
+        The search is limited to keys if given.
+        """
+        allowed = set(self.items) if keys is None else set(keys)
+        radius = self.cell_size * METERS_PER_DEGREE
+
+        while True:
+            if self._cell_range(latitude, longitude, radius) is None:
+                return self._nearest_by_sphere(latitude, longitude, allowed)
+
+            found = self.candidates(latitude, longitude, radius) & allowed
+
+            # Every item with its center within the radius is a candidate,
+            # so once one of them is, the closest one is too.
+            for key in found:
+                item = self.items.get(key)
+                if item is None:
+                    continue
+                item_dist = distance(latitude, longitude, item[0], item[1])
+                if item_dist is not None and item_dist <= radius:
+                    return found
+
+            radius *= 4
+
+    def _nearest_by_sphere(
+        self, latitude: float, longitude: float, keys: Set[Hashable]
+    ) -> Set[Hashable]:
+        """Return the items among which the closest is, using a sphere.
+
+        Distances on a sphere are cheap to calculate and within a percent of
+        the ones on the spheroid, which leaves only the items which are about
+        as close as the closest one.
+        """
+        distances = {
+            key: _sphere_distance(latitude, longitude, *self.items[key][:2])
+            for key in keys
+            if key in self.items
+        }
+        if not distances:
+            return set()
+
+        max_dist = min(distances.values()) * SPHERE_TOLERANCE + 1
+        return {key for key, dist in distances.items() if dist <= max_dist}
+
+
+def _sphere_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate the distance in meters between two points on a sphere."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    hav = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(hav)))
@@ -1,13 +1,14 @@
 """YAML utility functions."""
 from .const import _SECRET_NAMESPACE, SECRET_YAML
 from .dumper import dump, save_yaml
-from .loader import clear_secret_cache, load_yaml, secret_yaml
+from .loader import clear_document_cache, clear_secret_cache, load_yaml, secret_yaml
 
 __all__ = [
     "SECRET_YAML",
     "_SECRET_NAMESPACE",
     "dump",
     "save_yaml",
+    "clear_document_cache",
     "clear_secret_cache",
     "load_yaml",
     "secret_yaml",
@@ -1,10 +1,13 @@
 """Custom loader."""
 from collections import OrderedDict
+from copy import deepcopy
 import fnmatch
 import logging
 import os
 import sys
-from typing import Dict, Iterator, List, TypeVar, Union, overload
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple, TypeVar, Union, overload
 
 import yaml
 
@@ -32,6 +35,17 @@ DICT_T = TypeVar("DICT_T", bound=Dict)  # pylint: disable=invalid-name
 _LOGGER = logging.getLogger(__name__)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
 
+# Files modified this recently are not cached, their modification time might
+# not change when they are modified again.
+RACY_WINDOW = 2
+
+FILE_STAT = Optional[Tuple[int, int]]  # pylint: disable=invalid-name
+
+# Parsed documents by path, with the stats of the files and dirs they depend on
+_DOCUMENT_CACHE: Dict[str, Tuple[Dict[Optional[str], FILE_STAT], JSON_TYPE]] = {}
+# Dependencies of the files being loaded by the current thread
+_LOADING = threading.local()
+
 
 def clear_secret_cache() -> None:
     """Clear the secret cache.
@@ -41,6 +55,41 @@ def clear_secret_cache() -> None:
     __SECRET_CACHE.clear()
 
 
+def clear_document_cache() -> None:
+    """Clear the cache of parsed YAML files.
+
+    Async friendly.
+    """
+    _DOCUMENT_CACHE.clear()
+
+
+def _file_stat(path: str) -> FILE_STAT:
+    """Return the modification time and size of a file or dir."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _loading() -> List[Dict[Optional[str], FILE_STAT]]:
+    """Return the dependencies of the files being loaded by this thread."""
+    if not hasattr(_LOADING, "stack"):
+        _LOADING.stack = []
+    return _LOADING.stack
+
+
+def _add_dependencies(dependencies: Dict[Optional[str], FILE_STAT]) -> None:
+    """Record dependencies of the files being loaded."""
+    for loading in _loading():
+        loading.update(dependencies)
+
+
+def _add_volatile_dependency() -> None:
+    """Prevent caching the files being loaded."""
+    _add_dependencies({None: None})
+
+
 class SafeLineLoader(yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
 
@@ -52,13 +101,79 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+if hasattr(yaml, "CSafeLoader"):
+
+    class CSafeLineLoader(yaml.CSafeLoader):  # type: ignore
+        """Loader class using libyaml.
+
+        The nodes created by libyaml keep track of line numbers in their marks.
+        """
+
+        def __init__(self, stream):  # type: ignore
+            """Initialize the loader."""
+            super().__init__(stream)
+            self.stream = stream
+            self.name = getattr(stream, "name", "<file>")
+
+
+else:
+    CSafeLineLoader = None
+
+
 def load_yaml(fname: str) -> JSON_TYPE:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    Parsed files are cached until the files and dirs they depend on change.
+    """
+    cached = _DOCUMENT_CACHE.get(fname)
+    if cached is not None:
+        dependencies, document = cached
+        if all(_file_stat(path) == stat for path, stat in dependencies.items()):
+            _add_dependencies(dependencies)
+            return deepcopy(document)
+
+    started = time.time_ns()
+    dependencies = {}
+    _loading().append(dependencies)
+    try:
+        _add_file_dependency(fname)
+        document = _parse_yaml(fname)
+    finally:
+        _loading().pop()
+    _add_dependencies(dependencies)
+
+    racy = started - RACY_WINDOW * 10 ** 9
+    if None not in dependencies and all(
+        stat is None or stat[0] < racy for stat in dependencies.values()
+    ):
+        _DOCUMENT_CACHE[fname] = (dependencies, deepcopy(document))
+
+    return document
+
+
+def _add_file_dependency(fname: str) -> None:
+    """Record a file or dir the files being loaded depend on."""
+    stat = _file_stat(fname)
+    _add_dependencies({fname: stat})
+
+
+def _parse_yaml(fname: str) -> JSON_TYPE:
+    """Parse a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
+            # Files are opened from mocks in tests, don't cache them
+            if _file_stat(fname) is None:
+                _add_volatile_dependency()
             # If configuration file is empty YAML returns None
             # We convert that to an empty dict
-            return yaml.load(conf_file, Loader=SafeLineLoader) or OrderedDict()
+            if CSafeLineLoader is None:
+                return yaml.load(conf_file, Loader=SafeLineLoader) or OrderedDict()
+            try:
+                return yaml.load(conf_file, Loader=CSafeLineLoader) or OrderedDict()
+            except yaml.YAMLError:
+                # Parse again to report errors like the pure Python loader
+                conf_file.seek(0)
+                return yaml.load(conf_file, Loader=SafeLineLoader) or OrderedDict()
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc)
@@ -122,7 +237,11 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
+    # Files added to or removed from the dirs change the included documents
+    _add_file_dependency(directory)
     for root, dirs, files in os.walk(directory, topdown=True):
+        if root != directory:
+            _add_file_dependency(root)
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -226,6 +345,7 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
 
 def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
+    _add_volatile_dependency()
     args = node.value.split()
 
     # Check for a default value
@@ -268,6 +388,8 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     secret_path = os.path.dirname(loader.name)
     while True:
+        # Secrets are cached separately, depend on the secrets files directly
+        _add_file_dependency(os.path.join(secret_path, SECRET_YAML))
         secrets = _load_secret_yaml(secret_path)
 
         if node.value in secrets:
@@ -285,6 +407,9 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         if not os.path.exists(secret_path) or len(secret_path) < 5:
             break  # Somehow we got past the .homeassistant config folder
 
+    # Secrets from keyring and credstash can change at any time
+    _add_volatile_dependency()
+
     if keyring:
         # do some keyring stuff
         pwd = keyring.get_password(_SECRET_NAMESPACE, node.value)
@@ -325,3 +450,7 @@ yaml.SafeLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
 yaml.SafeLoader.add_constructor(
     "!include_dir_merge_named", _include_dir_merge_named_yaml
 )
+
+if CSafeLineLoader is not None:
+    # Share the constructors registered for SafeLoader, also when replaced later
+    CSafeLineLoader.yaml_constructors = yaml.SafeLoader.yaml_constructors
@@ -11,6 +11,7 @@ from . import (
     dependencies,
     json,
     manifest,
+    manifests,
     services,
     ssdp,
     translations,
@@ -24,6 +25,7 @@ INTEGRATION_PLUGINS = [
     config_flow,
     dependencies,
     manifest,
+    manifests,
     services,
     ssdp,
     translations,
@@ -53,6 +53,7 @@ MANIFEST_SCHEMA = vol.Schema(
         vol.Optional("requirements"): [str],
         vol.Optional("dependencies"): [str],
         vol.Optional("after_dependencies"): [str],
+        vol.Optional("preload_platforms"): [str],
         vol.Required("codeowners"): [str],
     }
 )
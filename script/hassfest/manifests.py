@@ -0,0 +1,70 @@
+"""Generate manifests file."""
+import json
+import re
+from typing import Dict
+
+from .model import Config, Integration
+
+BASE = """
+\"\"\"Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+\"\"\"
+
+# fmt: off
+
+MANIFESTS = {}
+""".strip()
+
+# JSON strings are matched as well, so literals inside of them are left alone
+JSON_TOKEN = re.compile(r'"(?:\\.|[^"\\])*"|\b(?:true|false|null)\b')
+PYTHON_LITERALS = {"true": "True", "false": "False", "null": "None"}
+
+
+def to_python(value):
+    """Format a JSON serializable value as a Python literal."""
+    return JSON_TOKEN.sub(
+        lambda match: PYTHON_LITERALS.get(match.group(0), match.group(0)),
+        json.dumps(value, indent=4, sort_keys=True),
+    )
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate manifests data."""
+    data = {}
+
+    for domain in sorted(integrations):
+        integration = integrations[domain]
+
+        if not integration.manifest:
+            continue
+
+        data[domain] = integration.manifest
+
+    return BASE.format(to_python(data))
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate manifests file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.py"
+    config.cache["manifests"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(manifests_path)) as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifests",
+                "File manifests.py is not up to date. "
+                "Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate manifests file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.py"
+    with open(str(manifests_path), "w") as fp:
+        fp.write(f"{config.cache['manifests']}\n")
@@ -1,8 +1,14 @@
 """Test report state."""
+from datetime import timedelta
+
 from homeassistant.components.alexa import state_report
+from homeassistant.util.dt import utcnow
 
 from . import DEFAULT_CONFIG, TEST_URL
 
+from tests.async_mock import patch
+from tests.common import async_fire_time_changed
+
 
 async def test_report_state(hass, aioclient_mock):
     """Test proactive state reports."""
@@ -171,3 +177,135 @@ async def test_doorbell_event(hass, aioclient_mock):
     assert call_json["event"]["header"]["name"] == "DoorbellPress"
     assert call_json["event"]["payload"]["cause"]["type"] == "PHYSICAL_INTERACTION"
     assert call_json["event"]["endpoint"]["endpointId"] == "binary_sensor#test_doorbell"
+
+
+async def test_report_state_queue(hass, aioclient_mock):
+    """Test bursts of state changes are coalesced and rate limited."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+
+    def set_light(state, brightness, name="Test light"):
+        """Set the state of the test light."""
+        hass.states.async_set(
+            "light.test_light",
+            state,
+            {"friendly_name": name, "brightness": brightness, "supported_features": 1},
+        )
+
+    set_light("off", 0)
+
+    unsub = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    set_light("on", 255)
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 1
+
+    # Changes within the rate limit of the endpoint are merged
+    for brightness in (10, 20, 30):
+        set_light("on", brightness)
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 1
+
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=state_report.MIN_REPORT_INTERVAL)
+    )
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 2
+    call_json = aioclient_mock.mock_calls[1][2]
+    changed = call_json["event"]["payload"]["change"]["properties"]
+    assert [(prop["name"], prop["value"]) for prop in changed] == [("brightness", 12)]
+    context = call_json["context"]["properties"]
+    assert ("powerState", "ON") in [(prop["name"], prop["value"]) for prop in context]
+
+    # Changes Alexa doesn't know about are not reported
+    set_light("on", 30, "Renamed light")
+    # Going back to the reported state drops a queued report
+    set_light("on", 40)
+    set_light("on", 30)
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=state_report.MIN_REPORT_INTERVAL * 2)
+    )
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 2
+    assert DEFAULT_CONFIG.report_state_stats == {
+        state_report.STAT_SENT: 2,
+        state_report.STAT_COALESCED: 2,
+        state_report.STAT_SUPPRESSED: 2,
+        state_report.STAT_QUEUE_SIZE: 0,
+    }
+
+    unsub()
+
+
+async def test_report_state_queue_failed(hass, aioclient_mock):
+    """Test values Alexa did not accept are reported again."""
+    aioclient_mock.post(
+        TEST_URL,
+        json={"payload": {"code": "INTERNAL_ERROR", "description": "Mock error"}},
+        status=500,
+    )
+
+    hass.states.async_set("binary_sensor.test_contact", "off", {"device_class": "door"})
+    unsub = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    hass.states.async_set("binary_sensor.test_contact", "on", {"device_class": "door"})
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 1
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.post(TEST_URL, text="", status=202)
+
+    # Alexa still has the old value, so the same value is sent again
+    hass.states.async_set(
+        "binary_sensor.test_contact", "on", {"device_class": "door", "other": 1}
+    )
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 1
+
+    unsub()
+
+
+async def test_report_state_queue_error(hass, aioclient_mock):
+    """Test an error sending one report does not drop the others."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+
+    hass.states.async_set("binary_sensor.test_contact", "off", {"device_class": "door"})
+    hass.states.async_set("binary_sensor.test_window", "off", {"device_class": "door"})
+    unsub = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    orig_send = state_report.async_send_changereport_message
+
+    async def mock_send(hass, config, alexa_entity, **kwargs):
+        if alexa_entity.entity_id == "binary_sensor.test_contact":
+            raise ValueError("Mock error")
+        return await orig_send(hass, config, alexa_entity, **kwargs)
+
+    with patch.object(state_report, "async_send_changereport_message", mock_send):
+        hass.states.async_set(
+            "binary_sensor.test_contact", "on", {"device_class": "door"}
+        )
+        hass.states.async_set(
+            "binary_sensor.test_window", "on", {"device_class": "door"}
+        )
+        await hass.async_block_till_done()
+
+        assert len(aioclient_mock.mock_calls) == 1
+
+        # The queue keeps going after the error
+        hass.states.async_set(
+            "binary_sensor.test_window", "off", {"device_class": "door"}
+        )
+        await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=state_report.MIN_REPORT_INTERVAL)
+        )
+        await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 2
+
+    unsub()
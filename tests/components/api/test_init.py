@@ -8,6 +8,7 @@ import voluptuous as vol
 
 from homeassistant import const
 from homeassistant.bootstrap import DATA_LOGGING
+from homeassistant.components import api
 import homeassistant.core as ha
 from homeassistant.setup import async_setup_component
 
@@ -351,6 +352,79 @@ async def test_stream_with_restricted(hass, mock_api_client):
     assert data["event_type"] == "test_event3"
 
 
+async def test_stream_with_entity_filters(hass, mock_api_client):
+    """Test the stream filtered by entity_id and domain."""
+    resp = await mock_api_client.get(
+        f"{const.URL_API_STREAM}?entity_id=light.kitchen&domain=switch"
+    )
+    assert resp.status == 200
+
+    hass.bus.async_fire("test_event")
+    hass.states.async_set("sensor.temperature", "20")
+    hass.states.async_set("light.kitchen", "on")
+    data = await _stream_next_event(resp.content)
+    assert data["data"]["entity_id"] == "light.kitchen"
+
+    hass.states.async_set("light.living_room", "on")
+    hass.states.async_set("switch.fan", "on")
+    data = await _stream_next_event(resp.content)
+    assert data["data"]["entity_id"] == "switch.fan"
+
+
+async def test_stream_invalid_overflow(hass, mock_api_client):
+    """Test the stream rejects an unknown overflow policy."""
+    resp = await mock_api_client.get(f"{const.URL_API_STREAM}?overflow=block")
+    assert resp.status == 400
+
+
+async def test_stream_hub_shares_payload(hass):
+    """Test events are encoded once for all clients of the stream."""
+    hub = api.StreamHub(hass)
+    listen_count = _listen_count(hass)
+    all_events = api.StreamClient()
+    test_events = api.StreamClient(event_types={"test_event"})
+    other_events = api.StreamClient(event_types={"other_event"})
+
+    remove_clients = [
+        hub.async_add_client(client)
+        for client in (all_events, test_events, other_events)
+    ]
+    assert listen_count + 1 == _listen_count(hass)
+
+    hass.bus.async_fire("test_event", {"hello": "world"})
+    await hass.async_block_till_done()
+
+    message = all_events.queue.get_nowait()
+    assert test_events.queue.get_nowait() is message
+    assert other_events.queue.empty()
+    assert json.loads(message.decode()[6:])["data"] == {"hello": "world"}
+
+    for remove_client in remove_clients:
+        remove_client()
+    assert listen_count == _listen_count(hass)
+
+
+async def test_stream_client_overflow(hass):
+    """Test the overflow policies of slow stream clients."""
+    with patch("homeassistant.components.api.STREAM_QUEUE_SIZE", 2):
+        dropping = api.StreamClient()
+        closing = api.StreamClient(overflow=api.STREAM_OVERFLOW_CLOSE)
+
+    for message in (b"1", b"2", b"3"):
+        dropping.async_put(message)
+        closing.async_put(message)
+
+    assert dropping.queue.qsize() == 2
+    assert dropping.dropped == 1
+    assert not dropping.closed
+    assert closing.dropped == 0
+    assert closing.closed
+
+    # Stopping closes a full stream right away
+    dropping.async_close()
+    assert dropping.closed
+
+
 async def _stream_next_event(stream):
     """Read the stream for next event while ignoring ping."""
     while True:
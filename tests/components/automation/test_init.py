@@ -567,7 +567,9 @@ async def test_reload_config_handles_load_fails(hass, calls):
     assert len(calls) == 2
 
 
-@pytest.mark.parametrize("service", ["turn_off_stop", "turn_off_no_stop", "reload"])
+@pytest.mark.parametrize(
+    "service", ["turn_off_stop", "turn_off_no_stop", "reload", "reload_unchanged"]
+)
 async def test_automation_stops(hass, calls, service):
     """Test that turning off / reloading stops any running actions as appropriate."""
     entity_id = "automation.hello"
@@ -613,17 +615,22 @@ async def test_automation_stops(hass, calls, service):
             blocking=True,
         )
     else:
+        new_config = config
+        if service == "reload":
+            new_config = {
+                automation.DOMAIN: {**config[automation.DOMAIN], "mode": "queued"}
+            }
         with patch(
             "homeassistant.config.load_yaml_config_file",
             autospec=True,
-            return_value=config,
+            return_value=new_config,
         ):
             await common.async_reload(hass)
 
     hass.states.async_set(test_entity, "goodbye")
     await hass.async_block_till_done()
 
-    assert len(calls) == (1 if service == "turn_off_no_stop" else 0)
+    assert len(calls) == (0 if service in ("turn_off_stop", "reload") else 1)
 
 
 async def test_automation_restore_state(hass):
@@ -1101,3 +1108,76 @@ async def test_logbook_humanify_automation_triggered_event(hass):
     assert event2["domain"] == "automation"
     assert event2["message"] == "has been triggered"
     assert event2["entity_id"] == "automation.bye"
+
+
+async def test_reload_only_changed_automations(hass, calls):
+    """Test reload only replaces the automations that changed."""
+    config = {
+        automation.DOMAIN: [
+            {
+                "id": "unchanged",
+                "alias": "hello",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+            {
+                "id": "changed",
+                "alias": "bye",
+                "trigger": {"platform": "event", "event_type": "test_event2"},
+                "action": {"service": "test.automation"},
+            },
+            {
+                "alias": "removed",
+                "trigger": {"platform": "event", "event_type": "test_event3"},
+                "action": {"service": "test.automation"},
+            },
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+    component = hass.data[automation.DOMAIN]
+    unchanged = component.get_entity("automation.hello")
+    changed = component.get_entity("automation.bye")
+
+    new_config = {
+        automation.DOMAIN: [
+            config[automation.DOMAIN][0],
+            {
+                **config[automation.DOMAIN][1],
+                "trigger": {"platform": "event", "event_type": "test_event4"},
+            },
+            {
+                "alias": "added",
+                "trigger": {"platform": "event", "event_type": "test_event5"},
+                "action": {"service": "test.automation"},
+            },
+        ]
+    }
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=new_config,
+    ), patch(
+        "homeassistant.components.automation.async_initialize_triggers",
+        wraps=automation.async_initialize_triggers,
+    ) as mock_attach:
+        await common.async_reload(hass)
+        await hass.async_block_till_done()
+
+    # Only the changed and added automations attached their triggers
+    assert mock_attach.call_count == 2
+    assert component.get_entity("automation.hello") is unchanged
+    assert component.get_entity("automation.bye") is not changed
+    assert hass.states.get("automation.removed") is None
+    assert hass.states.get("automation.added") is not None
+
+    listeners = hass.bus.async_listeners()
+    assert listeners.get("test_event") == 1
+    assert listeners.get("test_event2") is None
+    assert listeners.get("test_event3") is None
+    assert listeners.get("test_event4") == 1
+
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("test_event4")
+    hass.bus.async_fire("test_event5")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
@@ -69,6 +69,32 @@ async def test_get_image_from_camera(hass, image_mock_url):
     assert image.content == b"Test"
 
 
+async def test_get_image_from_stream(hass, hass_client, mock_camera, mock_stream):
+    """Test images are taken from the active stream of a camera."""
+    with patch("homeassistant.components.stream.Stream.start"), patch(
+        "homeassistant.components.demo.camera.DemoCamera.stream_source",
+        return_value="http://example.com",
+    ):
+        await camera.async_request_stream(hass, "camera.demo_camera", "hls")
+
+    stream = hass.data["stream"]["streams"]["http://example.com"]
+
+    # No keyframe was decoded yet, but the stream now decodes them
+    image = await camera.async_get_image(hass, "camera.demo_camera")
+    assert image.content == b"Test"
+    assert stream.wants_image()
+
+    stream.set_image(b"Keyframe")
+    image = await camera.async_get_image(hass, "camera.demo_camera")
+    assert image.content_type == "image/jpeg"
+    assert image.content == b"Keyframe"
+
+    client = await hass_client()
+    resp = await client.get("/api/camera_proxy/camera.demo_camera")
+    assert resp.status == 200
+    assert await resp.read() == b"Keyframe"
+
+
 async def test_get_stream_source_from_camera(hass, mock_camera):
     """Fetch stream source from camera entity."""
 
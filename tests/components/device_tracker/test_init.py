@@ -1,4 +1,5 @@
 """The tests for the device tracker component."""
+import asyncio
 from datetime import datetime, timedelta
 import json
 import logging
@@ -122,6 +123,78 @@ async def test_reading_yaml_config(hass, yaml_devices):
     assert device.icon == config.icon
 
 
+async def test_new_devices_written_together(hass, yaml_devices):
+    """Test devices seen while writing the YAML file are added in one write."""
+    tracker = legacy.DeviceTracker(hass, timedelta(seconds=60), True, {}, [])
+
+    with patch(
+        "homeassistant.components.device_tracker.legacy.update_config_devices",
+        wraps=legacy.update_config_devices,
+    ) as mock_write:
+        await asyncio.gather(
+            *(tracker.async_see(mac=f"AB:CD:EF:01:02:{idx:02}") for idx in range(10))
+        )
+        await hass.async_block_till_done()
+
+    assert mock_write.call_count == 1
+    config = await legacy.async_load_config(yaml_devices, hass, timedelta(seconds=0))
+    assert sorted(device.mac for device in config) == [
+        f"AB:CD:EF:01:02:{idx:02}" for idx in range(10)
+    ]
+
+
+async def test_store_known_devices(hass, hass_storage, yaml_devices):
+    """Test new devices are kept in the store instead of the YAML file."""
+    hass_storage[legacy.STORAGE_KEY] = {
+        "version": legacy.STORAGE_VERSION,
+        "key": legacy.STORAGE_KEY,
+        "data": {
+            "devices": [
+                {
+                    "dev_id": "stored",
+                    "name": "Stored",
+                    "mac": "AB:CD:EF:01:02:03",
+                    "icon": None,
+                    "picture": None,
+                    "track": True,
+                },
+                {
+                    "dev_id": "configured",
+                    "name": "Overridden",
+                    "mac": None,
+                    "icon": None,
+                    "picture": None,
+                    "track": True,
+                },
+            ]
+        },
+    }
+    await hass.async_add_executor_job(
+        legacy.update_config,
+        yaml_devices,
+        "configured",
+        legacy.Device(hass, timedelta(seconds=60), True, "configured", None, "YAML"),
+    )
+
+    tracker = await legacy.get_tracker(
+        hass, {device_tracker.DOMAIN: [{const.CONF_STORE_KNOWN_DEVICES: True}]}
+    )
+    assert tracker.mac_to_dev["AB:CD:EF:01:02:03"].name == "Stored"
+    assert tracker.devices["configured"].name == "YAML"
+
+    await tracker.async_see(dev_id="new_device")
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=legacy.STORAGE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    stored = hass_storage[legacy.STORAGE_KEY]["data"]["devices"]
+    assert [config["dev_id"] for config in stored] == ["stored", "new_device"]
+    config = await legacy.async_load_config(yaml_devices, hass, timedelta(seconds=0))
+    assert [device.dev_id for device in config] == ["configured"]
+
+
 @patch("homeassistant.components.device_tracker.const.LOGGER.warning")
 async def test_duplicate_mac_dev_id(mock_warning, hass):
     """Test adding duplicate MACs or device IDs to DeviceTracker."""
@@ -274,6 +274,39 @@ async def test_discover_lights(hue_client):
     assert "00:1c:72:08:ed:09:e7:89-77" in devices  # scene.light_off
 
 
+async def test_discover_lights_cached(hass_hue, hue_client):
+    """Test polling the lights only renders entities that changed."""
+    with patch.object(
+        hue_api, "entity_to_json", wraps=hue_api.entity_to_json
+    ) as mock_to_json:
+        first = await (await hue_client.get("/api/username/lights")).read()
+        rendered = len(mock_to_json.mock_calls)
+        assert rendered > 0
+
+        assert await (await hue_client.get("/api/username/lights")).read() == first
+        full_state = await hue_client.get(f"/api/{HUE_API_USERNAME}")
+        assert json.loads(first) == (await full_state.json())["lights"]
+        assert len(mock_to_json.mock_calls) == rendered
+
+        # Hidden entities don't invalidate the cache
+        hass_hue.states.async_set("light.bed_light", "off")
+        await hass_hue.async_block_till_done()
+        assert await (await hue_client.get("/api/username/lights")).read() == first
+        assert len(mock_to_json.mock_calls) == rendered
+
+        hass_hue.states.async_set("light.ceiling_lights", "off")
+        await hass_hue.async_block_till_done()
+        result_json = await (await hue_client.get("/api/username/lights")).json()
+        assert len(mock_to_json.mock_calls) == rendered + 1
+
+    ceiling = next(
+        val
+        for val in result_json.values()
+        if val["uniqueid"] == "00:2f:d2:31:ce:c5:55:cc-ee"
+    )
+    assert ceiling["state"][HUE_API_STATE_ON] is False
+
+
 async def test_light_without_brightness_supported(hass_hue, hue_client):
     """Test that light without brightness is supported."""
     light_without_brightness_json = await perform_get_light_state(
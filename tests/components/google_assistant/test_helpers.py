@@ -214,16 +214,23 @@ async def test_agent_user_id_connect():
     assert store.pop_agent_user_id.call_args == call("agent_1")
 
 
-@pytest.mark.parametrize("agents", [{}, {"1"}, {"1", "2"}])
-async def test_report_state_all(agents):
+@pytest.mark.parametrize(
+    "agents, result", [({}, 200), ({"1": 200}, 200), ({"1": 200, "2": 500}, 500)],
+)
+async def test_report_state_all(agents, result):
     """Test a disconnect message."""
-    config = MockConfig(agent_user_ids=agents)
+    config = MockConfig(agent_user_ids=set(agents.keys()))
     data = {}
-    with patch.object(config, "async_report_state") as mock:
-        await config.async_report_state_all(data)
+    with patch.object(
+        config,
+        "async_report_state",
+        side_effect=lambda message, agent_user_id: agents[agent_user_id],
+    ) as mock:
+        res = await config.async_report_state_all(data)
         assert sorted(mock.mock_calls) == sorted(
             [call(data, agent) for agent in agents]
         )
+        assert res == result
 
 
 @pytest.mark.parametrize(
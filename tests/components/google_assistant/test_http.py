@@ -154,8 +154,10 @@ async def test_report_state(hass, aioclient_mock, hass_storage):
     await config.async_connect_agent_user(agent_user_id)
     message = {"devices": {}}
 
-    with patch.object(config, "async_call_homegraph_api") as mock_call:
-        await config.async_report_state(message, agent_user_id)
+    with patch.object(
+        config, "async_call_homegraph_api", return_value=200
+    ) as mock_call:
+        assert await config.async_report_state(message, agent_user_id) == 200
         mock_call.assert_called_once_with(
             REPORT_STATE_BASE_URL,
             {"requestId": ANY, "agentUserId": agent_user_id, "payload": message},
@@ -1,7 +1,14 @@
 """Test Google report state."""
+from datetime import timedelta
+
 from homeassistant.components.google_assistant import error, report_state
+from homeassistant.components.google_assistant.const import REPORT_STATE_BASE_URL
+from homeassistant.components.google_assistant.http import GoogleConfig
+from homeassistant.const import HTTP_INTERNAL_SERVER_ERROR, HTTP_OK
 from homeassistant.util.dt import utcnow
 
+from .test_http import DUMMY_CONFIG, MOCK_TOKEN
+
 from . import BASIC_CONFIG
 
 from tests.async_mock import AsyncMock, patch
@@ -14,7 +21,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     hass.states.async_set("switch.ac", "on")
 
     with patch.object(
-        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=HTTP_OK)
     ) as mock_report, patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
         unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
 
@@ -33,11 +40,19 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     }
 
     with patch.object(
-        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=HTTP_OK)
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
 
+        # Changes are collected until the report window has passed
+        assert len(mock_report.mock_calls) == 0
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
+
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
         "devices": {"states": {"light.kitchen": {"on": True, "online": True}}}
@@ -46,24 +61,32 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     # Test that state changes that change something that Google doesn't care about
     # do not trigger a state report.
     with patch.object(
-        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=HTTP_OK)
     ) as mock_report:
         hass.states.async_set(
             "light.kitchen", "on", {"irrelevant": "should_be_ignored"}
         )
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
 
     # Test that entities that we can't query don't report a state
     with patch.object(
-        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=HTTP_OK)
     ) as mock_report, patch(
         "homeassistant.components.google_assistant.report_state.GoogleEntity.query_serialize",
         side_effect=error.SmartHomeError("mock-error", "mock-msg"),
     ):
         hass.states.async_set("light.kitchen", "off")
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
@@ -71,9 +94,114 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     unsub()
 
     with patch.object(
-        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=HTTP_OK)
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_coalesced(
+    hass, aioclient_mock, hass_storage, legacy_patchable_time
+):
+    """Test state changes within the report window are sent in one request."""
+    aioclient_mock.post(REPORT_STATE_BASE_URL, json={})
+    aioclient_mock.post("https://accounts.google.com/o/oauth2/token", json=MOCK_TOKEN)
+    config = GoogleConfig(hass, DUMMY_CONFIG)
+    await config.async_initialize()
+    await config.async_connect_agent_user("user")
+
+    with patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
+        unsub = report_state.async_enable_report_state(hass, config)
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+    for idx in range(30):
+        hass.states.async_set(f"light.light_{idx}", "on")
+    hass.states.async_set("light.light_0", "off")
+    hass.states.async_set("light.light_1", "on", {"irrelevant": True})
+    await hass.async_block_till_done()
+
+    assert not any(
+        str(call[1]) == REPORT_STATE_BASE_URL for call in aioclient_mock.mock_calls
+    )
+
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+    )
+    await hass.async_block_till_done()
+
+    reports = [
+        call
+        for call in aioclient_mock.mock_calls
+        if str(call[1]) == REPORT_STATE_BASE_URL
+    ]
+    assert len(reports) == 1
+    states = reports[0][2]["payload"]["devices"]["states"]
+    assert len(states) == 30
+    assert states["light.light_0"] == {"on": False, "online": True}
+
+    assert config.report_state_stats == {
+        report_state.STAT_SENT: 1,
+        report_state.STAT_ENTITIES: 30,
+        report_state.STAT_COALESCED: 1,
+        report_state.STAT_SUPPRESSED: 1,
+    }
+
+    unsub()
+
+
+async def test_report_state_failed(hass, legacy_patchable_time):
+    """Test states are reported again after Google did not accept them."""
+    hass.states.async_set("light.kitchen", "off")
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=HTTP_OK)
+    ), patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+    with patch.object(
+        BASIC_CONFIG,
+        "async_report_state_all",
+        AsyncMock(return_value=HTTP_INTERNAL_SERVER_ERROR),
+    ) as mock_report:
+        hass.states.async_set("light.kitchen", "on")
+        await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+
+    # Google still has the light off, so the next change reports it again
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(return_value=HTTP_OK)
+    ) as mock_report:
+        hass.states.async_set("light.kitchen", "on", {"irrelevant": True})
+        await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW * 2)
+        )
+        await hass.async_block_till_done()
+
+        hass.states.async_set("light.kitchen", "on", {"irrelevant": False})
+        await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW * 3)
+        )
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {"states": {"light.kitchen": {"on": True, "online": True}}}
+    }
+
+    unsub()
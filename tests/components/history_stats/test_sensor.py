@@ -149,6 +149,146 @@ class TestHistoryStatsSensor(unittest.TestCase):
         assert sensor3.state == 2
         assert sensor4.state == 50
 
+    @patch(
+        "homeassistant.helpers.template.TemplateEnvironment.is_safe_callable",
+        return_value=True,
+    )
+    def test_measure_incremental(self, mock):
+        """Test the recorder is only queried when the period starts earlier."""
+        now = dt_util.utcnow()
+        t0 = now - timedelta(minutes=40)
+        t1 = t0 + timedelta(minutes=20)
+        t2 = now - timedelta(minutes=10)
+
+        # Start     t0        t1        t2        End
+        # |--20min--|--20min--|--10min--|--10min--|
+        # |---off---|---on----|---off---|---on----|
+
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "on", last_changed=t0),
+                ha.State("binary_sensor.test_id", "off", last_changed=t1),
+            ]
+        }
+
+        start = Template("{{ as_timestamp(now()) - 3600 }}", self.hass)
+        end = Template("{{ now() }}", self.hass)
+
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", start, end, None, "count", "test"
+        )
+        # State changed events are tracked since before the first update
+        sensor._tracking_since = t0.timestamp()
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ) as mock_changes, patch(
+            "homeassistant.components.history.get_state", return_value=None
+        ), patch(
+            "homeassistant.util.dt.now", return_value=now
+        ) as mock_now:
+            sensor.update()
+            assert sensor.state == 1
+
+            # Changes are picked up from state changed events
+            sensor._pending_changes.append((t1.timestamp(), False))
+            sensor._pending_changes.append((t2.timestamp(), True))
+            mock_now.return_value = now + timedelta(seconds=5)
+            sensor.update()
+            assert sensor.state == 2
+
+            # A sliding window only drops old changes from memory, the entity
+            # was already on at the new period start
+            mock_now.return_value = now + timedelta(minutes=55)
+            sensor.update()
+            assert sensor.state == 0
+            assert sensor._history_start_state
+            assert len(sensor._history) == 0
+
+        assert mock_changes.call_count == 1
+
+    @patch(
+        "homeassistant.helpers.template.TemplateEnvironment.is_safe_callable",
+        return_value=True,
+    )
+    def test_measure_incremental_start_state(self, mock):
+        """Test a state that started before the new period start is not counted."""
+        now = dt_util.utcnow()
+        t0 = now - timedelta(minutes=40)
+
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "on", last_changed=t0),
+            ]
+        }
+
+        start = Template("{{ as_timestamp(now()) - 3600 }}", self.hass)
+        end = Template("{{ now() }}", self.hass)
+
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", start, end, None, "count", "test"
+        )
+        sensor._tracking_since = t0.timestamp()
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ) as mock_changes, patch(
+            "homeassistant.components.history.get_state", return_value=None
+        ), patch(
+            "homeassistant.util.dt.now", return_value=now
+        ) as mock_now:
+            sensor.update()
+            assert sensor.state == 1
+
+            # The entity is still on at the new period start
+            mock_now.return_value = now + timedelta(minutes=30)
+            sensor.update()
+            assert sensor.state == 0
+
+        assert mock_changes.call_count == 1
+
+    @patch(
+        "homeassistant.helpers.template.TemplateEnvironment.is_safe_callable",
+        return_value=True,
+    )
+    def test_measure_reload_after_loaded_end(self, mock):
+        """Test the recorder is queried again when the period ends later."""
+        now = dt_util.utcnow()
+        t0 = now - timedelta(minutes=100)
+
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "on", last_changed=t0),
+            ]
+        }
+
+        start = Template("{{ as_timestamp(now()) - 7200 }}", self.hass)
+        end = Template("{{ as_timestamp(now()) - 3600 }}", self.hass)
+
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", start, end, None, "count", "test"
+        )
+        sensor._tracking_since = now.timestamp()
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ) as mock_changes, patch(
+            "homeassistant.components.history.get_state", return_value=None
+        ), patch(
+            "homeassistant.util.dt.now", return_value=now
+        ) as mock_now:
+            sensor.update()
+            assert mock_changes.call_count == 1
+
+            # Changes between the loaded period end and the start of the state
+            # tracking are only known to the recorder.
+            mock_now.return_value = now + timedelta(minutes=10)
+            sensor.update()
+            assert mock_changes.call_count == 2
+
     def test_wrong_date(self):
         """Test when start or end value is not a timestamp or a date."""
         good = Template("{{ now() }}", self.hass)
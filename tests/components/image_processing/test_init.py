@@ -1,12 +1,14 @@
 """The tests for the image_processing component."""
+import asyncio
+
 import homeassistant.components.http as http
 import homeassistant.components.image_processing as ip
 from homeassistant.const import ATTR_ENTITY_PICTURE
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.setup import setup_component
+from homeassistant.setup import async_setup_component, setup_component
 
-from tests.async_mock import PropertyMock, patch
+from tests.async_mock import MagicMock, PropertyMock, patch
 from tests.common import (
     assert_setup_component,
     get_test_home_assistant,
@@ -286,3 +288,81 @@ class TestImageProcessingFace:
         assert event_data[0]["confidence"] == 98.34
         assert event_data[0]["gender"] == "male"
         assert event_data[0]["entity_id"] == "image_processing.demo_face"
+
+
+async def test_scanner_shares_camera_image(hass):
+    """Test processors scanning together share the image of a camera."""
+    await async_setup_component(hass, "camera", {"camera": {"platform": "demo"}})
+    await async_setup_component(hass, ip.DOMAIN, {})
+    await hass.async_block_till_done()
+    scanner = hass.data[ip.DATA_SCANNER]
+
+    with patch(
+        "homeassistant.components.demo.camera.Path.read_bytes", return_value=b"Test"
+    ) as mock_camera_read, patch(
+        "homeassistant.components.image_processing.time.monotonic", return_value=100
+    ) as mock_monotonic:
+        images = await asyncio.gather(
+            *(scanner.async_get_image("camera.demo_camera", 10) for _ in range(3))
+        )
+        await scanner.async_get_image("camera.demo_camera", 10)
+        assert mock_camera_read.call_count == 1
+        assert [image.content for image in images] == [b"Test"] * 3
+
+        # A later scan fetches a new image
+        mock_monotonic.return_value = 100 + ip.FRAME_SHARE_WINDOW
+        await scanner.async_get_image("camera.demo_camera", 10)
+        assert mock_camera_read.call_count == 2
+
+
+async def test_scanner_drops_stale_images(hass, hass_ws_client):
+    """Test a busy processor only processes the latest image."""
+    await async_setup_component(hass, ip.DOMAIN, {})
+    scanner = hass.data[ip.DATA_SCANNER]
+    processed = []
+    release = asyncio.Event()
+
+    async def mock_process_image(image):
+        """Process an image until released."""
+        await release.wait()
+        processed.append(image)
+
+    entity = MagicMock(entity_id="image_processing.test")
+    entity.async_process_image = mock_process_image
+
+    tasks = [
+        hass.async_create_task(scanner.async_process(entity, image))
+        for image in (b"1", b"2", b"3")
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert processed == [b"1", b"3"]
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "image_processing/stats"})
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    stats = msg["result"]["image_processing.test"]
+    assert stats["processed"] == 2
+    assert stats["dropped"] == 1
+    assert stats["latency"] >= 0
+
+
+async def test_scanner_forgets_removed_entity(hass):
+    """Test the statistics of a removed entity are dropped."""
+    await async_setup_component(hass, ip.DOMAIN, {})
+    scanner = hass.data[ip.DATA_SCANNER]
+
+    entity = ip.ImageProcessingEntity()
+    entity.hass = hass
+    entity.entity_id = "image_processing.test"
+    entity.async_process_image = MagicMock(return_value=asyncio.sleep(0))
+
+    await scanner.async_process(entity, b"1")
+    assert scanner.stats["image_processing.test"]["processed"] == 1
+
+    await entity.async_remove()
+    assert "image_processing.test" not in scanner.stats
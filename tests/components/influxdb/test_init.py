@@ -1,6 +1,7 @@
 """The tests for the InfluxDB component."""
 from dataclasses import dataclass
 import datetime
+import gzip
 
 import pytest
 
@@ -1469,3 +1470,147 @@ async def test_invalid_inputs_error(
             == 1
         )
         sleep.assert_not_called()
+
+
+def _make_state_event(entity_id="fake.something"):
+    """Make a mock state changed event with a numeric state."""
+    domain, object_id = split_entity_id(entity_id)
+    state = MagicMock(
+        state=1, domain=domain, entity_id=entity_id, object_id=object_id, attributes={},
+    )
+    return MagicMock(data={"new_state": state}, time_fired=12345)
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, test_exception",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.exceptions.InfluxDBServerError("fail"),
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.ApiException(),
+        ),
+    ],
+    indirect=["mock_client"],
+)
+async def test_event_listener_spill_and_replay(
+    hass, tmp_path, mock_client, config_ext, get_write_api, test_exception
+):
+    """Test events are buffered on disk while influx is down and replayed."""
+    hass.config.config_dir = str(tmp_path)
+    config_ext = {**config_ext, "spill_size": 1}
+    handler_method = await _setup(hass, mock_client, config_ext, get_write_api)
+    instance = hass.data[influxdb.DOMAIN]
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = test_exception
+
+    handler_method(_make_state_event())
+    instance.block_till_done()
+
+    assert write_api.call_count == 1
+    assert len(instance.spill) == 1
+    assert len(list((tmp_path / ".storage" / "influxdb_spill").iterdir())) == 1
+    assert instance.stats == {"events_spilled": 1}
+
+    write_api.side_effect = None
+    write_api.reset_mock()
+
+    handler_method(_make_state_event("fake.other"))
+    instance.block_till_done()
+
+    # The new event is written first, followed by the buffered one
+    assert write_api.call_count == 2
+    assert len(instance.spill) == 0
+    assert instance.spill.size == 0
+    assert not list((tmp_path / ".storage" / "influxdb_spill").iterdir())
+
+    info = instance.get_info()
+    assert info["events_written"] == 1
+    assert info["batches_written"] == 1
+    assert info["events_replayed"] == 1
+    assert info["queue_size"] == 0
+    assert info["spilled_batches"] == 0
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api",
+    [(influxdb.DEFAULT_API_VERSION, BASE_V1_CONFIG, _get_write_api_mock_v1)],
+    indirect=["mock_client"],
+)
+async def test_event_listener_spill_full(
+    hass, tmp_path, mock_client, config_ext, get_write_api
+):
+    """Test events are dropped when the spill buffer is full."""
+    hass.config.config_dir = str(tmp_path)
+    handler_method = await _setup(
+        hass, mock_client, {**config_ext, "spill_size": 1}, get_write_api
+    )
+    instance = hass.data[influxdb.DOMAIN]
+    instance.spill.max_size = 10
+    get_write_api(mock_client).side_effect = ConnectionError("fail")
+
+    handler_method(_make_state_event())
+    instance.block_till_done()
+
+    assert len(instance.spill) == 0
+    assert instance.stats == {"events_dropped": 1}
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api",
+    [
+        (influxdb.DEFAULT_API_VERSION, BASE_V1_CONFIG, _get_write_api_mock_v1),
+        (influxdb.API_VERSION_2, BASE_V2_CONFIG, _get_write_api_mock_v2),
+    ],
+    indirect=["mock_client"],
+)
+async def test_event_listener_concurrent_writes(
+    hass, mock_client, config_ext, get_write_api
+):
+    """Test batches are written by multiple writers."""
+    handler_method = await _setup(
+        hass, mock_client, {**config_ext, "max_concurrent_writes": 3}, get_write_api
+    )
+    instance = hass.data[influxdb.DOMAIN]
+
+    for idx in range(10):
+        handler_method(_make_state_event(f"fake.entity_{idx}"))
+    instance.block_till_done()
+
+    assert instance.stats["events_written"] == 10
+    assert (
+        sum(
+            len(call[0][0]) if call[0] else len(call[1]["record"])
+            for call in get_write_api(mock_client).call_args_list
+        )
+        == 10
+    )
+
+    instance.queue.put(None)
+    instance.join()
+    assert instance._executor._shutdown
+
+
+async def test_event_listener_gzip(hass, requests_mock):
+    """Test V1 writes are sent as gzip compressed line protocol."""
+    requests_mock.post("http://host:8086/write", status_code=204)
+    config = {"influxdb": {"host": "host", "gzip": True}}
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+    handler_method = hass.bus.listen.call_args_list[0][0][1]
+
+    handler_method(_make_state_event())
+    hass.data[influxdb.DOMAIN].block_till_done()
+
+    request = requests_mock.request_history[-1]
+    assert request.qs == {"db": ["home_assistant"]}
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(request.body) == (
+        b"fake.something,domain=fake,entity_id=something value=1.0 12345\n"
+    )
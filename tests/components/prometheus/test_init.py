@@ -200,6 +200,18 @@ async def test_view(hass, hass_client):
         'friendly_name="SPS30 PM <1µm Weight concentration"} 3.7069' in body
     )
 
+    assert "# TYPE prometheus_scrape_duration_seconds gauge" in body
+    series = next(line for line in body if line.startswith("prometheus_series "))
+    assert float(series.split(" ")[1]) > 0
+
+    # The duration of the previous scrape is exported
+    resp = await client.get(prometheus.API_ENDPOINT)
+    body = (await resp.text()).split("\n")
+    duration = next(
+        line for line in body if line.startswith("prometheus_scrape_duration_seconds ")
+    )
+    assert float(duration.split(" ")[1]) > 0
+
 
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
@@ -364,3 +376,64 @@ async def test_filtered_denylist(hass, mock_client):
         was_called = mock_client.labels.call_count == 1
         assert test.should_pass == was_called
         mock_client.labels.reset_mock()
+
+
+@pytest.mark.usefixtures("mock_bus")
+async def test_labels_cached(hass, mock_client):
+    """Test labeled metrics are only looked up once per entity."""
+    handler_method = await _setup(hass, {})
+
+    handler_method(make_event("fake.cached"))
+    handler_method(make_event("fake.cached"))
+    assert mock_client.labels.call_count == 1
+    assert mock_client.labels.return_value.inc.call_count == 2
+
+    # A new friendly name results in a new series
+    event = make_event("fake.cached")
+    event.data["new_state"].attributes = {"friendly_name": "Cached"}
+    handler_method(event)
+    assert mock_client.labels.call_count == 2
+    assert mock_client.labels.call_args[1] == {
+        "entity": "fake.cached",
+        "domain": "fake",
+        "friendly_name": "Cached",
+    }
+    # The series with the old friendly name is removed
+    mock_client.remove.assert_called_once_with("fake.cached", None, "fake")
+
+
+@pytest.mark.usefixtures("mock_bus")
+async def test_removed_entity(hass, mock_client):
+    """Test the series of a removed entity are removed."""
+    handler_method = await _setup(hass, {})
+
+    handler_method(make_event("fake.removed"))
+    assert not mock_client.remove.called
+
+    handler_method(
+        mock.MagicMock(data={"entity_id": "fake.removed", "new_state": None})
+    )
+    mock_client.remove.assert_called_once_with("fake.removed", None, "fake")
+
+    # Unknown entities have no series to remove
+    handler_method(mock.MagicMock(data={"entity_id": "fake.other", "new_state": None}))
+    assert mock_client.remove.call_count == 1
+
+
+def test_self_metrics_registered_once(hass):
+    """Test a second exporter reuses the metrics about the exporter."""
+    args = (
+        hass,
+        prometheus.prometheus_client,
+        None,
+        "test_self",
+        None,
+        None,
+        None,
+        None,
+    )
+    metrics = prometheus.PrometheusMetrics(*args)
+    other = prometheus.PrometheusMetrics(*args)
+    # pylint: disable=protected-access
+    assert other._scrape_duration is metrics._scrape_duration
+    assert other._series is metrics._series
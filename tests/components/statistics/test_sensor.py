@@ -1,12 +1,17 @@
 """The test for the statistics sensor platform."""
+from collections import deque
 from datetime import datetime, timedelta
+import random
 import statistics
 import unittest
 
 import pytest
 
 from homeassistant.components import recorder
-from homeassistant.components.statistics.sensor import StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    StatisticsSensor,
+    WindowStatistics,
+)
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, STATE_UNKNOWN, TEMP_CELSIUS
 from homeassistant.setup import setup_component
 from homeassistant.util import dt as dt_util
@@ -442,3 +447,41 @@ class TestStatisticsSensor(unittest.TestCase):
         assert mock_data["return_time"] == state.attributes.get("max_age") + timedelta(
             hours=1
         )
+
+
+def test_window_statistics():
+    """Test the incremental aggregates match the statistics module."""
+    rnd = random.Random(1234)
+    window = WindowStatistics()
+    values = deque()
+
+    for _ in range(500):
+        if values and rnd.random() < 0.4:
+            window.remove(values.popleft())
+        else:
+            value = round(rnd.uniform(-100, 1000), 1)
+            window.add(value)
+            values.append(value)
+
+        assert len(window) == len(values)
+        if not values:
+            continue
+
+        assert window.mean == pytest.approx(statistics.mean(values))
+        assert window.median == statistics.median(values)
+        assert window.total == pytest.approx(sum(values))
+        assert window.sorted[0] == min(values)
+        assert window.sorted[-1] == max(values)
+        if len(values) > 1:
+            assert window.variance == pytest.approx(statistics.variance(values))
+
+    window.reset([3.0, 1.0, 2.0, 4.0])
+    assert window.sorted == [1.0, 2.0, 3.0, 4.0]
+    assert window.median == 2.5
+    assert window.total == 10.0
+    assert window.variance == pytest.approx(statistics.variance([1, 2, 3, 4]))
+
+    for value in (3.0, 1.0, 2.0, 4.0):
+        window.remove(value)
+    assert len(window) == 0
+    assert window.total == 0.0
@@ -0,0 +1,11 @@
+"""Test fixtures for the stream component."""
+import pytest
+
+from tests.async_mock import patch
+
+
+@pytest.fixture
+def mock_stream_start():
+    """Do not start stream workers."""
+    with patch("homeassistant.components.stream.Stream.start"):
+        yield
@@ -1,10 +1,13 @@
 """The tests for hls streams."""
 from datetime import timedelta
+import io
 from urllib.parse import urlparse
 
 import pytest
 
 from homeassistant.components.stream import request_stream
+from homeassistant.components.stream.const import MAX_SEGMENTS
+from homeassistant.components.stream.worker import create_segment
 from homeassistant.const import HTTP_NOT_FOUND
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -122,3 +125,78 @@ async def test_stream_ended(hass):
 
     # Stop stream, if it hasn't quit already
     stream.stop()
+
+
+def _box(box_type, payload):
+    """Return an mp4 box."""
+    return (len(payload) + 8).to_bytes(4, "big") + box_type + payload
+
+
+def _fmp4(sequence):
+    """Return a fragmented mp4 with a media fragment for a sequence."""
+    return (
+        _box(b"ftyp", b"iso6")
+        + _box(b"moov", _box(b"trak", b"init"))
+        + _box(b"moof", sequence.to_bytes(4, "big"))
+        + _box(b"mdat", b"media")
+        + _box(b"mfra", b"")
+    )
+
+
+def test_create_segment():
+    """Test the init section and media fragment are located once."""
+    data = _fmp4(3)
+    segment = create_segment(3, io.BytesIO(data), 2)
+
+    assert segment.init == data[:32]
+    assert segment.m4s == data[32:-8]
+    assert segment.init_etag != segment.m4s_etag
+    assert create_segment(4, io.BytesIO(_fmp4(4)), 2).init_etag == segment.init_etag
+    # The buffer of the segment is released again
+    segment.segment.write(b"more")
+
+    # Not a fragmented mp4
+    segment = create_segment(1, io.BytesIO(_box(b"ftyp", b"iso6")), 2)
+    assert segment.init is None
+    assert segment.m4s is None
+    segment.segment.write(b"more")
+
+
+async def test_hls_fragments_cached(hass, hass_client, mock_stream_start):
+    """Test init and media fragments are served with cache headers."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+    url = request_stream(hass, "test_source")
+    track = hass.data["stream"]["streams"]["test_source"].outputs["hls"]
+    for sequence in range(1, MAX_SEGMENTS + 2):
+        track.put(create_segment(sequence, io.BytesIO(_fmp4(sequence)), 2))
+
+    # The oldest segment is not kept
+    assert track.get_segment(1) is None
+    assert track.get_segment(2).sequence == 2
+
+    http_client = await hass_client()
+    base_url = urlparse(url).path.rsplit("/", 1)[0]
+
+    init_response = await http_client.get(f"{base_url}/init.mp4")
+    assert init_response.status == 200
+    assert init_response.headers["Cache-Control"] == "no-cache"
+    assert await init_response.read() == _fmp4(2)[:32]
+
+    segment_response = await http_client.get(f"{base_url}/segment/2.m4s")
+    assert segment_response.status == 200
+    assert "immutable" in segment_response.headers["Cache-Control"]
+    assert await segment_response.read() == _fmp4(2)[32:-8]
+    etag = segment_response.headers["ETag"]
+
+    segment_response = await http_client.get(
+        f"{base_url}/segment/2.m4s", headers={"If-None-Match": etag}
+    )
+    assert segment_response.status == 304
+
+    segment_response = await http_client.get(
+        f"{base_url}/segment/3.m4s", headers={"If-None-Match": etag}
+    )
+    assert segment_response.status == 200
+
+    segment_response = await http_client.get(f"{base_url}/segment/1.m4s")
+    assert segment_response.status == HTTP_NOT_FOUND
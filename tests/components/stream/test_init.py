@@ -1,11 +1,14 @@
 """The tests for stream."""
 import pytest
 
+from homeassistant.components.stream import Stream
 from homeassistant.components.stream.const import (
     ATTR_STREAMS,
     CONF_LOOKBACK,
     CONF_STREAM_SOURCE,
     DOMAIN,
+    IMAGE_MAX_AGE,
+    IMAGE_REQUEST_TIMEOUT,
     SERVICE_RECORD,
 )
 from homeassistant.const import CONF_FILENAME
@@ -82,3 +85,43 @@ async def test_record_service_lookback(hass):
         assert stream_mock.called
         stream_mock.return_value.add_provider.assert_called_once_with("recorder")
         assert hls_mock.recv.called
+
+
+async def test_stream_image(hass):
+    """Test keyframe images are only decoded while they are requested."""
+    await async_setup_component(hass, "stream", {"stream": {"image_interval": 2}})
+    stream = Stream(hass, "rtsp://my.video")
+    assert stream.image_interval == 2
+
+    with patch("homeassistant.components.stream.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100
+        assert not stream.wants_image()
+
+        # First request starts decoding of keyframes
+        assert stream.get_image() is None
+        assert stream.wants_image()
+
+        stream.set_image(b"image")
+        assert stream.get_image() == b"image"
+        assert not stream.wants_image()
+
+        # Next keyframe is decoded after the image interval
+        mock_monotonic.return_value = 102
+        assert stream.wants_image()
+
+        # Old images are not served
+        mock_monotonic.return_value = 100 + IMAGE_MAX_AGE + 1
+        assert stream.get_image() is None
+
+        # Decoding stops when nobody requests images
+        mock_monotonic.return_value += IMAGE_REQUEST_TIMEOUT + 1
+        assert not stream.wants_image()
+
+
+async def test_stream_image_disabled(hass):
+    """Test keyframes are not decoded when the image interval is 0."""
+    await async_setup_component(hass, "stream", {"stream": {"image_interval": 0}})
+    stream = Stream(hass, "rtsp://my.video")
+
+    assert stream.get_image() is None
+    assert not stream.wants_image()
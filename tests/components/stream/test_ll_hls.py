@@ -0,0 +1,117 @@
+"""The tests for low latency hls streams."""
+import asyncio
+import io
+from urllib.parse import urlparse
+
+from homeassistant.components.stream import request_stream
+from homeassistant.components.stream.const import PART_TARGET_DURATION
+from homeassistant.components.stream.core import Part, StreamBuffer
+from homeassistant.components.stream.worker import create_segment, find_parts
+from homeassistant.const import HTTP_NOT_FOUND
+from homeassistant.setup import async_setup_component
+
+
+def _box(box_type, payload):
+    """Return an mp4 box."""
+    return (len(payload) + 8).to_bytes(4, "big") + box_type + payload
+
+
+def _fragment(payload):
+    """Return a moof and mdat pair."""
+    return _box(b"moof", b"") + _box(b"mdat", payload)
+
+
+INIT = _box(b"ftyp", b"iso6") + _box(b"moov", b"")
+
+
+def _segment(sequence, parts):
+    """Return a finished segment made of parts."""
+    data = INIT + b"".join(part.data for part in parts) + _box(b"mfra", b"")
+    return create_segment(sequence, io.BytesIO(data), 1.5, parts)
+
+
+def test_find_parts():
+    """Test complete fragments are found as parts while a segment is muxed."""
+    buffer = StreamBuffer(io.BytesIO(), None, None)
+    buffer.segment.write(INIT + _fragment(b"first"))
+    # The header of the next box is not complete yet
+    buffer.segment.write(b"\x00\x00")
+
+    parts = find_parts(buffer, 1, 0.5)
+    assert [(part.index, part.duration, part.independent) for part in parts] == [
+        (0, 0.5, True)
+    ]
+    assert parts[0].data == _fragment(b"first")
+    assert find_parts(buffer, 1, 0.6) == []
+
+    buffer.segment.seek(-2, io.SEEK_END)
+    buffer.segment.write(_fragment(b"second") + _fragment(b"third"))
+    parts = find_parts(buffer, 1, 1.5)
+    assert [(part.index, part.duration, part.independent) for part in parts] == [
+        (1, 0.5, False),
+        (2, 0.5, False),
+    ]
+    assert len(buffer.parts) == 3
+
+    # Parts never claim to be longer than the advertised part target
+    buffer.segment.write(_fragment(b"late"))
+    parts = find_parts(buffer, 1, 2.5)
+    assert [(part.index, part.duration) for part in parts] == [
+        (3, PART_TARGET_DURATION)
+    ]
+
+
+async def test_ll_hls_playlist(hass, hass_client, mock_stream_start):
+    """Test the playlist lists parts and blocks until they are available."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+    url = request_stream(hass, "test_source", fmt="ll_hls")
+    track = hass.data["stream"]["streams"]["test_source"].outputs["ll_hls"]
+    parts = [Part(1, idx, 0.5, idx == 0, _fragment(b"%d" % idx)) for idx in range(3)]
+    track.put(_segment(1, parts))
+    track.put_part(Part(2, 0, 0.5, True, _fragment(b"next")))
+
+    http_client = await hass_client()
+    path = urlparse(url).path
+    base_url = path.rsplit("/", 1)[0]
+
+    response = await http_client.get(path)
+    assert response.status == 200
+    playlist = await response.text()
+    assert "#EXT-X-PART-INF:PART-TARGET=0.500" in playlist
+    assert "#EXT-X-SERVER-CONTROL:CAN-BLOCK-RELOAD=YES" in playlist
+    assert '#EXT-X-PART:DURATION=0.500,URI="./segment/1.0.m4s",INDEPENDENT=YES' in (
+        playlist
+    )
+    assert '#EXT-X-PART:DURATION=0.500,URI="./segment/2.0.m4s"' in playlist
+    assert playlist.endswith('#EXT-X-PRELOAD-HINT:TYPE=PART,URI="./segment/2.1.m4s"\n')
+
+    response = await http_client.get(f"{base_url}/segment/1.2.m4s")
+    assert response.status == 200
+    assert await response.read() == _fragment(b"2")
+    response = await http_client.get(f"{base_url}/segment/1.m4s")
+    assert response.status == 200
+    assert await response.read() == b"".join(part.data for part in parts)
+
+    # Requests for the next part are held until it is muxed
+    blocked_playlist = asyncio.ensure_future(
+        http_client.get(path, params={"_HLS_msn": 2, "_HLS_part": 1})
+    )
+    blocked_part = asyncio.ensure_future(http_client.get(f"{base_url}/segment/2.1.m4s"))
+    await asyncio.sleep(0.1)
+    assert not blocked_playlist.done()
+    assert not blocked_part.done()
+
+    track.put_part(Part(2, 1, 0.5, False, _fragment(b"hint")))
+    response = await blocked_playlist
+    assert '#EXT-X-PRELOAD-HINT:TYPE=PART,URI="./segment/2.2.m4s"' in (
+        await response.text()
+    )
+    response = await blocked_part
+    assert await response.read() == _fragment(b"hint")
+
+    response = await http_client.get(path, params={"_HLS_msn": 5})
+    assert response.status == 400
+    response = await http_client.get(path, params={"_HLS_part": 1})
+    assert response.status == 400
+    response = await http_client.get(f"{base_url}/segment/1.5.m4s")
+    assert response.status == HTTP_NOT_FOUND
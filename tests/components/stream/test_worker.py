@@ -0,0 +1,61 @@
+"""The tests for the stream worker."""
+import threading
+
+import av
+
+from homeassistant.components.stream.worker import decode_keyframe, stream_worker
+
+from tests.async_mock import MagicMock
+from tests.components.stream.common import generate_h264_video
+
+
+def test_decode_keyframe():
+    """Test decoding a keyframe into a JPEG image."""
+    container = av.open(generate_h264_video())
+    video_stream = container.streams.video[0]
+    packet = next(
+        packet for packet in container.demux(video_stream) if packet.is_keyframe
+    )
+
+    image = decode_keyframe(video_stream, packet)
+    container.close()
+
+    assert image[:2] == b"\xff\xd8"
+    assert image[-2:] == b"\xff\xd9"
+
+
+def test_worker_images():
+    """Test the worker only decodes keyframes when the stream wants images."""
+    stream = MagicMock()
+    stream.source = generate_h264_video()
+    stream.options = {}
+    stream.outputs = {}
+    stream.wants_image.return_value = False
+
+    stream_worker(MagicMock(), stream, threading.Event())
+    assert not stream.set_image.called
+
+    stream.source = generate_h264_video()
+    stream.wants_image.return_value = True
+
+    stream_worker(MagicMock(), stream, threading.Event())
+    assert stream.set_image.called
+    assert stream.set_image.call_args[0][0][:2] == b"\xff\xd8"
+
+
+def test_worker_sequence_continues():
+    """Test the segment sequence continues when the worker is restarted."""
+    stream = MagicMock()
+    stream.source = generate_h264_video()
+    stream.options = {}
+    stream.outputs = {}
+    stream.wants_image.return_value = False
+    stream.sequence = 0
+
+    stream_worker(MagicMock(), stream, threading.Event())
+    segments = stream.sequence
+    assert segments > 0
+
+    stream.source = generate_h264_video()
+    stream_worker(MagicMock(), stream, threading.Event())
+    assert stream.sequence == 2 * segments
@@ -1,4 +1,7 @@
 """The tests for the TTS component."""
+from datetime import timedelta
+import os
+
 import pytest
 import yarl
 
@@ -15,9 +18,14 @@ from homeassistant.components.tts import _get_cache_files
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import HTTP_NOT_FOUND
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from tests.async_mock import PropertyMock, patch
-from tests.common import assert_setup_component, async_mock_service
+from tests.common import (
+    assert_setup_component,
+    async_fire_time_changed,
+    async_mock_service,
+)
 
 
 def relative_url(url):
@@ -680,3 +688,123 @@ async def test_setup_component_and_web_get_url_bad_config(hass, hass_client):
 
     req = await client.post(url, json=data)
     assert req.status == 400
+
+
+async def test_setup_component_load_cache_index(
+    hass, demo_provider, empty_cache_dir, mock_get_cache_files, hass_storage
+):
+    """Set up component from the cache index without listing the cache dir."""
+    _, demo_data = demo_provider.get_tts_audio("bla", "en")
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.mp3"
+    with open(empty_cache_dir / filename, "wb") as voice_file:
+        voice_file.write(demo_data)
+
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "key": tts.STORAGE_KEY,
+        "data": {
+            "cache_dir": str(empty_cache_dir),
+            "mtime": os.stat(empty_cache_dir).st_mtime_ns,
+            "files": {filename[:-4]: filename},
+        },
+    }
+    calls = async_mock_service(hass, DOMAIN_MP, SERVICE_PLAY_MEDIA)
+    config = {tts.DOMAIN: {"platform": "demo", "cache": True}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    assert not mock_get_cache_files.called
+
+    with patch(
+        "homeassistant.components.demo.tts.DemoProvider.get_tts_audio",
+        return_value=(None, None),
+    ):
+        await hass.services.async_call(
+            tts.DOMAIN,
+            "demo_say",
+            {
+                "entity_id": "media_player.something",
+                tts.ATTR_MESSAGE: "There is someone at the door.",
+            },
+            blocking=True,
+        )
+    assert len(calls) == 1
+
+    # New voice files are added to the index
+    await hass.services.async_call(
+        tts.DOMAIN,
+        "demo_say",
+        {"entity_id": "media_player.something", tts.ATTR_MESSAGE: "bla"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    # Not written before the index stayed the same for a while
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=tts.STORAGE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert hass_storage[tts.STORAGE_KEY]["data"]["files"] == {filename[:-4]: filename}
+
+    with patch(
+        "homeassistant.components.tts.timer",
+        return_value=tts.timer() + tts.STORAGE_SAVE_DELAY,
+    ):
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=tts.STORAGE_SAVE_DELAY)
+        )
+        await hass.async_block_till_done()
+
+    index = hass_storage[tts.STORAGE_KEY]["data"]
+    assert len(index["files"]) == 2
+    assert index["mtime"] == os.stat(empty_cache_dir).st_mtime_ns
+
+
+async def test_setup_component_stale_cache_index(
+    hass, empty_cache_dir, mock_get_cache_files, hass_storage
+):
+    """Set up component and list the cache dir when it changed."""
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "key": tts.STORAGE_KEY,
+        "data": {"cache_dir": str(empty_cache_dir), "mtime": 0, "files": {}},
+    }
+    config = {tts.DOMAIN: {"platform": "demo", "cache": True}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    assert mock_get_cache_files.called
+
+
+async def test_memory_cache_size(hass, empty_cache_dir, demo_provider):
+    """Test voices that are on disk are dropped from memory over budget."""
+    manager = tts.SpeechManager(hass)
+    await manager.async_init_cache(True, str(empty_cache_dir), 300, "", 1)
+    manager.async_register_engine("demo", demo_provider, {})
+    manager.memory_size = 1
+
+    def key(url):
+        return url.split("/")[-1][:-4]
+
+    url_one = await manager.async_get_url("demo", "one")
+    url_two = await manager.async_get_url("demo", "two")
+    await hass.async_block_till_done()
+
+    # Only the latest voice is kept in memory, others are served from disk
+    assert list(manager.mem_cache) == [key(url_two)]
+    assert await manager.async_get_tts_file(url_one.split("/")[-1]) == str(
+        empty_cache_dir / url_one.split("/")[-1]
+    )
+    assert await manager.async_get_tts_file(url_two.split("/")[-1]) is None
+
+    # Voices that are not on disk are not dropped
+    url_three = await manager.async_get_url("demo", "three", cache=False)
+    url_four = await manager.async_get_url("demo", "four", cache=False)
+    await hass.async_block_till_done()
+
+    assert list(manager.mem_cache) == [key(url_three), key(url_four)]
+    assert manager.mem_cache_size == sum(
+        len(entry[tts.MEM_CACHE_VOICE]) for entry in manager.mem_cache.values()
+    )
@@ -10,10 +10,17 @@ from homeassistant.components.websocket_api.auth import (
 from homeassistant.components.websocket_api.const import URL
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity
-from homeassistant.loader import async_get_integration
-from homeassistant.setup import async_setup_component
+from homeassistant.helpers import config_validation as cv, entity, script
+from homeassistant.loader import DATA_IMPORT_TIMES, async_get_integration
+from homeassistant.setup import (
+    DATA_SETUP_DEPENDENCIES,
+    DATA_SETUP_TIMELINE,
+    STARTUP_TRACE_FILENAME,
+    SetupPhase,
+    async_setup_component,
+)
 
+from tests.async_mock import patch
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
 
 
@@ -522,6 +529,133 @@ async def test_manifest_get(hass, websocket_client):
     assert msg["error"]["code"] == "not_found"
 
 
+async def test_integration_import_times(hass, websocket_client):
+    """Test getting the import times of integration modules."""
+    hass.data[DATA_IMPORT_TIMES] = {
+        "homeassistant.components.hue": 0.5,
+        "homeassistant.components.hue.light": 1.5,
+    }
+
+    await websocket_client.send_json({"id": 5, "type": "integration/import_times"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {"module": "homeassistant.components.hue.light", "seconds": 1.5},
+        {"module": "homeassistant.components.hue", "seconds": 0.5},
+    ]
+
+
+async def test_integration_setup_timeline(hass, websocket_client):
+    """Test getting the setup timeline of integrations."""
+    hass.data[DATA_SETUP_TIMELINE] = [
+        SetupPhase("http", "setup", None, 10.0, 10.5),
+        SetupPhase("websocket_api", "setup", None, 10.5, 11.0),
+    ]
+    hass.data[DATA_SETUP_DEPENDENCIES] = {"websocket_api": {"http"}}
+
+    await websocket_client.send_json({"id": 5, "type": "integration/setup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+    assert msg["result"]["timeline"] == [
+        {
+            "integration": "http",
+            "phase": "setup",
+            "detail": None,
+            "start": 0,
+            "duration": 0.5,
+        },
+        {
+            "integration": "websocket_api",
+            "phase": "setup",
+            "detail": None,
+            "start": 0.5,
+            "duration": 0.5,
+        },
+    ]
+    assert msg["result"]["critical_path"] == [
+        {"integration": "http", "start": 0, "end": 0.5},
+        {"integration": "websocket_api", "start": 0.5, "end": 1.0},
+    ]
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "integration/setup_timeline", "trace_events": True}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    events = [event for event in msg["result"]["traceEvents"] if event["ph"] == "X"]
+    assert [(event["cat"], event["ts"], event["dur"]) for event in events] == [
+        ("http", 0, 500000),
+        ("websocket_api", 500000, 500000),
+    ]
+
+    with patch("homeassistant.setup.save_json") as mock_save:
+        await websocket_client.send_json(
+            {"id": 7, "type": "integration/setup_timeline/export"}
+        )
+        msg = await websocket_client.receive_json()
+
+    assert msg["success"]
+    assert msg["result"] == {"path": hass.config.path(STARTUP_TRACE_FILENAME)}
+    assert mock_save.call_args[0][0] == msg["result"]["path"]
+    assert len(mock_save.call_args[0][1]["traceEvents"]) == 4
+
+
+async def test_script_traces(hass, websocket_client):
+    """Test tracing script runs."""
+    script_obj = script.Script(
+        hass, cv.SCRIPT_SCHEMA({"event": "test_event"}), "Test Name", "test_domain"
+    )
+
+    await websocket_client.send_json({"id": 5, "type": "script/trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"enabled": False}
+
+    await websocket_client.send_json({"id": 6, "type": "script/trace", "enabled": True})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"enabled": True}
+
+    await script_obj.async_run()
+    await hass.async_block_till_done()
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "script/traces", "domain": "test_domain"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    assert msg["result"][0]["name"] == "Test Name"
+    assert [step["action"] for step in msg["result"][0]["runs"][0]["steps"]] == [
+        "event"
+    ]
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "script/traces", "trace_events": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert [
+        event["name"] for event in msg["result"]["traceEvents"] if event["ph"] == "X"
+    ] == ["Test Name", "1 event"]
+
+    with patch("homeassistant.helpers.script.save_json") as mock_save:
+        await websocket_client.send_json({"id": 9, "type": "script/trace/export"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["success"]
+    assert msg["result"] == {"path": hass.config.path(script.TRACE_FILENAME)}
+    assert mock_save.call_args[0][0] == msg["result"]["path"]
+    assert len(mock_save.call_args[0][1]["traceEvents"]) == 3
+
+
 async def test_entity_source_admin(hass, websocket_client, hass_admin_user):
     """Check that we fetch sources correctly."""
     platform = MockEntityPlatform(hass)
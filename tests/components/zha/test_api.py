@@ -166,6 +166,7 @@ async def test_list_devices(zha_client):
         assert device[ATTR_NAME] is not None
         assert device[ATTR_QUIRK_APPLIED] is not None
         assert device["entities"] is not None
+        assert "initialization_time" in device
 
         for entity_reference in device["entities"]:
             assert entity_reference[ATTR_NAME] is not None
@@ -235,3 +235,69 @@ async def test_cleaning_up_storage(hass, zigpy_dev_basic, zha_dev_basic, hass_st
     await zha_gateway.zha_storage.async_save()
     await hass.async_block_till_done()
     assert not hass_storage["zha.storage"]["data"]["devices"]
+
+
+async def test_fetch_updated_state_mains(hass, coordinator, device_light_1):
+    """Test refreshing only available mains powered devices."""
+    zha_gateway = get_zha_gateway(hass)
+    zha_gateway.initialization_timings.clear()
+
+    with patch(
+        "homeassistant.components.zha.core.device.ZHADevice.async_initialize"
+    ) as mock_init:
+        await zha_gateway.async_fetch_updated_state_mains()
+
+    assert mock_init.call_count == 1
+    assert mock_init.call_args[1] == {"from_cache": False}
+    assert coordinator.ieee in zha_gateway.initialization_timings
+    assert device_light_1.ieee not in zha_gateway.initialization_timings
+    assert (
+        coordinator.zha_device_info["initialization_time"]
+        == zha_gateway.initialization_timings[coordinator.ieee]
+    )
+    assert device_light_1.zha_device_info["initialization_time"] is None
+
+    coordinator.available = False
+    with patch(
+        "homeassistant.components.zha.core.device.ZHADevice.async_initialize"
+    ) as mock_init:
+        await zha_gateway.async_fetch_updated_state_mains()
+
+    assert mock_init.call_count == 0
+
+
+async def test_shutdown_cancels_fetch_updated_state(hass, coordinator):
+    """Test shutting down cancels fetching the state of mains powered devices."""
+    zha_gateway = get_zha_gateway(hass)
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fetch_updated_state_mains():
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with patch(
+        "homeassistant.components.zha.core.device.ZHADevice.async_initialize"
+    ), patch.object(
+        zha_gateway, "async_fetch_updated_state_mains", fetch_updated_state_mains
+    ):
+        await zha_gateway.async_initialize_devices_and_entities()
+        await started.wait()
+
+    await zha_gateway.shutdown()
+    assert cancelled.is_set()
+
+
+async def test_entity_reference_index(hass, device_light_1):
+    """Test looking up entity references by entity id."""
+    zha_gateway = get_zha_gateway(hass)
+    entity_refs = zha_gateway.device_registry[device_light_1.ieee]
+    assert entity_refs
+
+    entity_ref = entity_refs[0]
+    assert zha_gateway.get_entity_reference(entity_ref.reference_id) is entity_ref
+    assert zha_gateway.get_entity_reference("light.does_not_exist") is None
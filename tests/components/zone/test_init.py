@@ -9,6 +9,8 @@ from homeassistant.const import (
     ATTR_FRIENDLY_NAME,
     ATTR_ICON,
     ATTR_NAME,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
 )
 from homeassistant.core import Context
@@ -502,3 +504,54 @@ async def test_unavailable_zone(hass):
     assert zone.async_active_zone(hass, 0.0, 0.01) is None
 
     assert zone.in_zone(hass.states.get("zone.bla"), 0, 0) is False
+
+
+async def test_active_zone_index(hass):
+    """Test the active zone follows zones added, moved and removed."""
+    assert await setup.async_setup_component(hass, DOMAIN, {"zone": {}})
+    hass.states.async_set(
+        "zone.work", "zoning", {"latitude": 32.88, "longitude": -117.23, "radius": 250}
+    )
+    hass.states.async_set(
+        "zone.far", "zoning", {"latitude": -32.88, "longitude": 117.23, "radius": 250}
+    )
+    await hass.async_block_till_done()
+
+    index = zone.async_get_index(hass)
+    assert index.grid.candidates(32.88, -117.23) == {"zone.work"}
+    assert zone.async_active_zone(hass, 32.88, -117.23).entity_id == "zone.work"
+
+    hass.states.async_set(
+        "zone.work", "zoning", {"latitude": 32.98, "longitude": -117.23, "radius": 250}
+    )
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 32.88, -117.23) is None
+    assert zone.async_active_zone(hass, 32.98, -117.23).entity_id == "zone.work"
+
+    hass.states.async_remove("zone.work")
+    await hass.async_block_till_done()
+    assert "zone.work" not in index.grid.items
+    assert zone.async_active_zone(hass, 32.98, -117.23) is None
+
+
+async def test_active_zone_without_index(hass):
+    """Test the active zone is found when zone is not set up."""
+    hass.states.async_set(
+        "zone.work", "zoning", {"latitude": 32.88, "longitude": -117.23, "radius": 250}
+    )
+
+    assert zone.async_get_index(hass) is None
+    assert zone.async_active_zone(hass, 32.88, -117.23).entity_id == "zone.work"
+
+
+async def test_index_removed_on_stop(hass):
+    """Test the index stops following the state machine on stop."""
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    assert await setup.async_setup_component(hass, DOMAIN, {"zone": {}})
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    assert zone.async_get_index(hass) is None
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
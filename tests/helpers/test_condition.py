@@ -4,7 +4,7 @@ from logging import ERROR
 import pytest
 
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import condition
+from homeassistant.helpers import condition, state as state_helper
 from homeassistant.util import dt
 
 from tests.async_mock import patch
@@ -659,3 +659,123 @@ async def test_condition_template_error(hass, caplog):
     assert caplog.records[0].message.startswith(
         "Error during template condition: UndefinedError:"
     )
+
+
+async def test_nested_conditions_checked_before_templates(hass):
+    """Test nested groups are flattened and templates are checked last."""
+    test = await condition.async_from_config(
+        hass,
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "template",
+                    "value_template": '{{ states.sensor.temperature.state == "100" }}',
+                },
+                {
+                    "condition": "and",
+                    "conditions": [
+                        {
+                            "condition": "state",
+                            "entity_id": "sensor.temperature",
+                            "state": "100",
+                        },
+                        {
+                            "condition": "not",
+                            "conditions": [
+                                {
+                                    "condition": "or",
+                                    "conditions": [
+                                        {
+                                            "condition": "state",
+                                            "entity_id": "sensor.mode",
+                                            "state": "away",
+                                        },
+                                        {
+                                            "condition": "state",
+                                            "entity_id": "sensor.mode",
+                                            "state": "night",
+                                        },
+                                    ],
+                                },
+                            ],
+                        },
+                    ],
+                },
+            ],
+        },
+    )
+
+    hass.states.async_set("sensor.temperature", 100)
+    hass.states.async_set("sensor.mode", "home")
+
+    with patch(
+        "homeassistant.helpers.template.Template.async_render", return_value="True"
+    ) as mock_render:
+        hass.states.async_set("sensor.temperature", 120)
+        assert not test(hass)
+        assert len(mock_render.mock_calls) == 0
+
+        hass.states.async_set("sensor.temperature", 100)
+        hass.states.async_set("sensor.mode", "night")
+        assert not test(hass)
+        assert len(mock_render.mock_calls) == 0
+
+        hass.states.async_set("sensor.mode", "home")
+        assert test(hass)
+        assert len(mock_render.mock_calls) == 1
+
+
+async def test_numeric_state_empty_range(hass, caplog):
+    """Test a numeric_state condition that can never be true."""
+    test = await condition.async_from_config(
+        hass,
+        {
+            "condition": "numeric_state",
+            "entity_id": "sensor.temperature",
+            "above": 50,
+            "below": 40,
+        },
+    )
+
+    assert "can never be true" in caplog.text
+
+    hass.states.async_set("sensor.temperature", 45)
+    assert not test(hass)
+
+
+async def test_numeric_state_shared_view(hass):
+    """Test the numeric value comes from the shared numeric view of the state."""
+    test = await condition.async_from_config(
+        hass,
+        {"condition": "numeric_state", "entity_id": "sensor.temperature", "below": 42},
+    )
+    test_attribute = await condition.async_from_config(
+        hass,
+        {
+            "condition": "numeric_state",
+            "entity_id": "sensor.temperature",
+            "attribute": "target",
+            "below": 42,
+        },
+    )
+
+    hass.states.async_set("sensor.temperature", 40, {"target": "41.5"})
+    assert test(hass)
+    assert test_attribute(hass)
+    numeric_states = hass.data[state_helper.DATA_NUMERIC_STATES]
+    assert numeric_states["sensor.temperature"][0] is hass.states.get(
+        "sensor.temperature"
+    )
+
+    hass.states.async_set("sensor.temperature", 45, {"target": 43})
+    assert not test(hass)
+    assert not test_attribute(hass)
+
+    with patch("homeassistant.helpers.condition._LOGGER.warning") as logwarn:
+        hass.states.async_set("sensor.temperature", "warm")
+        assert not test(hass)
+        assert len(logwarn.mock_calls) == 1
+
+    hass.states.async_remove("sensor.temperature")
+    assert not test(hass)
@@ -1593,3 +1593,251 @@ async def test_update_logger(hass, caplog):
     await hass.async_block_till_done()
 
     assert log_name in caplog.text
+
+
+async def test_trace(hass):
+    """Test the steps of traced runs are recorded."""
+    context = Context()
+    calls = async_mock_service(hass, "test", "script")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"service": "test.script", "data_template": {"value": "{{ 1 + 1 }}"}},
+            {"repeat": {"count": 2, "sequence": {"event": "test_event"}}},
+            {
+                "choose": {
+                    "conditions": {"condition": "template", "value_template": "true"},
+                    "sequence": {"delay": 0},
+                }
+            },
+            {"condition": "template", "value_template": "false"},
+            {"event": "not_fired"},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with patch("homeassistant.helpers.script.timer") as mock_timer:
+        await script_obj.async_run(context=context)
+        await hass.async_block_till_done()
+    assert not script_obj.traces
+    assert not mock_timer.called
+
+    script.async_set_trace_enabled(hass, True)
+    await script_obj.async_run(context=context)
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert len(script_obj.traces) == 1
+    trace = script_obj.traces[0].as_dict()
+    assert trace["context_id"] == context.id
+    assert trace["duration"] is not None
+    assert [(step["path"], step["action"]) for step in trace["steps"]] == [
+        ("1", "call_service"),
+        ("2", "repeat"),
+        ("2/iteration 1/1", "event"),
+        ("2/iteration 2/1", "event"),
+        ("3", "choose"),
+        ("3/choice 1/1", "delay"),
+        ("4", "condition"),
+    ]
+    for step in trace["steps"]:
+        assert 0 <= step["start"] <= step["end"] <= trace["duration"]
+
+    service_step = trace["steps"][0]
+    assert service_step["service"] == "test.script"
+    assert "template" in service_step
+    assert "service_latency" in service_step
+    assert "wait" in trace["steps"][5]
+    assert trace["steps"][6]["result"] is False
+
+    traces = script.async_get_traces(hass, domain="test_domain")
+    assert [(item["name"], len(item["runs"])) for item in traces] == [("Test Name", 1)]
+    assert script.async_get_traces(hass, domain="other_domain") == []
+
+    events = script.async_get_trace_events(hass)["traceEvents"]
+    assert [event["name"] for event in events if event["ph"] == "X"][:3] == [
+        "Test Name",
+        "1 call_service",
+        "2 repeat",
+    ]
+
+    script.async_set_trace_enabled(hass, False)
+    await script_obj.async_run(context=context)
+    await hass.async_block_till_done()
+    assert len(script_obj.traces) == 1
+
+
+async def test_trace_is_bounded(hass):
+    """Test only the last runs and a maximum of steps per run are kept."""
+    sequence = cv.SCRIPT_SCHEMA(
+        {"repeat": {"count": 4, "sequence": {"event": "test_event"}}}
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+    script.async_set_trace_enabled(hass, True)
+
+    with patch.object(script, "TRACE_MAX_STEPS", 3):
+        for _ in range(script.TRACE_MAX_RUNS + 1):
+            await script_obj.async_run()
+            await hass.async_block_till_done()
+
+    assert len(script_obj.traces) == script.TRACE_MAX_RUNS
+    trace = script_obj.traces[-1].as_dict()
+    assert len(trace["steps"]) == 3
+    assert trace["steps_dropped"] == 2
+
+
+async def test_trace_error(hass):
+    """Test the error of a failed step is recorded."""
+    sequence = cv.SCRIPT_SCHEMA({"service": "test.not_there"})
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+    script.async_set_trace_enabled(hass, True)
+
+    with pytest.raises(exceptions.ServiceNotFound):
+        await script_obj.async_run()
+
+    trace = script_obj.traces[0].as_dict()
+    assert trace["steps"][0]["error"] == "Unable to find service test/not_there"
+    assert trace["steps"][0]["end"] is not None
+
+
+def _register_slow_service(hass):
+    """Register a service that waits until it is told to finish."""
+    started = asyncio.Semaphore(0)
+    finish = asyncio.Event()
+    calls = []
+
+    async def async_slow_service(service):
+        calls.append(service.data["branch"])
+        started.release()
+        await finish.wait()
+
+    hass.services.async_register("test", "slow", async_slow_service)
+    return started, finish, calls
+
+
+@pytest.mark.parametrize("max_parallel", [None, 1])
+async def test_parallel(hass, max_parallel):
+    """Test the branches of a parallel action run concurrently."""
+    started, finish, calls = _register_slow_service(hass)
+    events = async_capture_events(hass, "test_event")
+    action = {
+        "parallel": [
+            {"service": "test.slow", "data": {"branch": 1}},
+            [
+                {"service": "test.slow", "data": {"branch": 2}},
+                {"event": "test_event", "event_data": {"branch": 2}},
+            ],
+        ]
+    }
+    if max_parallel:
+        action["max_parallel"] = max_parallel
+    sequence = cv.SCRIPT_SCHEMA([action, {"event": "test_event"}])
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    hass.async_create_task(script_obj.async_run())
+
+    if max_parallel is None:
+        await asyncio.wait_for(asyncio.gather(started.acquire(), started.acquire()), 1)
+        assert sorted(calls) == [1, 2]
+    else:
+        await asyncio.wait_for(started.acquire(), 1)
+        await asyncio.sleep(0)
+        assert calls == [1]
+
+    assert script_obj.is_running
+    finish.set()
+    await hass.async_block_till_done()
+
+    assert not script_obj.is_running
+    assert sorted(calls) == [1, 2]
+    assert [event.data.get("branch") for event in events] == [2, None]
+
+
+async def test_parallel_error(hass, caplog):
+    """Test a failing branch does not stop the others but stops the run."""
+    events = async_capture_events(hass, "test_event")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "parallel": [
+                    {"service": "test.not_there"},
+                    [{"delay": 0}, {"event": "test_event", "event_data": {"value": 1}}],
+                ]
+            },
+            {"event": "test_event", "event_data": {"value": 2}},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with pytest.raises(exceptions.ServiceNotFound):
+        await script_obj.async_run()
+    await hass.async_block_till_done()
+
+    assert [event.data["value"] for event in events] == [1]
+    assert "Parallel at step 1: branch 1: Error executing script" in caplog.text
+    assert not script_obj.is_running
+
+
+async def test_parallel_stop(hass):
+    """Test stopping a run cancels its running and waiting branches."""
+    events = async_capture_events(hass, "test_event")
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "parallel": [
+                [{"delay": 10, "alias": "delay 1"}, {"event": "test_event"}],
+                [{"delay": 10, "alias": "delay 2"}, {"event": "test_event"}],
+            ],
+            "max_parallel": 1,
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+    delay_started_flag = async_watch_for_action(script_obj, "delay")
+
+    hass.async_create_task(script_obj.async_run())
+    await asyncio.wait_for(delay_started_flag.wait(), 1)
+    assert script_obj.last_action == "delay 1"
+
+    await asyncio.wait_for(script_obj.async_stop(), 1)
+    await hass.async_block_till_done()
+
+    assert not script_obj.is_running
+    assert script_obj.last_action is None
+    assert len(events) == 0
+
+
+async def test_parallel_variables(hass):
+    """Test branches share the variables of the run but not their changes."""
+    events = async_capture_events(hass, "test_event")
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "parallel": [
+                {
+                    "repeat": {
+                        "count": 2,
+                        "sequence": {
+                            "event": "test_event",
+                            "event_data_template": {
+                                "value": "{{ value }}-{{ repeat.index }}"
+                            },
+                        },
+                    }
+                },
+                {
+                    "repeat": {
+                        "count": 1,
+                        "sequence": {
+                            "event": "test_event",
+                            "event_data_template": {
+                                "value": "{{ value }}-{{ repeat.index }}"
+                            },
+                        },
+                    }
+                },
+            ]
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    await script_obj.async_run(MappingProxyType({"value": "x"}))
+    await hass.async_block_till_done()
+
+    assert sorted(event.data["value"] for event in events) == ["x-1", "x-1", "x-2"]
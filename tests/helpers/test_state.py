@@ -6,6 +6,7 @@ import pytest
 
 from homeassistant.components.sun import STATE_ABOVE_HORIZON, STATE_BELOW_HORIZON
 from homeassistant.const import (
+    EVENT_STATE_CHANGED,
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
     STATE_CLOSED,
@@ -211,3 +212,82 @@ async def test_as_number_invalid_cases(hass):
     for _state in ("", "foo", "foo.bar", None, False, True, object, object()):
         with pytest.raises(ValueError):
             state.state_as_number(ha.State("domain.test", _state, {}))
+
+
+async def test_numeric_state(hass):
+    """Test the numeric view of states."""
+    numeric = state.numeric_state(
+        hass,
+        ha.State(
+            "sensor.test",
+            "21.5",
+            {
+                "unit_of_measurement": "°C",
+                "device_class": "temperature",
+                "battery_level": 80,
+                "on_battery": True,
+                "firmware": "1.2",
+            },
+        ),
+    )
+    assert numeric == state.NumericState(
+        21.5, True, "°C", "temperature", {"battery_level": 80.0, "on_battery": 1.0}
+    )
+
+    numeric = state.numeric_state(hass, ha.State("light.test", STATE_ON))
+    assert numeric.value == 1
+    assert not numeric.is_number
+
+    numeric = state.numeric_state(hass, ha.State("sensor.test", "foo"))
+    assert numeric.value is None
+    assert not numeric.is_number
+    assert numeric.unit is None
+    assert numeric.attributes == {}
+
+
+async def test_numeric_state_cached(hass):
+    """Test the numeric view is computed once per state object."""
+    test_state = ha.State("sensor.test", "1", {"foo": 2})
+    numeric = state.numeric_state(hass, test_state)
+    assert state.numeric_state(hass, test_state) is numeric
+
+    # An equal but new state object is projected again
+    assert (
+        state.numeric_state(hass, ha.State("sensor.test", "1", {"foo": 2}))
+        is not numeric
+    )
+    assert state.numeric_state(hass, ha.State("sensor.test", "3")).value == 3.0
+
+
+async def test_numeric_state_removed(hass):
+    """Test the numeric view of a removed entity is dropped."""
+    hass.states.async_set("sensor.test", "1")
+    numeric = state.numeric_state(hass, hass.states.get("sensor.test"))
+    await hass.async_block_till_done()
+    assert "sensor.test" in hass.data[state.DATA_NUMERIC_STATES]
+
+    hass.states.async_set("sensor.test", "2")
+    await hass.async_block_till_done()
+    assert "sensor.test" in hass.data[state.DATA_NUMERIC_STATES]
+
+    hass.states.async_remove("sensor.test")
+    await hass.async_block_till_done()
+    assert "sensor.test" not in hass.data[state.DATA_NUMERIC_STATES]
+    assert numeric.value == 1.0
+
+
+async def test_numeric_state_threads(hass):
+    """Test the numeric view is only set up once when used from threads."""
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    test_state = ha.State("sensor.test", "1")
+
+    results = await asyncio.gather(
+        *(
+            hass.async_add_executor_job(state.numeric_state, hass, test_state)
+            for _ in range(10)
+        )
+    )
+    await hass.async_block_till_done()
+
+    assert all(result.value == 1.0 for result in results)
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
@@ -17,7 +17,9 @@ from homeassistant.const import (
 )
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import template
+from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+import homeassistant.util.location as location_util
 from homeassistant.util.unit_system import UnitSystem
 
 from tests.async_mock import patch
@@ -1598,6 +1600,33 @@ def test_result_as_boolean(hass):
     template.result_as_boolean(None) is False
 
 
+async def test_closest_function_zone_index(hass):
+    """Test closest function only measures zones near the point if indexed."""
+    assert await async_setup_component(hass, "zone", {})
+    for idx in range(20):
+        hass.states.async_set(
+            f"zone.zone_{idx}",
+            "zoning",
+            {"latitude": 10.0 + idx, "longitude": 10.0 + idx, "radius": 100},
+        )
+    await hass.async_block_till_done()
+
+    tpl = template.Template("{{ closest(14.2, 14.2, states.zone).entity_id }}", hass)
+    with patch(
+        "homeassistant.helpers.location.loc_util.distance",
+        wraps=location_util.distance,
+    ) as mock_distance:
+        assert tpl.async_render() == "zone.zone_4"
+
+    assert mock_distance.call_count < 20
+
+    # Zones that are not indexed yet are all compared
+    hass.states.async_set(
+        "zone.zone_0", "zoning", {"latitude": 14.3, "longitude": 14.3, "radius": 100}
+    )
+    assert tpl.async_render() == "zone.zone_0"
+
+
 def test_closest_function_to_entity_id(hass):
     """Test closest function to entity id."""
     hass.states.async_set(
@@ -7,7 +7,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, runner, setup
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
@@ -374,7 +374,9 @@ async def test_setup_hass(
     with patch(
         "homeassistant.config.async_hass_config_yaml",
         return_value={"browser": {}, "frontend": {}},
-    ), patch.object(bootstrap, "LOG_SLOW_STARTUP_INTERVAL", 5000):
+    ), patch.object(bootstrap, "LOG_SLOW_STARTUP_INTERVAL", 5000), patch(
+        "homeassistant.setup.save_json"
+    ) as mock_save:
         hass = await bootstrap.async_setup_hass(
             runner.RuntimeConfig(
                 config_dir=get_test_config_dir(),
@@ -388,6 +390,7 @@ async def test_setup_hass(
         )
 
     assert "Waiting on integrations to complete setup" not in caplog.text
+    assert len(mock_save.mock_calls) == 0
 
     assert "browser" in hass.config.components
     assert "safe_mode" not in hass.config.components
@@ -405,6 +408,35 @@ async def test_setup_hass(
     assert len(mock_process_ha_config_upgrade.mock_calls) == 1
 
 
+async def test_setup_hass_startup_trace(
+    mock_enable_logging,
+    mock_is_virtual_env,
+    mock_mount_local_lib_path,
+    mock_ensure_config_exists,
+    mock_process_ha_config_upgrade,
+    loop,
+):
+    """Test the startup trace is written when requested."""
+    with patch(
+        "homeassistant.config.async_hass_config_yaml",
+        return_value={"browser": {}, "frontend": {}},
+    ), patch("homeassistant.setup.save_json") as mock_save:
+        hass = await bootstrap.async_setup_hass(
+            runner.RuntimeConfig(
+                config_dir=get_test_config_dir(), skip_pip=True, startup_trace=True,
+            ),
+        )
+
+    assert len(mock_save.mock_calls) == 1
+    path, trace = mock_save.mock_calls[0][1]
+    assert path == hass.config.path(setup.STARTUP_TRACE_FILENAME)
+    assert any(
+        event["cat"] == "browser"
+        for event in trace["traceEvents"]
+        if event["ph"] == "X"
+    )
+
+
 async def test_setup_hass_takes_longer_than_log_slow_startup(
     mock_enable_logging,
     mock_is_virtual_env,
@@ -446,6 +478,30 @@ async def test_setup_hass_takes_longer_than_log_slow_startup(
     assert "Waiting on integrations to complete setup" in caplog.text
 
 
+async def test_log_pending_setups_import_times(hass, caplog):
+    """Test the slowest imports of pending integrations are logged."""
+    hass.data[loader.DATA_IMPORT_TIMES] = {
+        "homeassistant.components.frontend": 2.5,
+        "homeassistant.components.http": 4.0,
+        "custom_components.test.light": 1.0,
+    }
+    setup_started = {"frontend": dt_util.utcnow(), "test": dt_util.utcnow()}
+
+    with patch.object(bootstrap, "LOG_SLOW_STARTUP_INTERVAL", 0.01):
+        task = asyncio.create_task(
+            bootstrap._async_log_pending_setups(
+                hass, {"frontend", "test", "http"}, setup_started
+            )
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+    assert (
+        "Slowest imports of pending integrations: "
+        "homeassistant.components.frontend (2.5s), custom_components.test.light (1.0s)"
+    ) in caplog.text
+
+
 async def test_setup_hass_invalid_yaml(
     mock_enable_logging,
     mock_is_virtual_env,
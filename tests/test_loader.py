@@ -142,6 +142,63 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_manifests(hass):
+    """Test resolving built-in integrations without reading the manifest."""
+    with patch("homeassistant.loader.Integration.resolve_from_root") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert not mock_resolve.called
+    assert integration.is_built_in
+    assert integration.manifest["name"] == "Philips Hue"
+    assert integration.file_path.name == "hue"
+
+
+async def test_import_times_recorded(hass):
+    """Test that import durations of integration modules are recorded."""
+    integration = await loader.async_get_integration(hass, "hue")
+    integration.get_component()
+    integration.get_platform("light")
+
+    import_times = loader.get_import_times(hass)
+    assert "homeassistant.components.hue" in import_times
+    assert "homeassistant.components.hue.light" in import_times
+
+
+async def test_preload_platforms(hass):
+    """Test that declared platforms are imported in the executor."""
+    # pylint: disable=protected-access
+    integration = await loader.async_get_integration(hass, "hue")
+    integration.manifest["preload_platforms"] = ["light", "sensor", "non_existing"]
+
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor:
+        await integration.async_preload_platforms()
+
+    imported = [
+        call[1][1]
+        for call in mock_executor.mock_calls
+        if call[1][0] is loader._timed_import_module
+    ]
+    assert imported == [
+        "homeassistant.components.hue.light",
+        "homeassistant.components.hue.sensor",
+        "homeassistant.components.hue.non_existing",
+    ]
+    cache = hass.data[loader.DATA_COMPONENTS]
+    assert cache["hue.light"] is hue_light
+    assert "hue.sensor" in cache
+    assert "hue.non_existing" not in cache
+    assert "homeassistant.components.hue.sensor" in loader.get_import_times(hass)
+
+    # Platforms that are already imported are skipped
+    with patch.object(hass, "async_add_executor_job") as mock_executor:
+        integration.manifest["preload_platforms"] = ["light"]
+        await integration.async_preload_platforms()
+
+    assert not mock_executor.called
+
+
 async def test_get_integration_legacy(hass):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
@@ -234,6 +291,46 @@ async def test_get_custom_components_internal(hass):
     assert integrations == {"test": ANY, "test_package": ANY}
 
 
+async def test_get_custom_components_cached_manifests(hass, hass_storage):
+    """Test that unchanged custom manifests are taken from the cache."""
+    # pylint: disable=protected-access
+    with patch.object(hass.loop, "call_later") as mock_call_later:
+        await loader._async_get_custom_components(hass)
+    await hass.async_block_till_done()
+    assert loader.CUSTOM_COMPONENTS_STORAGE_KEY not in hass_storage
+
+    delay, save = mock_call_later.call_args[0]
+    assert delay == loader.CUSTOM_COMPONENTS_SAVE_DELAY
+
+    # Run early, so not saved yet
+    with patch.object(hass.loop, "call_later") as mock_call_later:
+        save()
+    await hass.async_block_till_done()
+    assert loader.CUSTOM_COMPONENTS_STORAGE_KEY not in hass_storage
+    assert mock_call_later.call_args[0][1] is save
+
+    with patch(
+        "homeassistant.loader.timer",
+        return_value=loader.timer() + loader.CUSTOM_COMPONENTS_SAVE_DELAY,
+    ):
+        save()
+    await hass.async_block_till_done()
+    cache = hass_storage[loader.CUSTOM_COMPONENTS_STORAGE_KEY]["data"]
+    assert len(cache["manifests"]) == 2
+
+    with patch("pathlib.Path.read_text") as mock_read, patch(
+        "pathlib.Path.iterdir"
+    ) as mock_iterdir, patch.object(hass.loop, "call_later") as mock_call_later:
+        integrations = await loader._async_get_custom_components(hass)
+
+    assert not mock_read.called
+    assert not mock_iterdir.called
+    assert integrations == {"test": ANY, "test_package": ANY}
+    assert integrations["test_package"].name == "Test Package"
+    # Nothing changed, so the cache is not written again
+    assert not mock_call_later.called
+
+
 def _get_test_integration(hass, name, config_flow):
     """Return a generated test integration."""
     return loader.Integration(
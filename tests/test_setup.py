@@ -11,7 +11,7 @@ import voluptuous as vol
 from homeassistant import config_entries, setup
 import homeassistant.config as config_util
 from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_START
-from homeassistant.core import callback
+from homeassistant.core import CoreState, callback
 from homeassistant.helpers import discovery
 from homeassistant.helpers.config_validation import (
     PLATFORM_SCHEMA,
@@ -583,3 +583,68 @@ async def test_parallel_entry_setup(hass):
     await setup.async_setup_component(hass, "comp", {})
 
     assert calls == [1, 2, 1, 2]
+
+
+async def test_setup_preloads_platforms(hass):
+    """Test that declared platforms are preloaded before setup."""
+    mock_integration(
+        hass, MockModule("comp", partial_manifest={"preload_platforms": ["light"]})
+    )
+
+    with patch(
+        "homeassistant.loader.Integration.async_preload_platforms"
+    ) as mock_preload:
+        assert await setup.async_setup_component(hass, "comp", {})
+
+    assert len(mock_preload.mock_calls) == 1
+
+
+async def test_setup_timeline(hass):
+    """Test the setup phases and critical path are recorded during startup."""
+    hass.state = CoreState.not_running
+
+    async def async_setup_slow(hass, config):
+        """Mock a slow setup."""
+        await asyncio.sleep(0.01)
+        return True
+
+    mock_integration(hass, MockModule("comp_a", async_setup=async_setup_slow))
+    mock_integration(hass, MockModule("comp_b", ["comp_a"]))
+    mock_integration(hass, MockModule("comp_c"))
+    MockConfigEntry(domain="comp_b", title="Entry B").add_to_hass(hass)
+
+    assert await setup.async_setup_component(hass, "comp_c", {})
+    assert await setup.async_setup_component(hass, "comp_b", {})
+
+    timeline = setup.async_get_setup_timeline(hass)
+    phases = {(phase["integration"], phase["phase"]) for phase in timeline}
+    assert {
+        ("comp_a", "resolve"),
+        ("comp_a", "import"),
+        ("comp_a", "setup"),
+        ("comp_b", "setup"),
+        ("comp_b", "config_entry"),
+        ("comp_c", "setup"),
+    } <= phases
+    assert timeline[0]["start"] == 0
+
+    critical_path = setup.async_get_setup_critical_path(hass)
+    assert [step["integration"] for step in critical_path] == ["comp_a", "comp_b"]
+    assert critical_path[0]["end"] <= critical_path[1]["end"]
+
+    trace = setup.async_get_setup_trace_events(hass)
+    names = {
+        (event["cat"], event["name"])
+        for event in trace["traceEvents"]
+        if event["ph"] == "X"
+    }
+    assert ("comp_b", "config_entry Entry B") in names
+
+
+async def test_setup_timeline_not_recorded_when_running(hass):
+    """Test setup phases are not recorded after startup."""
+    mock_integration(hass, MockModule("comp"))
+    assert await setup.async_setup_component(hass, "comp", {})
+
+    assert setup.async_get_setup_timeline(hass) == []
+    assert setup.async_get_setup_critical_path(hass) == []
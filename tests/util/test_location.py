@@ -144,3 +144,55 @@ async def test_ip_api_query_raises(raising_session):
     """Test ip api query when the request to API fails."""
     info = await location_util._get_ip_api(raising_session)
     assert info is None
+
+
+def test_grid_index():
+    """Test adding, moving and removing items in the grid index."""
+    index = location_util.GridIndex()
+    index.add("paris", *COORDINATES_PARIS, 100)
+    index.add("new_york", *COORDINATES_NEW_YORK, 100)
+    assert len(index) == 2
+
+    assert index.candidates(*COORDINATES_PARIS) == {"paris"}
+
+    index.add("paris", *COORDINATES_NEW_YORK, 100)
+    assert index.candidates(*COORDINATES_PARIS) == set()
+    assert index.candidates(*COORDINATES_NEW_YORK) == {"paris", "new_york"}
+
+    index.remove("paris")
+    index.remove("paris")
+    assert len(index) == 1
+    assert index.candidates(*COORDINATES_NEW_YORK) == {"new_york"}
+
+
+def test_grid_index_large_items():
+    """Test items covering too many cells are compared with every query."""
+    index = location_util.GridIndex()
+    index.add("europe", *COORDINATES_PARIS, 1000000)
+    index.add("pole", 89.9, 0, 10)
+    index.add("paris", *COORDINATES_PARIS, 10)
+
+    assert index.candidates(*COORDINATES_NEW_YORK) == {"europe", "pole"}
+    assert index.candidates(*COORDINATES_PARIS) == {"europe", "pole", "paris"}
+    # Queries covering too many cells return every item
+    assert len(index.candidates(*COORDINATES_NEW_YORK, 1000000)) == 3
+
+    index.remove("europe")
+    index.remove("pole")
+    assert index.candidates(*COORDINATES_NEW_YORK) == set()
+
+
+def test_grid_index_nearest_candidates():
+    """Test the nearest item is among the candidates."""
+    index = location_util.GridIndex()
+    index.add("paris", *COORDINATES_PARIS, 10)
+    index.add("paris_north", COORDINATES_PARIS[0] + 0.2, COORDINATES_PARIS[1], 10)
+    index.add("new_york", *COORDINATES_NEW_YORK, 10)
+
+    assert index.nearest_candidates(*COORDINATES_PARIS) == {"paris"}
+    assert "new_york" in index.nearest_candidates(*COORDINATES_NEW_YORK)
+    assert "paris_north" in index.nearest_candidates(
+        COORDINATES_PARIS[0] + 0.15, COORDINATES_PARIS[1]
+    )
+    assert index.nearest_candidates(*COORDINATES_PARIS, ["new_york"]) == {"new_york"}
+    assert index.nearest_candidates(*COORDINATES_PARIS, ["unknown"]) == set()
@@ -461,3 +461,97 @@ def test_duplicate_key(caplog):
     with patch_yaml_files(files):
         load_yaml_config_file(YAML_CONFIG_FILE)
     assert "contains duplicate key" in caplog.text
+
+
+def _write_old_file(path, content):
+    """Write a file that was modified long enough ago to be cached."""
+    path.write_text(content)
+    mtime = os.stat(path).st_mtime - 10
+    os.utime(path, (mtime, mtime))
+
+
+def test_load_yaml_cache(tmp_path):
+    """Test parsed files are cached until their includes change."""
+    yaml.clear_document_cache()
+    config_file = tmp_path / "configuration.yaml"
+    _write_old_file(config_file, "key: !include included.yaml\nother: value\n")
+    _write_old_file(tmp_path / "included.yaml", "- one\n")
+
+    with patch.object(
+        yaml_loader, "_parse_yaml", wraps=yaml_loader._parse_yaml
+    ) as mock_parse:
+        doc = yaml.load_yaml(str(config_file))
+        assert mock_parse.call_count == 2
+
+        # Loaded documents can be changed without changing the cache
+        doc["key"].append("two")
+        doc = yaml.load_yaml(str(config_file))
+        assert mock_parse.call_count == 2
+        assert doc["key"] == ["one"]
+        assert doc["key"].__line__ == 0
+        assert doc["key"].__config_file__ == str(config_file)
+
+        # A changed include parses the files including it again
+        _write_old_file(tmp_path / "included.yaml", "- one\n- two\n")
+        doc = yaml.load_yaml(str(config_file))
+        assert mock_parse.call_count == 4
+        assert doc["key"] == ["one", "two"]
+
+
+def test_load_yaml_cache_include_dir(tmp_path):
+    """Test files added to included dirs are picked up."""
+    yaml.clear_document_cache()
+    config_file = tmp_path / "configuration.yaml"
+    _write_old_file(config_file, "key: !include_dir_merge_list packages\n")
+    packages = tmp_path / "packages"
+    packages.mkdir()
+    _write_old_file(packages / "one.yaml", "- one\n")
+    mtime = os.stat(packages).st_mtime - 10
+    os.utime(packages, (mtime, mtime))
+
+    assert yaml.load_yaml(str(config_file))["key"] == ["one"]
+
+    _write_old_file(packages / "two.yaml", "- two\n")
+    assert yaml.load_yaml(str(config_file))["key"] == ["one", "two"]
+
+
+def test_load_yaml_cache_not_cached(tmp_path):
+    """Test recently changed files and environment variables are not cached."""
+    yaml.clear_document_cache()
+    recent_file = tmp_path / "recent.yaml"
+    recent_file.write_text("key: value\n")
+    env_file = tmp_path / "env.yaml"
+    _write_old_file(env_file, "key: !env_var TEST_YAML_CACHE\n")
+
+    with patch.object(
+        yaml_loader, "_parse_yaml", wraps=yaml_loader._parse_yaml
+    ) as mock_parse, patch.dict(os.environ, {"TEST_YAML_CACHE": "first"}):
+        yaml.load_yaml(str(recent_file))
+        yaml.load_yaml(str(recent_file))
+        assert mock_parse.call_count == 2
+
+        assert yaml.load_yaml(str(env_file))["key"] == "first"
+        os.environ["TEST_YAML_CACHE"] = "second"
+        assert yaml.load_yaml(str(env_file))["key"] == "second"
+
+
+@pytest.mark.skipif(
+    yaml_loader.CSafeLineLoader is None, reason="libyaml is not available"
+)
+def test_c_loader_line_numbers():
+    """Test the libyaml loader keeps track of line numbers like the other."""
+    conf = "config:\n  key: value\n  list:\n    - item: one\n"
+    docs = []
+    for loader in (yaml_loader.SafeLineLoader, yaml_loader.CSafeLineLoader):
+        with io.StringIO(conf) as file:
+            file.name = "test.yaml"
+            docs.append(yaml_loader.yaml.load(file, Loader=loader))
+
+    python_doc, c_doc = docs
+    assert c_doc == python_doc
+    for path in (("config",), ("config", "list"), ("config", "list", 0)):
+        python_obj, c_obj = python_doc, c_doc
+        for key in path:
+            python_obj, c_obj = python_obj[key], c_obj[key]
+        assert c_obj.__line__ == python_obj.__line__
+        assert c_obj.__config_file__ == "test.yaml"